@@ -27,7 +27,11 @@ if not SKILL_DIR.exists():
 
 # Pre-load dependencies so test modules can resolve their fallback imports.
 load_module_from_path("event_schema", SKILL_DIR / "event_schema.py")
+load_module_from_path("metrics", SKILL_DIR / "metrics.py")
 load_module_from_path("universal", SKILL_DIR / "providers" / "universal.py")
+load_module_from_path("change_notifier", SKILL_DIR / "storage" / "change_notifier.py")
+load_module_from_path("cursors", SKILL_DIR / "storage" / "cursors.py")
+load_module_from_path("mmap_reader", SKILL_DIR / "storage" / "mmap_reader.py")
 load_module_from_path("jsonl_handler", SKILL_DIR / "storage" / "jsonl_handler.py")
 
 test_event_capture = load_module_from_path(
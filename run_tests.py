@@ -25,31 +25,104 @@ tests_dir = os.path.join(skill_dir, 'tests')
 # Load event_schema
 event_schema_path = os.path.join(skill_dir, 'event_schema.py')
 event_schema = load_module_from_path('event_schema', event_schema_path)
+locking_path = os.path.join(skill_dir, 'locking.py')
+locking = load_module_from_path('locking', locking_path)
+metrics_path = os.path.join(skill_dir, 'metrics.py')
+metrics = load_module_from_path('metrics', metrics_path)
 
 # Load providers
 providers_dir = os.path.join(skill_dir, 'providers')
 universal_path = os.path.join(providers_dir, 'universal.py')
 universal = load_module_from_path('universal', universal_path)
+sampling_path = os.path.join(providers_dir, 'sampling.py')
+sampling = load_module_from_path('sampling', sampling_path)
+diagnostic_diff_path = os.path.join(providers_dir, 'diagnostic_diff.py')
+diagnostic_diff = load_module_from_path('diagnostic_diff', diagnostic_diff_path)
+registry_path = os.path.join(providers_dir, 'registry.py')
+registry = load_module_from_path('registry', registry_path)
+facade_path = os.path.join(providers_dir, 'facade.py')
+facade = load_module_from_path('facade', facade_path)
 
 # Load storage
 storage_dir = os.path.join(skill_dir, 'storage')
+change_notifier_path = os.path.join(storage_dir, 'change_notifier.py')
+change_notifier = load_module_from_path('change_notifier', change_notifier_path)
+cursors_path = os.path.join(storage_dir, 'cursors.py')
+cursors = load_module_from_path('cursors', cursors_path)
+mmap_reader_path = os.path.join(storage_dir, 'mmap_reader.py')
+mmap_reader = load_module_from_path('mmap_reader', mmap_reader_path)
 jsonl_handler_path = os.path.join(storage_dir, 'jsonl_handler.py')
 jsonl_handler = load_module_from_path('jsonl_handler', jsonl_handler_path)
+sqlite_handler_path = os.path.join(storage_dir, 'sqlite_handler.py')
+sqlite_handler = load_module_from_path('sqlite_handler', sqlite_handler_path)
+rollup_path = os.path.join(storage_dir, 'rollup.py')
+rollup = load_module_from_path('rollup', rollup_path)
+federation_path = os.path.join(storage_dir, 'federation.py')
+federation = load_module_from_path('federation', federation_path)
+async_jsonl_path = os.path.join(storage_dir, 'async_jsonl.py')
+async_jsonl = load_module_from_path('async_jsonl', async_jsonl_path)
+parallel_scan_path = os.path.join(storage_dir, 'parallel_scan.py')
+parallel_scan = load_module_from_path('parallel_scan', parallel_scan_path)
+command_index_path = os.path.join(storage_dir, 'command_index.py')
+command_index = load_module_from_path('command_index', command_index_path)
+skill_spans_path = os.path.join(storage_dir, 'skill_spans.py')
+skill_spans = load_module_from_path('skill_spans', skill_spans_path)
+otlp_exporter_path = os.path.join(storage_dir, 'otlp_exporter.py')
+otlp_exporter = load_module_from_path('otlp_exporter', otlp_exporter_path)
 
 # Load test modules
 test_event_capture_path = os.path.join(tests_dir, 'test_event_capture.py')
 test_storage_path = os.path.join(tests_dir, 'test_storage.py')
+test_mmap_reader_path = os.path.join(tests_dir, 'test_mmap_reader.py')
+test_sqlite_storage_path = os.path.join(tests_dir, 'test_sqlite_storage.py')
+test_rollup_path = os.path.join(tests_dir, 'test_rollup.py')
+test_sampling_path = os.path.join(tests_dir, 'test_sampling.py')
+test_registry_path = os.path.join(tests_dir, 'test_registry.py')
+test_federation_path = os.path.join(tests_dir, 'test_federation.py')
+test_metrics_path = os.path.join(tests_dir, 'test_metrics.py')
+test_otlp_exporter_path = os.path.join(tests_dir, 'test_otlp_exporter.py')
+test_diagnostic_diff_path = os.path.join(tests_dir, 'test_diagnostic_diff.py')
+test_skill_spans_path = os.path.join(tests_dir, 'test_skill_spans.py')
+test_command_index_path = os.path.join(tests_dir, 'test_command_index.py')
+test_async_jsonl_path = os.path.join(tests_dir, 'test_async_jsonl.py')
+test_parallel_scan_path = os.path.join(tests_dir, 'test_parallel_scan.py')
 
 test_event_capture = load_module_from_path('test_event_capture', test_event_capture_path)
 test_storage = load_module_from_path('test_storage', test_storage_path)
+test_mmap_reader = load_module_from_path('test_mmap_reader', test_mmap_reader_path)
+test_sqlite_storage = load_module_from_path('test_sqlite_storage', test_sqlite_storage_path)
+test_rollup = load_module_from_path('test_rollup', test_rollup_path)
+test_sampling = load_module_from_path('test_sampling', test_sampling_path)
+test_registry = load_module_from_path('test_registry', test_registry_path)
+test_federation = load_module_from_path('test_federation', test_federation_path)
+test_metrics = load_module_from_path('test_metrics', test_metrics_path)
+test_otlp_exporter = load_module_from_path('test_otlp_exporter', test_otlp_exporter_path)
+test_diagnostic_diff = load_module_from_path('test_diagnostic_diff', test_diagnostic_diff_path)
+test_skill_spans = load_module_from_path('test_skill_spans', test_skill_spans_path)
+test_command_index = load_module_from_path('test_command_index', test_command_index_path)
+test_async_jsonl = load_module_from_path('test_async_jsonl', test_async_jsonl_path)
+test_parallel_scan = load_module_from_path('test_parallel_scan', test_parallel_scan_path)
 
 if __name__ == '__main__':
     loader = unittest.TestLoader()
     suite = unittest.TestSuite()
     
-    # Add all tests from both modules
+    # Add all tests from the test modules
     suite.addTests(loader.loadTestsFromModule(test_event_capture))
     suite.addTests(loader.loadTestsFromModule(test_storage))
+    suite.addTests(loader.loadTestsFromModule(test_mmap_reader))
+    suite.addTests(loader.loadTestsFromModule(test_sqlite_storage))
+    suite.addTests(loader.loadTestsFromModule(test_rollup))
+    suite.addTests(loader.loadTestsFromModule(test_sampling))
+    suite.addTests(loader.loadTestsFromModule(test_registry))
+    suite.addTests(loader.loadTestsFromModule(test_federation))
+    suite.addTests(loader.loadTestsFromModule(test_metrics))
+    suite.addTests(loader.loadTestsFromModule(test_otlp_exporter))
+    suite.addTests(loader.loadTestsFromModule(test_diagnostic_diff))
+    suite.addTests(loader.loadTestsFromModule(test_skill_spans))
+    suite.addTests(loader.loadTestsFromModule(test_command_index))
+    suite.addTests(loader.loadTestsFromModule(test_async_jsonl))
+    suite.addTests(loader.loadTestsFromModule(test_parallel_scan))
     
     # Run with verbose output
     runner = unittest.TextTestRunner(verbosity=2)
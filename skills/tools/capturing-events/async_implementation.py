@@ -0,0 +1,211 @@
+"""Asyncio front end for the capture-events skill.
+
+Kept out of ``implementation`` so CLI captures do not import asyncio.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, List, Optional
+
+from event_schema import Event
+from implementation import CaptureEventsSkill
+from providers.sampling import SamplingPolicy
+from storage.async_jsonl import AsyncJSONLStorage
+from storage.jsonl_handler import JSONLStorage
+
+
+class AsyncCaptureEventsSkill:
+    """Capture-events skill for code running on an asyncio event loop.
+
+    Events are built and sampled on the loop exactly as in
+    ``CaptureEventsSkill`` (in-memory work only); storage goes through
+    ``AsyncJSONLStorage``, which batches appends and performs all file I/O on
+    a dedicated executor, so awaiting a capture never blocks the loop.
+    Use as ``async with AsyncCaptureEventsSkill() as skill:`` or call
+    ``aclose`` to write queued events before the loop stops.
+    """
+
+    def __init__(
+        self,
+        storage_path: Optional[str] = None,
+        provider: Optional[str] = None,
+        sampling: Optional[SamplingPolicy] = None,
+        metrics=None,
+        batch_size: int = AsyncJSONLStorage.DEFAULT_BATCH_SIZE,
+        flush_interval: float = AsyncJSONLStorage.DEFAULT_FLUSH_INTERVAL,
+        executor=None,
+    ):
+        """
+        Initialize async capture-events skill.
+
+        Args:
+            storage_path: Path to episodes.jsonl (auto-detect if None)
+            provider: Provider name or None to auto-detect
+            sampling: Sampling policy (see ``CaptureEventsSkill``)
+            metrics: CaptureMetrics sink (see ``CaptureEventsSkill``)
+            batch_size: Queued appends that trigger an immediate write
+            flush_interval: Seconds a partial batch may wait for more appends
+            executor: Executor for file I/O (default: a private thread pool)
+
+        Raises:
+            ValueError: If storage_path selects the SQLite backend
+        """
+        self.sync = CaptureEventsSkill(storage_path, provider, sampling, metrics)
+        if not isinstance(self.sync.storage, JSONLStorage):
+            raise ValueError("AsyncCaptureEventsSkill requires JSONL storage")
+
+        self.storage_path = self.sync.storage_path
+        self.facade = self.sync.facade
+        self.metrics = self.sync.metrics
+        self.storage = AsyncJSONLStorage(
+            self.storage_path,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            executor=executor,
+            epoch_timestamps=self.sync.storage.epoch_timestamps,
+            metrics=self.metrics,
+        )
+
+    async def __aenter__(self) -> "AsyncCaptureEventsSkill":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def _store(self, event) -> bool:
+        """Queue an admitted event plus released samples and await their writes."""
+        futures = []
+        if event is not None:
+            futures.append(self.storage.submit(event))
+        else:
+            self.metrics.incr("events_sampled_out")
+        futures.extend(self.storage.submit(sampled) for sampled in self.facade.drain_samples())
+        if futures:
+            await asyncio.gather(*futures)
+        if self.metrics.enabled:
+            await self.storage.run(self.metrics.maybe_dump)
+        return event is not None
+
+    async def capture_file(self, event_type: str, filepath: str) -> dict:
+        """Capture file event and store (see ``CaptureEventsSkill.capture_file``)."""
+        try:
+            full_event_type = f"file_{event_type}"
+            event = self.facade.capture_file_event(full_event_type, filepath)
+            stored = await self._store(event)
+            return {
+                "success": True,
+                "event_type": full_event_type,
+                "filepath": filepath,
+                "stored": stored,
+            }
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    async def capture_terminal(
+        self,
+        command: str,
+        output: str = "",
+        error: str = "",
+        exit_code: Optional[int] = None,
+        duration_ms: Optional[float] = None,
+    ) -> dict:
+        """Capture terminal event and store (see ``CaptureEventsSkill.capture_terminal``)."""
+        try:
+            event = self.facade.capture_terminal_event(
+                "terminal_execute", command, output, error, exit_code, duration_ms
+            )
+            stored = await self._store(event)
+            return {
+                "success": True,
+                "event_type": "terminal_execute",
+                "command": command,
+                "stored": stored,
+            }
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    async def capture_diagnostic(
+        self, filepath: str, line: int, message: str, severity: str = "error"
+    ) -> dict:
+        """Capture diagnostic event and store (see ``CaptureEventsSkill.capture_diagnostic``)."""
+        try:
+            event_type = f"diagnostic_{severity}"
+            event = self.facade.capture_diagnostic_event(event_type, filepath, line, message)
+            stored = await self._store(event)
+            return {
+                "success": True,
+                "event_type": event_type,
+                "filepath": filepath,
+                "line": line,
+                "stored": stored,
+            }
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    async def capture_skill(
+        self, skill_name: str, event_type: str, status: str, span_id: Optional[str] = None
+    ) -> dict:
+        """Capture skill event and store (see ``CaptureEventsSkill.capture_skill``)."""
+        try:
+            full_event_type = f"skill_{event_type}"
+            event = self.facade.capture_skill_event(full_event_type, skill_name, status, span_id)
+            stored = await self._store(event)
+            return {
+                "success": True,
+                "event_type": full_event_type,
+                "skill_name": skill_name,
+                "status": status,
+                "span_id": event.metadata.get("span_id") if event is not None else span_id,
+                "stored": stored,
+            }
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    async def flush(self) -> dict:
+        """
+        Store events held by sampling windows and write every queued append.
+
+        Returns:
+            Result dict with the number of sampled events released
+        """
+        try:
+            events = self.facade.flush_samples()
+            for event in events:
+                self.storage.submit(event)
+            await self.storage.flush()
+            return {"success": True, "flushed": len(events)}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    async def aclose(self) -> None:
+        """Flush everything and release the storage executor."""
+        await self.flush()
+        await self.storage.aclose()
+
+    async def read_since(self, since_timestamp: str) -> List[Event]:
+        """Read events at or after a timestamp, in parallel chunks for large logs."""
+        scanner = self.sync.parallel_scanner()
+        if scanner is None:
+            return await self.storage.read_since(since_timestamp)
+        await self.storage.flush()
+        return await self.storage.run(scanner.read_since, since_timestamp)
+
+    async def read_by_type(self, event_type: str) -> List[Event]:
+        """Read events of one type, in parallel chunks for large logs."""
+        scanner = self.sync.parallel_scanner()
+        if scanner is None:
+            return await self.storage.read_by_type(event_type)
+        await self.storage.flush()
+        return await self.storage.run(scanner.read_by_type, event_type)
+
+    def iter_events(self, **filters: Any) -> AsyncIterator[Event]:
+        """
+        Stream stored events without blocking the loop.
+
+        Args:
+            **filters: Filters accepted by ``JSONLStorage.iter_events`` plus
+                ``chunk_size``
+
+        Returns:
+            Async iterator of Event instances
+        """
+        return self.storage.iter_events(**filters)
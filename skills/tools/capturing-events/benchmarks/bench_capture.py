@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""Throughput and latency benchmarks for the capture-events skill.
+
+Measures append latency percentiles and events/sec for each
+``CaptureEventsSkill.capture_*`` method, read/scan throughput, TTL cleanup
+time and peak Python memory across episode file sizes. Results are printed
+(or written) as a single JSON document so runs can be diffed for regression
+tracking.
+
+Usage:
+    python benchmarks/bench_capture.py
+    python benchmarks/bench_capture.py --sizes 10000,1000000,10000000 --output bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SKILL_DIR))
+
+from event_schema import Event, EventDecoder, EventType  # noqa: E402
+from implementation import CaptureEventsSkill  # noqa: E402
+from storage.jsonl_handler import JSONLStorage, TTLCleaner  # noqa: E402
+from storage.mmap_reader import MmapReader, field_prefilter  # noqa: E402
+
+DEFAULT_SIZES = "10000,100000"
+DEFAULT_CAPTURE_EVENTS = 2000
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of pre-sorted values.
+
+    Args:
+        sorted_values: Values in ascending order
+        pct: Percentile in [0, 100]
+
+    Returns:
+        Percentile value (0.0 for empty input)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize_latencies(latencies: List[float]) -> Dict[str, float]:
+    """
+    Summarize per-call latencies in microseconds.
+
+    Args:
+        latencies: Per-call durations in seconds
+
+    Returns:
+        Dict with count, events_per_sec and p50/p90/p99/max latency (us)
+    """
+    values = sorted(latencies)
+    total = sum(values)
+    return {
+        "count": len(values),
+        "events_per_sec": round(len(values) / total, 1) if total else 0.0,
+        "p50_us": round(percentile(values, 50) * 1e6, 2),
+        "p90_us": round(percentile(values, 90) * 1e6, 2),
+        "p99_us": round(percentile(values, 99) * 1e6, 2),
+        "max_us": round(values[-1] * 1e6, 2) if values else 0.0,
+    }
+
+
+def bench_capture(workdir: Path, count: int) -> Dict[str, Dict[str, float]]:
+    """
+    Measure append latency for every capture_* method.
+
+    Args:
+        workdir: Scratch directory
+        count: Calls per method
+
+    Returns:
+        Latency summary per method
+    """
+    calls: Dict[str, Callable[[CaptureEventsSkill, int], dict]] = {
+        "capture_file": lambda s, i: s.capture_file("modify", f"src/module_{i % 100}.py"),
+        "capture_terminal": lambda s, i: s.capture_terminal(
+            f"pytest tests/test_{i % 20}.py", output="ok", error=""
+        ),
+        "capture_diagnostic": lambda s, i: s.capture_diagnostic(
+            f"src/module_{i % 100}.py", i % 500, "Undefined variable 'x'", "error"
+        ),
+        "capture_skill": lambda s, i: s.capture_skill("creating-skill", "invoke", "started"),
+    }
+
+    results = {}
+    for name, call in calls.items():
+        skill = CaptureEventsSkill(str(workdir / f"{name}.jsonl"), provider="universal")
+        latencies = []
+        for i in range(count):
+            start = time.perf_counter()
+            result = call(skill, i)
+            latencies.append(time.perf_counter() - start)
+            if not result.get("success"):
+                raise RuntimeError(f"{name} failed: {result.get('error')}")
+        results[name] = summarize_latencies(latencies)
+
+    return results
+
+
+def generate_episodes(path: Path, size: int, old_fraction: float = 0.5) -> int:
+    """
+    Write a synthetic episodes.jsonl with a realistic event mix.
+
+    Args:
+        path: Destination file
+        size: Number of events
+        old_fraction: Fraction of events older than the default TTL
+
+    Returns:
+        File size in bytes
+    """
+    now = datetime.utcnow()
+    old_cutoff = int(size * old_fraction)
+    kinds = [
+        (EventType.FILE_MODIFY, lambda i: {"filepath": f"src/module_{i % 100}.py"}),
+        (EventType.TERMINAL_EXECUTE, lambda i: {"command": "npm test", "output": "", "error": ""}),
+        (EventType.DIAGNOSTIC_ERROR, lambda i: {
+            "filepath": f"src/module_{i % 100}.py", "line": i % 500,
+            "message": "Undefined variable", "severity": "error",
+        }),
+        (EventType.SKILL_INVOKE, lambda i: {"skill_name": "creating-skill", "status": "started"}),
+    ]
+
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(size):
+            age = timedelta(days=10) if i < old_cutoff else timedelta(0)
+            timestamp = (now - age + timedelta(microseconds=i)).isoformat()
+            # Skew the mix so diagnostics are ~5% of lines, like real logs.
+            kind = 2 if i % 20 == 0 else (0, 1, 3)[i % 3]
+            event_type, metadata = kinds[kind]
+            f.write(Event(event_type, "universal", metadata(i), timestamp).to_json() + "\n")
+
+    return path.stat().st_size
+
+
+def timed(func: Callable[[], object]) -> Dict[str, float]:
+    """Run func once and report wall time."""
+    start = time.perf_counter()
+    func()
+    return {"seconds": round(time.perf_counter() - start, 4)}
+
+
+def peak_memory(func: Callable[[], object]) -> int:
+    """Run func under tracemalloc and report peak traced bytes."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_file_size(workdir: Path, size: int, measure_memory: bool) -> Dict[str, object]:
+    """
+    Measure read, scan and cleanup costs for one episode file size.
+
+    Args:
+        workdir: Scratch directory
+        size: Number of events in the file
+        measure_memory: If True, also record tracemalloc peaks
+
+    Returns:
+        Result dict for this size
+    """
+    path = workdir / f"episodes-{size}.jsonl"
+    file_bytes = generate_episodes(path, size)
+    storage = JSONLStorage(str(path))
+    reader = MmapReader(str(path))
+    diagnostic_filter = field_prefilter("event_type", "diagnostic_error")
+
+    operations: Dict[str, Callable[[], object]] = {
+        "read_all": storage.read_all,
+        "read_by_type": lambda: storage.read_by_type("diagnostic_error"),
+        "count": storage.count,
+        "mmap_scan_all": lambda: sum(1 for _ in reader.iter_events()),
+        "mmap_scan_prefiltered": lambda: sum(1 for _ in reader.iter_events(diagnostic_filter)),
+    }
+
+    results: Dict[str, object] = {"events": size, "file_bytes": file_bytes}
+    for name, op in operations.items():
+        timing = timed(op)
+        seconds = timing["seconds"] or 1e-9
+        timing["events_per_sec"] = round(size / seconds, 1)
+        timing["mb_per_sec"] = round(file_bytes / seconds / 1e6, 2)
+        if measure_memory:
+            timing["peak_bytes"] = peak_memory(op)
+        results[name] = timing
+
+    cleaner = TTLCleaner(str(path))
+    results["ttl_cleanup_dry_run"] = timed(lambda: cleaner.cleanup(dry_run=True))
+    results["ttl_cleanup"] = timed(cleaner.cleanup)
+    path.unlink()
+
+    return results
+
+
+def bench_bulk_decode(workdir: Path, size: int) -> Dict[str, object]:
+    """
+    Compare naive per-line decoding with the interning bulk decoder.
+
+    Both variants keep every decoded event alive, as ``read_all`` does, so
+    the tracemalloc peak reflects the memory a caller actually holds.
+
+    Args:
+        workdir: Scratch directory
+        size: Number of events in the file
+
+    Returns:
+        Timings, peaks and relative savings
+    """
+    path = workdir / f"decode-{size}.jsonl"
+    generate_episodes(path, size)
+
+    def naive() -> List[Event]:
+        with open(path, "r", encoding="utf-8") as f:
+            return [Event.from_json(line) for line in f if line.strip()]
+
+    def bulk() -> List[Event]:
+        with open(path, "r", encoding="utf-8") as f:
+            return list(EventDecoder().decode_lines(f))
+
+    results: Dict[str, object] = {"events": size}
+    for name, op in (("per_line", naive), ("bulk_interned", bulk)):
+        timing = timed(op)
+        timing["peak_bytes"] = peak_memory(op)
+        results[name] = timing
+
+    baseline, optimized = results["per_line"], results["bulk_interned"]
+    results["time_saved_pct"] = round(
+        100.0 * (1 - optimized["seconds"] / (baseline["seconds"] or 1e-9)), 1
+    )
+    results["memory_saved_pct"] = round(
+        100.0 * (1 - optimized["peak_bytes"] / (baseline["peak_bytes"] or 1)), 1
+    )
+    path.unlink()
+    return results
+
+
+def run(sizes: List[int], capture_events: int, measure_memory: bool) -> Dict[str, object]:
+    """
+    Run the full benchmark suite.
+
+    Args:
+        sizes: Episode file sizes (events) to benchmark
+        capture_events: Calls per capture_* method
+        measure_memory: If True, record tracemalloc peaks (slower)
+
+    Returns:
+        JSON-serializable results document
+    """
+    with tempfile.TemporaryDirectory(prefix="pax-bench-") as tmp:
+        workdir = Path(tmp)
+        return {
+            "benchmark": "capturing-events",
+            "timestamp": datetime.utcnow().isoformat(),
+            "environment": {
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+            },
+            "capture": bench_capture(workdir, capture_events),
+            "file_sizes": [bench_file_size(workdir, size, measure_memory) for size in sizes],
+            "bulk_decode": bench_bulk_decode(workdir, max(sizes)) if measure_memory else None,
+        }
+
+
+def main():
+    """CLI entry point for the capture benchmark suite."""
+    parser = argparse.ArgumentParser(description="Benchmark capture-events throughput")
+    parser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help=f"Comma-separated episode counts to benchmark (default: {DEFAULT_SIZES})",
+    )
+    parser.add_argument(
+        "--capture-events",
+        type=int,
+        default=DEFAULT_CAPTURE_EVENTS,
+        help=f"Calls per capture_* method (default: {DEFAULT_CAPTURE_EVENTS})",
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true", help="Skip tracemalloc peak measurements"
+    )
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    results = run(sizes, args.capture_events, not args.no_memory)
+    document = json.dumps(results, indent=2)
+
+    if args.output:
+        Path(args.output).write_text(document + "\n", encoding="utf-8")
+    else:
+        print(document)
+
+
+if __name__ == "__main__":
+    main()
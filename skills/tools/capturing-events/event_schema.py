@@ -1,9 +1,52 @@
 """Event schema definition and validation for capture-events skill."""
 
 import json
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+# On-disk record layout version. Version 1 lines carry no "v" field and
+# duplicate "timestamp" (and sometimes "event_type") inside metadata.
+SCHEMA_VERSION = 2
+
+# Metadata keys written by version 1 providers that mirror top-level fields.
+LEGACY_METADATA_KEYS = ("timestamp", "event_type")
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def iso_to_epoch_us(timestamp: str) -> int:
+    """
+    Convert an ISO 8601 timestamp to integer microseconds since the epoch.
+
+    Naive timestamps are treated as UTC, matching ``datetime.utcnow()``.
+
+    Args:
+        timestamp: ISO 8601 timestamp
+
+    Returns:
+        Microseconds since 1970-01-01T00:00:00 UTC
+
+    Raises:
+        ValueError: If the timestamp cannot be parsed
+    """
+    parsed = datetime.fromisoformat(timestamp)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return (parsed - _EPOCH) // timedelta(microseconds=1)
+
+
+def epoch_us_to_iso(epoch_us: int) -> str:
+    """
+    Convert integer microseconds since the epoch to a naive UTC ISO timestamp.
+
+    Args:
+        epoch_us: Microseconds since 1970-01-01T00:00:00 UTC
+
+    Returns:
+        ISO 8601 timestamp (same format as ``datetime.utcnow().isoformat()``)
+    """
+    return (_EPOCH + timedelta(microseconds=epoch_us)).isoformat()
 
 
 class EventType(str, Enum):
@@ -23,6 +66,7 @@ class EventType(str, Enum):
     DIAGNOSTIC_ERROR = "diagnostic_error"
     DIAGNOSTIC_WARNING = "diagnostic_warning"
     DIAGNOSTIC_INFO = "diagnostic_info"
+    DIAGNOSTIC_RESOLVED = "diagnostic_resolved"
 
     # Skill invocation events
     SKILL_INVOKE = "skill_invoke"
@@ -30,6 +74,29 @@ class EventType(str, Enum):
     SKILL_ERROR = "skill_error"
 
 
+# Precomputed value -> member map; avoids Enum's lookup machinery per record.
+_EVENT_TYPES_BY_VALUE: Dict[str, EventType] = {member.value: member for member in EventType}
+
+
+def event_type_from_value(value: Any) -> EventType:
+    """
+    Resolve a stored event type string to its EventType member.
+
+    Args:
+        value: Event type value (e.g. "file_create")
+
+    Returns:
+        EventType member
+
+    Raises:
+        ValueError: If value is not a known event type
+    """
+    try:
+        return _EVENT_TYPES_BY_VALUE[value]
+    except (KeyError, TypeError):
+        raise ValueError(f"{value!r} is not a valid EventType")
+
+
 class Event:
     """Standardized event for workspace signal capture."""
 
@@ -110,20 +177,50 @@ class Event:
             "metadata": self.metadata,
         }
 
-    def to_json(self) -> str:
+    def to_record(self, epoch_timestamps: bool = False) -> Dict[str, Any]:
         """
-        Convert event to JSON string.
+        Convert event to its on-disk record.
+
+        Args:
+            epoch_timestamps: If True, store the timestamp as integer
+                microseconds since the epoch instead of an ISO string
+
+        Returns:
+            Dict with schema version and event data
+        """
+        timestamp: Union[str, int] = self.timestamp
+        if epoch_timestamps:
+            timestamp = iso_to_epoch_us(self.timestamp)
+
+        return {
+            "v": SCHEMA_VERSION,
+            "event_type": self.event_type.value,
+            "provider": self.provider,
+            "timestamp": timestamp,
+            "metadata": self.metadata,
+        }
+
+    def to_json(self, epoch_timestamps: bool = False) -> str:
+        """
+        Convert event to a compact JSON record.
+
+        Args:
+            epoch_timestamps: If True, store the timestamp as epoch microseconds
 
         Returns:
             JSON-encoded event
         """
-        return json.dumps(self.to_dict())
+        return json.dumps(self.to_record(epoch_timestamps), separators=(",", ":"))
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> "Event":
         """
         Create event from dictionary.
 
+        Accepts both the current record layout and version 1 lines, which are
+        upgraded transparently: epoch-microsecond timestamps become ISO
+        strings and metadata fields duplicating top-level ones are dropped.
+
         Args:
             data: Dict with event data
 
@@ -134,13 +231,22 @@ class Event:
             ValueError: If data is invalid
         """
         try:
-            event_type = EventType(data["event_type"])
+            event_type = event_type_from_value(data["event_type"])
             provider = data["provider"]
             timestamp = data["timestamp"]
             metadata = data["metadata"]
         except KeyError as e:
             raise ValueError(f"Missing required field: {e}")
 
+        if isinstance(timestamp, int) and not isinstance(timestamp, bool):
+            timestamp = epoch_us_to_iso(timestamp)
+
+        if "v" not in data and isinstance(metadata, dict):
+            if any(key in metadata for key in LEGACY_METADATA_KEYS):
+                metadata = {
+                    k: v for k, v in metadata.items() if k not in LEGACY_METADATA_KEYS
+                }
+
         event = Event(event_type, provider, metadata, timestamp)
         event.validate()
         return event
@@ -239,3 +345,103 @@ class EventValidator:
             return {"valid": True, "errors": [], "event": event}
         except (json.JSONDecodeError, ValueError) as e:
             return {"valid": False, "errors": [str(e)], "event": None}
+
+
+class EventDecoder:
+    """Bulk decoder that shares repeated strings across many records.
+
+    Lines are parsed in chunks with a single ``json.loads`` call, so the JSON
+    scanner's key memo makes every ``"filepath"``/``"provider"``/... key in a
+    chunk the same object. Provider names and short metadata string values
+    (file paths, skill names, severities) are interned in a per-decoder table,
+    so a million events referencing a hundred files hold a hundred path
+    strings rather than a million.
+    """
+
+    DEFAULT_CHUNK_SIZE = 1000
+    MAX_INTERN_LENGTH = 256
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize decoder.
+
+        Args:
+            chunk_size: Lines parsed per ``json.loads`` call
+        """
+        self.chunk_size = chunk_size
+        self._strings: Dict[str, str] = {}
+
+    def intern(self, value: str) -> str:
+        """Return the shared copy of a string."""
+        return self._strings.setdefault(value, value)
+
+    def decode_dict(self, data: Dict[str, Any]) -> Event:
+        """
+        Create an event from a parsed record, interning repeated strings.
+
+        Args:
+            data: Parsed record
+
+        Returns:
+            Event instance
+
+        Raises:
+            ValueError: If data is invalid
+            TypeError: If data is not a dict
+        """
+        provider = data.get("provider")
+        if isinstance(provider, str):
+            data["provider"] = self.intern(provider)
+
+        metadata = data.get("metadata")
+        if isinstance(metadata, dict):
+            for key, value in metadata.items():
+                if isinstance(value, str) and len(value) <= self.MAX_INTERN_LENGTH:
+                    metadata[key] = self.intern(value)
+
+        return Event.from_dict(data)
+
+    def decode_lines(self, lines: Iterable[str]) -> Iterator[Event]:
+        """
+        Decode JSONL lines, skipping blank and invalid ones.
+
+        Args:
+            lines: JSONL text lines (trailing newlines allowed)
+
+        Yields:
+            Event instances in input order
+        """
+        chunk: List[str] = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            chunk.append(line)
+            if len(chunk) >= self.chunk_size:
+                yield from self._decode_chunk(chunk)
+                chunk = []
+
+        if chunk:
+            yield from self._decode_chunk(chunk)
+
+    def _decode_chunk(self, chunk: List[str]) -> Iterator[Event]:
+        try:
+            records = json.loads("[" + ",".join(chunk) + "]")
+        except ValueError:
+            records = None
+
+        if records is None or len(records) != len(chunk):
+            # At least one line is corrupt: fall back to line-by-line parsing.
+            records = []
+            for line in chunk:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+
+        for data in records:
+            try:
+                yield self.decode_dict(data)
+            except (ValueError, TypeError, AttributeError):
+                # Skip invalid records
+                continue
@@ -1,14 +1,41 @@
 """Capture-events skill implementation with CLI entry point."""
 
 import argparse
+import contextlib
 import json
+import os
 import sys
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
-from event_schema import Event, EventType
+from event_schema import Event, EventType, epoch_us_to_iso
+from locking import exclusive_lock
+from metrics import load_metrics_file, metrics_from_env, metrics_path_for_log
+from providers.diagnostic_diff import DiagnosticSnapshotCache
 from providers.facade import ProviderFacade
+from providers.sampling import SamplingPolicy, load_policy_for_log, sampling_state_path
+from storage.command_index import SORT_KEYS, CommandIndex
 from storage.jsonl_handler import JSONLStorage, TTLCleaner
+from storage.rollup import DIMENSIONS, GRANULARITIES, RollupStore
+from storage.skill_spans import SkillProfiler, write_profile
+
+if TYPE_CHECKING:
+    from storage.parallel_scan import ParallelScanner
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+# Description kinds accepted by ``ingest``, mirroring the capture subcommands.
+INGEST_KINDS = ("file", "terminal", "diagnostic", "skill")
+
+# JSONL logs at least this large (two ParallelScanner.DEFAULT_MIN_CHUNK_BYTES
+# chunks) are read by a ParallelScanner; smaller logs would fit in one chunk,
+# so they are read serially without a pool.
+PARALLEL_READ_MIN_BYTES = 32 << 20
+
+# CLI subcommands that pass events through the sampling policy.
+SAMPLED_COMMANDS = ("file", "terminal", "diagnostic", "diagnostics", "skill", "ingest", "flush")
 
 
 def get_storage_path() -> str:
@@ -36,18 +63,159 @@ def get_storage_path() -> str:
 class CaptureEventsSkill:
     """Capture-events skill for continuous feedback loop."""
 
-    def __init__(self, storage_path: Optional[str] = None, provider: Optional[str] = None):
+    def __init__(
+        self,
+        storage_path: Optional[str] = None,
+        provider: Optional[str] = None,
+        sampling: Optional[SamplingPolicy] = None,
+        metrics=None,
+    ):
         """
         Initialize capture-events skill.
 
         Args:
-            storage_path: Path to episodes.jsonl (auto-detect if None)
+            storage_path: Path to episodes.jsonl (auto-detect if None). Paths
+                ending in .db/.sqlite/.sqlite3 use the SQLite backend.
             provider: Provider name or None to auto-detect
+            sampling: Sampling policy (defaults to sampling.json next to the
+                log, if present)
+            metrics: CaptureMetrics sink (defaults to the one selected by
+                the PAX_CAPTURE_METRICS environment variable)
         """
         self.storage_path = storage_path or get_storage_path()
-        self.storage = JSONLStorage(self.storage_path)
-        self.cleaner = TTLCleaner(self.storage_path)
-        self.facade = ProviderFacade(provider)
+        if metrics is None:
+            metrics = metrics_from_env(self.storage_path)
+        self.metrics = metrics
+        if Path(self.storage_path).suffix in SQLITE_SUFFIXES:
+            # Imported here so JSONL users never load sqlite3.
+            from storage.sqlite_handler import SQLiteStorage
+
+            self.storage = SQLiteStorage(self.storage_path)
+        else:
+            self.storage = JSONLStorage(self.storage_path, metrics=metrics)
+
+        # Everything below is loaded on first use: a single CLI capture needs
+        # none of the side files, and the sampling policy only when capturing.
+        self._provider_name = provider
+        self._sampling = sampling
+        self._facade: Optional[ProviderFacade] = None
+        self._rollup: Optional[RollupStore] = None
+        self._commands: Optional[CommandIndex] = None
+        self._snapshots: Optional[DiagnosticSnapshotCache] = None
+        self._cleaner = None
+
+    @property
+    def facade(self) -> ProviderFacade:
+        """
+        Provider facade, built with the sampling policy on first capture.
+
+        Raises:
+            ValueError: If sampling.json next to the log is invalid
+        """
+        if self._facade is None:
+            sampling = self._sampling
+            if sampling is None:
+                sampling = load_policy_for_log(self.storage_path)
+            self._facade = ProviderFacade(self._provider_name, sampling)
+        return self._facade
+
+    @property
+    def rollup(self) -> Optional[RollupStore]:
+        """Rollups persisted next to a JSONL log (None for SQLite), loaded on first use."""
+        if self._rollup is None and isinstance(self.storage, JSONLStorage):
+            self._rollup = RollupStore.for_log(self.storage_path)
+        return self._rollup
+
+    @property
+    def commands(self) -> Optional[CommandIndex]:
+        """Command index persisted next to a JSONL log (None for SQLite), loaded on first use."""
+        if self._commands is None and isinstance(self.storage, JSONLStorage):
+            self._commands = CommandIndex.for_log(self.storage_path)
+        return self._commands
+
+    @property
+    def diagnostic_snapshots(self) -> DiagnosticSnapshotCache:
+        """Per-file diagnostic snapshots in ``diagnostics.json``, loaded on first use."""
+        if self._snapshots is None:
+            self._snapshots = DiagnosticSnapshotCache.for_log(self.storage_path)
+            self.facade.diagnostics = self._snapshots
+        return self._snapshots
+
+    @property
+    def cleaner(self):
+        """TTL cleaner for the storage backend, created on first use."""
+        if self._cleaner is None:
+            if isinstance(self.storage, JSONLStorage):
+                self._cleaner = TTLCleaner(
+                    self.storage_path, rollup=self.rollup, metrics=self.metrics
+                )
+            else:
+                from storage.sqlite_handler import SQLiteTTLCleaner
+
+                self._cleaner = SQLiteTTLCleaner(self.storage)
+        return self._cleaner
+
+    def _store(self, event) -> bool:
+        """
+        Append an admitted event plus any samples released by the facade.
+
+        Args:
+            event: Event from the facade, or None if it was sampled out
+
+        Returns:
+            True if the given event itself was stored
+        """
+        if event is not None:
+            self.storage.append(event)
+        else:
+            self.metrics.incr("events_sampled_out")
+        for sampled in self.facade.drain_samples():
+            self.storage.append(sampled)
+        self.metrics.maybe_dump()
+        return event is not None
+
+    @contextlib.contextmanager
+    def sampling_session(self):
+        """
+        Carry token buckets and reservoir windows across CLI invocations.
+
+        Each CLI run is a short-lived process, so rate limits and open
+        reservoir windows only work if their state outlives it. The state in
+        ``sampling-state.json`` next to the log is loaded on entry and, after
+        storing any samples whose window has closed, saved on exit. An
+        exclusive lock is held throughout so concurrent captures see each
+        other's decisions. A no-op without token bucket or reservoir rules.
+        """
+        policy = self.facade.sampling
+        if policy is None or not policy.stateful:
+            yield
+            return
+
+        state_path = sampling_state_path(self.storage_path)
+        with exclusive_lock(state_path):
+            policy.load_state(state_path)
+            try:
+                yield
+            finally:
+                for event in self.facade.drain_samples():
+                    self.storage.append(event)
+                policy.save_state(state_path)
+
+    def flush(self) -> dict:
+        """
+        Store events still held by sampling windows.
+
+        Returns:
+            Result dict with the number of events written
+        """
+        try:
+            with self.metrics.timer("flush"):
+                events = self.facade.flush_samples()
+                for event in events:
+                    self.storage.append(event)
+            return {"success": True, "flushed": len(events)}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
 
     def capture_file(self, event_type: str, filepath: str) -> dict:
         """
@@ -61,20 +229,27 @@ class CaptureEventsSkill:
             Result dict
         """
         try:
-            full_event_type = f"file_{event_type}"
-            event = self.facade._provider.capture_file_event(full_event_type, filepath)
-            self.storage.append(event)
+            with self.metrics.timer("capture_file"):
+                full_event_type = f"file_{event_type}"
+                event = self.facade.capture_file_event(full_event_type, filepath)
+                stored = self._store(event)
 
             return {
                 "success": True,
                 "event_type": full_event_type,
                 "filepath": filepath,
+                "stored": stored,
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
 
     def capture_terminal(
-        self, command: str, output: str = "", error: str = ""
+        self,
+        command: str,
+        output: str = "",
+        error: str = "",
+        exit_code: Optional[int] = None,
+        duration_ms: Optional[float] = None,
     ) -> dict:
         """
         Capture terminal event and store.
@@ -83,20 +258,24 @@ class CaptureEventsSkill:
             command: Command executed
             output: Command output
             error: Error output
+            exit_code: Process exit status, if known
+            duration_ms: Run time in milliseconds, if known
 
         Returns:
             Result dict
         """
         try:
-            event = self.facade._provider.capture_terminal_event(
-                "terminal_execute", command, output, error
-            )
-            self.storage.append(event)
+            with self.metrics.timer("capture_terminal"):
+                event = self.facade.capture_terminal_event(
+                    "terminal_execute", command, output, error, exit_code, duration_ms
+                )
+                stored = self._store(event)
 
             return {
                 "success": True,
                 "event_type": "terminal_execute",
                 "command": command,
+                "stored": stored,
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -117,22 +296,69 @@ class CaptureEventsSkill:
             Result dict
         """
         try:
-            event_type = f"diagnostic_{severity}"
-            event = self.facade._provider.capture_diagnostic_event(
-                event_type, filepath, line, message
-            )
-            self.storage.append(event)
+            with self.metrics.timer("capture_diagnostic"):
+                event_type = f"diagnostic_{severity}"
+                event = self.facade.capture_diagnostic_event(
+                    event_type, filepath, line, message
+                )
+                stored = self._store(event)
 
             return {
                 "success": True,
                 "event_type": event_type,
                 "filepath": filepath,
                 "line": line,
+                "stored": stored,
+            }
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def capture_diagnostics(self, filepath: str, diagnostics: List[Dict[str, Any]]) -> dict:
+        """
+        Record changes in a file's complete diagnostic set.
+
+        Only diagnostics that appeared since the previous snapshot of the file
+        (or were resolved since) are stored; snapshots persist in
+        ``diagnostics.json`` next to the log.
+
+        Args:
+            filepath: File the diagnostics were published for
+            diagnostics: Complete current set of {"line", "message", "severity"}
+
+        Returns:
+            Result dict with added/resolved/unchanged counts
+        """
+        try:
+            with self.metrics.timer("capture_diagnostics"):
+                snapshots = self.diagnostic_snapshots
+                events, unchanged = self.facade.capture_diagnostic_snapshot(
+                    filepath, diagnostics
+                )
+                # Count the diff's own events, not samples released alongside them.
+                resolved = sum(
+                    1 for e in events if e.event_type == EventType.DIAGNOSTIC_RESOLVED
+                )
+                added = len(events) - resolved
+                events.extend(self.facade.drain_samples())
+                stored = self.storage.append_many(events) if events else 0
+                snapshots.save()
+
+            self.metrics.incr("diagnostics_unchanged", unchanged)
+            self.metrics.maybe_dump()
+            return {
+                "success": True,
+                "filepath": filepath,
+                "added": added,
+                "resolved": resolved,
+                "unchanged": unchanged,
+                "stored": stored,
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def capture_skill(self, skill_name: str, event_type: str, status: str) -> dict:
+    def capture_skill(
+        self, skill_name: str, event_type: str, status: str, span_id: Optional[str] = None
+    ) -> dict:
         """
         Capture skill event and store.
 
@@ -140,24 +366,169 @@ class CaptureEventsSkill:
             skill_name: Name of the skill
             event_type: "invoke", "complete", or "error"
             status: Status message
+            span_id: Span id returned by the invoke; pass it with the outcome
+                when invoke and outcome are captured by separate processes
 
         Returns:
-            Result dict
+            Result dict (including the event's "span_id")
         """
         try:
-            full_event_type = f"skill_{event_type}"
-            event = self.facade._provider.capture_skill_event(full_event_type, skill_name, status)
-            self.storage.append(event)
+            with self.metrics.timer("capture_skill"):
+                full_event_type = f"skill_{event_type}"
+                event = self.facade.capture_skill_event(
+                    full_event_type, skill_name, status, span_id
+                )
+                stored = self._store(event)
 
             return {
                 "success": True,
                 "event_type": full_event_type,
                 "skill_name": skill_name,
                 "status": status,
+                "span_id": event.metadata.get("span_id") if event is not None else span_id,
+                "stored": stored,
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def _event_from_description(self, data: Dict[str, Any]) -> Event:
+        """
+        Build an event from one ``ingest`` description.
+
+        Descriptions either name a ``kind`` and carry the same fields as the
+        matching CLI subcommand, or are full event records with an
+        ``event_type``. An optional ``timestamp`` (ISO 8601 or epoch
+        microseconds) preserves the original time of historical events.
+
+        Args:
+            data: Decoded description
+
+        Returns:
+            Validated Event
+
+        Raises:
+            ValueError: If the description is invalid
+        """
+        if not isinstance(data, dict):
+            raise ValueError("description must be a JSON object")
+
+        try:
+            if "event_type" in data:
+                record = {
+                    "provider": self.facade.provider_name,
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "metadata": {},
+                    **data,
+                }
+                event = Event.from_dict(record)
+                datetime.fromisoformat(event.timestamp)
+                return event
+
+            provider = self.facade.provider
+            kind = data.get("kind")
+            if kind == "file":
+                event = provider.capture_file_event(f"file_{data['type']}", data["filepath"])
+            elif kind == "terminal":
+                event = provider.capture_terminal_event(
+                    "terminal_execute",
+                    data["command"],
+                    data.get("output", ""),
+                    data.get("error", ""),
+                    data.get("exit_code"),
+                    data.get("duration_ms"),
+                )
+            elif kind == "diagnostic":
+                event = provider.capture_diagnostic_event(
+                    f"diagnostic_{data.get('severity', 'error')}",
+                    data["filepath"],
+                    int(data.get("line", 1)),
+                    data["message"],
+                )
+            elif kind == "skill":
+                event = provider.capture_skill_event(
+                    f"skill_{data['type']}", data["name"], data["status"], data.get("span_id")
+                )
+            else:
+                raise ValueError(
+                    f"Unknown kind: {kind}. Valid options: {list(INGEST_KINDS)} "
+                    "or a record with event_type"
+                )
+        except KeyError as e:
+            raise ValueError(f"Missing required field: {e}")
+        except TypeError as e:
+            raise ValueError(str(e))
+
+        timestamp = data.get("timestamp")
+        if timestamp is not None:
+            if isinstance(timestamp, int) and not isinstance(timestamp, bool):
+                timestamp = epoch_us_to_iso(timestamp)
+            datetime.fromisoformat(timestamp)
+            event.timestamp = timestamp
+        return event
+
+    def ingest(
+        self, lines: Iterable[str], strict: bool = False, max_errors: int = 20
+    ) -> dict:
+        """
+        Bulk-append NDJSON event descriptions.
+
+        Lines are decoded and validated as they stream in and written through
+        one buffered ``append_many`` call. Sampling policies apply to live
+        capture only; every valid description is stored.
+
+        Args:
+            lines: NDJSON lines (e.g. ``sys.stdin``)
+            strict: If True, validate everything first and write nothing
+                when any line is invalid
+            max_errors: Maximum invalid lines reported individually
+
+        Returns:
+            Dict with ingested/invalid counts, errors and throughput
+        """
+        errors = []
+        invalid = 0
+
+        def valid_events():
+            nonlocal invalid
+            for number, line in enumerate(lines, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield self._event_from_description(json.loads(line))
+                except (ValueError, TypeError) as e:
+                    invalid += 1
+                    if len(errors) < max_errors:
+                        errors.append({"line": number, "error": str(e)})
+
+        start = time.perf_counter()
+        try:
+            events = valid_events()
+            if strict:
+                events = list(events)
+                if invalid:
+                    return {
+                        "success": False,
+                        "error": f"{invalid} invalid line(s); nothing written",
+                        "invalid": invalid,
+                        "errors": errors,
+                    }
+
+            with self.metrics.timer("ingest"):
+                ingested = self.storage.append_many(events)
+        except Exception as e:
+            return {"success": False, "error": str(e), "invalid": invalid, "errors": errors}
+
+        seconds = time.perf_counter() - start
+        self.metrics.maybe_dump()
+        return {
+            "success": True,
+            "ingested": ingested,
+            "invalid": invalid,
+            "errors": errors,
+            "seconds": round(seconds, 4),
+            "events_per_sec": round(ingested / seconds, 1) if seconds else 0.0,
+        }
+
     def cleanup(self, dry_run: bool = False) -> dict:
         """
         Run TTL cleanup.
@@ -168,6 +539,9 @@ class CaptureEventsSkill:
         Returns:
             Cleanup statistics
         """
+        if not dry_run and self.commands is not None:
+            # Index runs before the rewrite drops them or moves their offsets.
+            self.commands.update(self.storage)
         return self.cleaner.cleanup(dry_run=dry_run)
 
     def read_all(self) -> dict:
@@ -187,10 +561,33 @@ class CaptureEventsSkill:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def parallel_scanner(self) -> Optional["ParallelScanner"]:
+        """
+        Get a scanner for filtered reads if the log is large enough to split.
+
+        Returns:
+            ParallelScanner for JSONL logs of at least PARALLEL_READ_MIN_BYTES,
+            otherwise None (read through ``self.storage``)
+        """
+        if not isinstance(self.storage, JSONLStorage):
+            return None
+        try:
+            size = os.path.getsize(self.storage_path)
+        except OSError:
+            return None
+        if size < PARALLEL_READ_MIN_BYTES:
+            return None
+        from storage.parallel_scan import ParallelScanner
+
+        return ParallelScanner(self.storage_path)
+
     def read_by_type(self, event_type: str) -> dict:
         """
         Read events of specific type.
 
+        Large JSONL logs are filtered in parallel chunks (see
+        ``parallel_scanner``).
+
         Args:
             event_type: Event type to filter
 
@@ -198,7 +595,11 @@ class CaptureEventsSkill:
             Dict with matching events
         """
         try:
-            events = self.storage.read_by_type(event_type)
+            scanner = self.parallel_scanner()
+            if scanner is not None:
+                events = scanner.read_by_type(event_type)
+            else:
+                events = self.storage.read_by_type(event_type)
             return {
                 "success": True,
                 "event_type": event_type,
@@ -208,14 +609,290 @@ class CaptureEventsSkill:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def stats(self) -> dict:
+    def read_since(self, since_timestamp: str) -> dict:
+        """
+        Read events at or after a timestamp.
+
+        Large JSONL logs are filtered in parallel chunks (see
+        ``parallel_scanner``).
+
+        Args:
+            since_timestamp: ISO 8601 timestamp
+
+        Returns:
+            Dict with matching events
+        """
+        try:
+            scanner = self.parallel_scanner()
+            if scanner is not None:
+                events = scanner.read_since(since_timestamp)
+            else:
+                events = self.storage.read_since(since_timestamp)
+            return {
+                "success": True,
+                "since": since_timestamp,
+                "count": len(events),
+                "events": [e.to_dict() for e in events],
+            }
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def read_new(self, consumer: str) -> dict:
+        """
+        Read events the named consumer has not seen yet.
+
+        Args:
+            consumer: Consumer name whose cursor is advanced
+
+        Returns:
+            Dict with new events
+        """
+        try:
+            events = self.storage.read_new(consumer)
+            return {
+                "success": True,
+                "consumer": consumer,
+                "count": len(events),
+                "events": [e.to_dict() for e in events],
+            }
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def migrate(self, db_path: str) -> dict:
+        """
+        Copy the JSONL episode log into a SQLite database.
+
+        Safe to re-run: only events appended since the previous migration
+        into ``db_path`` are copied.
+
+        Args:
+            db_path: Destination SQLite database path
+
+        Returns:
+            Migration statistics
+        """
+        from storage.sqlite_handler import migrate_jsonl
+
+        try:
+            stats = migrate_jsonl(self.storage_path, db_path)
+            return {
+                "success": True,
+                "source": self.storage_path,
+                "destination": db_path,
+                **stats,
+            }
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def export_otlp(
+        self,
+        output: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        batch_size: Optional[int] = None,
+    ) -> dict:
+        """
+        Stream stored events to an OTLP-JSON file or collector.
+
+        Args:
+            output: File to append OTLP-JSON export requests to
+            endpoint: OTLP/HTTP collector base URL (e.g. http://localhost:4318)
+            since: ISO 8601 lower bound (inclusive)
+            until: ISO 8601 upper bound (exclusive)
+            batch_size: Log records or spans per export request (default:
+                OTLPExporter.DEFAULT_BATCH_SIZE)
+
+        Returns:
+            Dict with exported log, span and request counts
+        """
+        if not isinstance(self.storage, JSONLStorage):
+            return {"success": False, "error": "OTLP export requires JSONL storage"}
+        if (output is None) == (endpoint is None):
+            return {"success": False, "error": "Give exactly one of output or endpoint"}
+
+        # Imported here: urllib is only needed for exports, not captures.
+        from storage.otlp_exporter import FileSink, HttpSink, OTLPExporter
+
+        try:
+            if batch_size is None:
+                batch_size = OTLPExporter.DEFAULT_BATCH_SIZE
+            sink = FileSink(output) if output else HttpSink(endpoint)
+            exporter = OTLPExporter(sink, batch_size=batch_size)
+            with self.metrics.timer("export_otlp"):
+                stats = exporter.export(self.storage.iter_events(since=since, until=until))
+            return {"success": True, "destination": output or endpoint, **stats}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def profile_skills(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        output: Optional[str] = None,
+    ) -> dict:
+        """
+        Profile skill latency and error rates from paired invocations.
+
+        The log is streamed once; only open invocations and one duration per
+        finished span are held in memory.
+
+        Args:
+            since: ISO 8601 lower bound (inclusive)
+            until: ISO 8601 upper bound (exclusive)
+            output: Also write the profile as stable JSON to this file
+
+        Returns:
+            Dict with per-skill latency percentiles and error rates
+        """
+        if not isinstance(self.storage, JSONLStorage):
+            return {"success": False, "error": "Skill profiling requires JSONL storage"}
+
+        try:
+            with self.metrics.timer("profile_skills"):
+                profile = SkillProfiler().profile(
+                    self.storage.iter_events(since=since, until=until)
+                )
+            if output:
+                write_profile(profile, output)
+            return {"success": True, "output": output, **profile}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def trends(
+        self,
+        dimension: str = "event_type",
+        granularity: str = "day",
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        value: Optional[str] = None,
+    ) -> dict:
+        """
+        Query time-bucketed rollups, folding in new events first.
+
+        Args:
+            dimension: "event_type", "provider", "skill_name" or "filepath"
+            granularity: "hour" or "day"
+            since: ISO 8601 lower bound (inclusive)
+            until: ISO 8601 upper bound (exclusive)
+            value: Only report this dimension value
+
+        Returns:
+            Dict with the time series
+        """
+        if self.rollup is None:
+            return {"success": False, "error": "Rollups require JSONL storage"}
+
+        try:
+            self.rollup.update(self.storage)
+            series = self.rollup.query(dimension, granularity, since, until, value)
+            return {
+                "success": True,
+                "dimension": dimension,
+                "granularity": granularity,
+                "buckets": len(series),
+                "series": series,
+            }
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def command_stats(
+        self,
+        command: Optional[str] = None,
+        match: Optional[str] = None,
+        sort: str = "count",
+        limit: Optional[int] = 20,
+    ) -> dict:
+        """
+        Query run counts, failure rates and durations per command fingerprint.
+
+        New terminal events are folded into the index first, so the query
+        reads only the events appended since the previous one.
+
+        Args:
+            command: Report only the fingerprint of this raw command line
+            match: Only fingerprints containing this substring
+            sort: One of SORT_KEYS, highest first
+            limit: Maximum fingerprints to return
+
+        Returns:
+            Dict with the matching fingerprints
+        """
+        if self.commands is None:
+            return {"success": False, "error": "The command index requires JSONL storage"}
+
+        try:
+            indexed = self.commands.update(self.storage)
+            if command is not None:
+                entry = self.commands.lookup(command)
+                commands = [entry] if entry is not None else []
+            else:
+                commands = self.commands.query(match, sort, limit)
+            return {
+                "success": True,
+                "indexed": indexed,
+                "fingerprints": len(self.commands),
+                "commands": commands,
+            }
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def metrics_report(self, reset: bool = False) -> dict:
+        """
+        Report capture self-metrics.
+
+        Combines the metrics file accumulated by earlier processes with this
+        process's not-yet-dumped counters.
+
+        Args:
+            reset: If True, delete the metrics file after reporting
+
+        Returns:
+            Dict with "counters" and per-operation "latency" summaries
+        """
+        try:
+            self.metrics.dump()
+            path = getattr(self.metrics, "dump_path", None) or metrics_path_for_log(
+                self.storage_path
+            )
+            report = load_metrics_file(str(path))
+            if not report["counters"] and not report["latency"]:
+                report = self.metrics.snapshot()
+            if reset and Path(path).exists():
+                Path(path).unlink()
+            for summary in report["latency"].values():
+                summary.pop("buckets", None)
+            return {
+                "success": True,
+                "enabled": self.metrics.enabled,
+                "metrics_path": str(path),
+                **report,
+            }
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def stats(self, workers: Optional[int] = None) -> dict:
         """
         Get storage statistics.
 
+        JSONL logs are counted by a ``ParallelScanner``, which splits large
+        logs into chunks counted in separate processes.
+
+        Args:
+            workers: Worker processes for JSONL logs (default: CPU count;
+                logs under one chunk are always counted in-process)
+
         Returns:
             Dict with stats
         """
         try:
+            if isinstance(self.storage, JSONLStorage):
+                from storage.parallel_scan import ParallelScanner
+
+                with self.metrics.timer("stats"):
+                    counts = ParallelScanner(self.storage_path, workers).stats()
+                return {"success": True, **counts, "storage_path": self.storage_path}
+
             all_events = self.storage.read_all()
             event_types = {}
             providers = {}
@@ -237,6 +914,127 @@ class CaptureEventsSkill:
             return {"success": False, "error": str(e)}
 
 
+def _iso_timestamp(value: str) -> str:
+    """Validate an ISO 8601 timestamp argument, returning it unchanged."""
+    try:
+        datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid ISO 8601 timestamp: {value!r}")
+    return value
+
+
+def _discard_stdout() -> None:
+    """
+    Stop writing after downstream (e.g. ``head``) closed the pipe.
+
+    Points stdout at os.devnull so the interpreter's flush at exit does not
+    raise BrokenPipeError again.
+    """
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+
+
+def stream_events(skill: CaptureEventsSkill, args: argparse.Namespace) -> dict:
+    """
+    Stream filtered events to stdout for the ``read`` command.
+
+    NDJSON output is written one event at a time, so consumers such as ``jq``
+    or ``head`` see the first record immediately and memory stays constant.
+    ``--format json`` collects matches into the legacy result document.
+
+    Args:
+        skill: Capture-events skill instance
+        args: Parsed ``read`` arguments
+
+    Returns:
+        Result dict (only printed for ``--format json`` or on failure)
+    """
+    try:
+        events = skill.storage.iter_events(
+            since=args.since,
+            until=args.until,
+            event_type=args.type,
+            provider=args.provider,
+            filepath=args.filepath,
+            reverse=args.reverse,
+            limit=args.limit,
+        )
+
+        if args.format == "json":
+            matches = [e.to_dict() for e in events]
+            result = {"success": True}
+            if args.type:
+                result["event_type"] = args.type
+            result.update({"count": len(matches), "events": matches})
+            return result
+
+        # Same record shape as --format json, not the on-disk layout.
+        write = sys.stdout.write
+        for event in events:
+            write(json.dumps(event.to_dict(), separators=(",", ":")) + "\n")
+        sys.stdout.flush()
+        return {"success": True, "streamed": True}
+    except BrokenPipeError:
+        _discard_stdout()
+        return {"success": True, "streamed": True}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+def stream_federated(args: argparse.Namespace) -> dict:
+    """
+    Stream events from every workspace below ``--root`` for ``federate``.
+
+    Each NDJSON line is the event dict plus a ``workspace`` key naming the
+    workspace root it came from.
+
+    Args:
+        args: Parsed ``federate`` arguments
+
+    Returns:
+        Result dict (only printed for ``--counts`` or on failure)
+    """
+    # Imported here: the thread and process pools are not needed by captures.
+    from storage.federation import FederatedStore
+
+    try:
+        store = FederatedStore.discover(
+            args.root or [str(Path.cwd())],
+            max_depth=args.max_depth,
+            max_workers=args.workers,
+            executor=args.executor,
+        )
+
+        if args.counts:
+            counts = store.counts()
+            return {
+                "success": True,
+                "workspaces": len(counts),
+                "total_events": sum(counts.values()),
+                "counts": counts,
+            }
+
+        events = store.iter_events(
+            since=args.since,
+            until=args.until,
+            event_type=args.type,
+            provider=args.provider,
+            filepath=args.filepath,
+            reverse=args.reverse,
+            limit=args.limit,
+        )
+        write = sys.stdout.write
+        for workspace, event in events:
+            write(json.dumps({"workspace": workspace, **event.to_dict()}) + "\n")
+        sys.stdout.flush()
+        return {"success": True, "streamed": True}
+    except BrokenPipeError:
+        _discard_stdout()
+        return {"success": True, "streamed": True}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
 def main():
     """CLI entry point for capture-events skill."""
     parser = argparse.ArgumentParser(
@@ -254,9 +1052,12 @@ def main():
 
     # Terminal capture command
     term_parser = subparsers.add_parser("terminal", help="Capture terminal event")
-    term_parser.add_argument("command", help="Command executed")
+    # ``dest`` must not be "command": that names the selected subcommand.
+    term_parser.add_argument("cmd", metavar="command", help="Command executed")
     term_parser.add_argument("--output", default="", help="Command output")
     term_parser.add_argument("--error", default="", help="Error output")
+    term_parser.add_argument("--exit-code", type=int, help="Process exit status")
+    term_parser.add_argument("--duration-ms", type=float, help="Run time in milliseconds")
 
     # Diagnostic capture command
     diag_parser = subparsers.add_parser("diagnostic", help="Capture diagnostic event")
@@ -267,6 +1068,18 @@ def main():
         "--severity", choices=["error", "warning", "info"], default="error"
     )
 
+    # Diagnostic snapshot command
+    diags_parser = subparsers.add_parser(
+        "diagnostics",
+        help="Record only added/resolved diagnostics from a file's full diagnostic set",
+    )
+    diags_parser.add_argument("filepath", help="File the diagnostics belong to")
+    diags_parser.add_argument(
+        "--input",
+        default="-",
+        help='JSON array of {"line", "message", "severity"} (default: stdin)',
+    )
+
     # Skill capture command
     skill_parser = subparsers.add_parser("skill", help="Capture skill event")
     skill_parser.add_argument("name", help="Skill name")
@@ -274,19 +1087,162 @@ def main():
         "type", choices=["invoke", "complete", "error"], help="Skill event type"
     )
     skill_parser.add_argument("--status", required=True, help="Status message")
+    skill_parser.add_argument(
+        "--span-id", help="Span id printed by the invoke, to pair its outcome"
+    )
+
+    # Sampling flush command
+    subparsers.add_parser(
+        "flush", help="Store events still held by open reservoir sampling windows"
+    )
+
+    # Bulk ingestion command
+    ingest_parser = subparsers.add_parser(
+        "ingest", help="Append NDJSON event descriptions from stdin or a file"
+    )
+    ingest_parser.add_argument(
+        "source", nargs="?", default="-", help="NDJSON file (default: stdin)"
+    )
+    ingest_parser.add_argument(
+        "--strict", action="store_true", help="Write nothing if any line is invalid"
+    )
+    ingest_parser.add_argument(
+        "--max-errors", type=int, default=20, help="Invalid lines to report individually"
+    )
 
     # Read commands
-    read_parser = subparsers.add_parser("read", help="Read stored events")
+    read_parser = subparsers.add_parser(
+        "read", help="Stream stored events as NDJSON"
+    )
     read_parser.add_argument(
         "--type", help="Filter by event type"
     )
+    read_parser.add_argument(
+        "--since", type=_iso_timestamp, help="Only events at or after this timestamp"
+    )
+    read_parser.add_argument(
+        "--until", type=_iso_timestamp, help="Only events before this timestamp"
+    )
+    read_parser.add_argument("--provider", help="Filter by provider")
+    read_parser.add_argument("--filepath", help="Filter by metadata filepath")
+    read_parser.add_argument("--limit", type=int, help="Stop after N matching events")
+    read_parser.add_argument(
+        "--reverse", action="store_true", help="Newest events first"
+    )
+    read_parser.add_argument(
+        "--format",
+        choices=["ndjson", "json"],
+        default="ndjson",
+        help="ndjson streams one event per line; json prints a single document",
+    )
+
+    # Cross-workspace read command
+    federate_parser = subparsers.add_parser(
+        "federate", help="Stream events from every workspace below --root, merged by time"
+    )
+    federate_parser.add_argument(
+        "--root",
+        action="append",
+        help="Directory to search for workspaces (repeatable, default: cwd)",
+    )
+    federate_parser.add_argument(
+        "--max-depth", type=int, default=3, help="Directory levels to search below each root"
+    )
+    federate_parser.add_argument("--workers", type=int, help="Concurrent store scans")
+    federate_parser.add_argument(
+        "--executor", choices=["thread", "process"], default="thread", help="Scan pool type"
+    )
+    federate_parser.add_argument("--type", help="Filter by event type")
+    federate_parser.add_argument("--since", type=_iso_timestamp, help="Lower bound")
+    federate_parser.add_argument("--until", type=_iso_timestamp, help="Upper bound")
+    federate_parser.add_argument("--provider", help="Filter by provider")
+    federate_parser.add_argument("--filepath", help="Filter by metadata filepath")
+    federate_parser.add_argument("--limit", type=int, help="Stop after N events in total")
+    federate_parser.add_argument(
+        "--reverse", action="store_true", help="Newest events first"
+    )
+    federate_parser.add_argument(
+        "--counts", action="store_true", help="Print per-workspace event counts instead"
+    )
+
+    # Incremental read command
+    read_new_parser = subparsers.add_parser(
+        "read-new", help="Read events not yet seen by a named consumer"
+    )
+    read_new_parser.add_argument("consumer", help="Consumer name (e.g. reflect)")
 
     # Cleanup command
     cleanup_parser = subparsers.add_parser("cleanup", help="Run TTL cleanup")
     cleanup_parser.add_argument("--dry-run", action="store_true", help="Don't actually delete")
 
+    # Trends command
+    trends_parser = subparsers.add_parser(
+        "trends", help="Query hourly/daily rollups of captured events"
+    )
+    trends_parser.add_argument(
+        "--dimension", choices=list(DIMENSIONS), default="event_type"
+    )
+    trends_parser.add_argument(
+        "--granularity", choices=sorted(GRANULARITIES), default="day"
+    )
+    trends_parser.add_argument("--since", type=_iso_timestamp, help="Lower bound")
+    trends_parser.add_argument("--until", type=_iso_timestamp, help="Upper bound")
+    trends_parser.add_argument("--value", help="Only report this dimension value")
+
+    # OTLP export command
+    otlp_parser = subparsers.add_parser(
+        "export-otlp", help="Export events as OTLP-JSON logs and skill spans"
+    )
+    otlp_target = otlp_parser.add_mutually_exclusive_group(required=True)
+    otlp_target.add_argument("--output", help="OTLP-JSON file (traces go to <stem>.traces.json)")
+    otlp_target.add_argument("--endpoint", help="OTLP/HTTP collector, e.g. http://localhost:4318")
+    otlp_parser.add_argument("--since", type=_iso_timestamp, help="Lower bound")
+    otlp_parser.add_argument("--until", type=_iso_timestamp, help="Upper bound")
+    otlp_parser.add_argument(
+        "--batch-size",
+        type=int,
+        help="Records per export request (default: 512)",
+    )
+
+    # Command index query
+    commands_parser = subparsers.add_parser(
+        "commands", help="Run counts, failure rates and durations per command fingerprint"
+    )
+    commands_target = commands_parser.add_mutually_exclusive_group()
+    commands_target.add_argument("--lookup", help="Report the fingerprint of this command line")
+    commands_target.add_argument("--match", help="Only fingerprints containing this text")
+    commands_parser.add_argument("--sort", choices=SORT_KEYS, default="count")
+    commands_parser.add_argument("--limit", type=int, default=20, help="Maximum fingerprints")
+
+    # Skill profile command
+    profile_parser = subparsers.add_parser(
+        "profile-skills", help="Per-skill latency percentiles and error rates"
+    )
+    profile_parser.add_argument("--since", type=_iso_timestamp, help="Lower bound")
+    profile_parser.add_argument("--until", type=_iso_timestamp, help="Upper bound")
+    profile_parser.add_argument("--output", help="Also write the profile to this JSON file")
+
+    # Migration command
+    migrate_parser = subparsers.add_parser(
+        "migrate",
+        help="Copy episodes.jsonl into a SQLite database; re-running copies only "
+        "events appended since the last migration",
+    )
+    migrate_parser.add_argument("destination", help="SQLite database path")
+
     # Stats command
-    subparsers.add_parser("stats", help="Show storage statistics")
+    stats_parser = subparsers.add_parser("stats", help="Show storage statistics")
+    stats_parser.add_argument(
+        "--workers", type=int, help="Worker processes for large logs (default: CPU count)"
+    )
+
+    # Metrics command
+    metrics_parser = subparsers.add_parser(
+        "metrics", help="Show capture self-metrics (enable with PAX_CAPTURE_METRICS=1)"
+    )
+    metrics_parser.add_argument(
+        "--reset", action="store_true", help="Delete accumulated metrics after printing"
+    )
 
     args = parser.parse_args()
 
@@ -296,32 +1252,94 @@ def main():
 
     skill = CaptureEventsSkill()
 
+    # Only capture commands load the sampling policy; a broken sampling.json
+    # fails them with a result document rather than a traceback.
+    session = contextlib.nullcontext()
+    if args.command in SAMPLED_COMMANDS:
+        try:
+            skill.facade
+        except ValueError as e:
+            print(json.dumps({"success": False, "error": str(e)}, indent=2), file=sys.stderr)
+            sys.exit(1)
+        session = skill.sampling_session()
+
     # Execute command
-    if args.command == "file":
-        result = skill.capture_file(args.type, args.filepath)
-    elif args.command == "terminal":
-        result = skill.capture_terminal(args.command, args.output, args.error)
-    elif args.command == "diagnostic":
-        result = skill.capture_diagnostic(
-            args.filepath, args.line, args.message, args.severity
-        )
-    elif args.command == "skill":
-        result = skill.capture_skill(args.name, args.type, args.status)
-    elif args.command == "read":
-        if args.type:
-            result = skill.read_by_type(args.type)
+    with session:
+        if args.command == "file":
+            result = skill.capture_file(args.type, args.filepath)
+        elif args.command == "terminal":
+            result = skill.capture_terminal(
+                args.cmd, args.output, args.error, args.exit_code, args.duration_ms
+            )
+        elif args.command == "diagnostic":
+            result = skill.capture_diagnostic(
+                args.filepath, args.line, args.message, args.severity
+            )
+        elif args.command == "diagnostics":
+            try:
+                if args.input == "-":
+                    diagnostics = json.load(sys.stdin)
+                else:
+                    with open(args.input, "r", encoding="utf-8") as source:
+                        diagnostics = json.load(source)
+            except (IOError, OSError, ValueError) as e:
+                diagnostics = None
+                result = {"success": False, "error": f"Invalid diagnostics input: {e}"}
+            if diagnostics is not None:
+                if isinstance(diagnostics, list):
+                    result = skill.capture_diagnostics(args.filepath, diagnostics)
+                else:
+                    result = {"success": False, "error": "Diagnostics input must be a JSON array"}
+        elif args.command == "skill":
+            result = skill.capture_skill(args.name, args.type, args.status, args.span_id)
+        elif args.command == "flush":
+            result = skill.flush()
+        elif args.command == "ingest":
+            if args.source == "-":
+                result = skill.ingest(sys.stdin, args.strict, args.max_errors)
+            else:
+                with open(args.source, "r", encoding="utf-8") as source:
+                    result = skill.ingest(source, args.strict, args.max_errors)
+        elif args.command == "read":
+            result = stream_events(skill, args)
+            if result.get("streamed"):
+                return
+        elif args.command == "federate":
+            result = stream_federated(args)
+            if result.get("streamed"):
+                return
+        elif args.command == "read-new":
+            result = skill.read_new(args.consumer)
+        elif args.command == "cleanup":
+            result = skill.cleanup(dry_run=args.dry_run)
+        elif args.command == "trends":
+            result = skill.trends(
+                args.dimension, args.granularity, args.since, args.until, args.value
+            )
+        elif args.command == "export-otlp":
+            result = skill.export_otlp(
+                args.output, args.endpoint, args.since, args.until, args.batch_size
+            )
+        elif args.command == "commands":
+            result = skill.command_stats(args.lookup, args.match, args.sort, args.limit)
+        elif args.command == "profile-skills":
+            result = skill.profile_skills(args.since, args.until, args.output)
+        elif args.command == "migrate":
+            result = skill.migrate(args.destination)
+        elif args.command == "stats":
+            result = skill.stats(args.workers)
+        elif args.command == "metrics":
+            result = skill.metrics_report(reset=args.reset)
         else:
-            result = skill.read_all()
-    elif args.command == "cleanup":
-        result = skill.cleanup(dry_run=args.dry_run)
-    elif args.command == "stats":
-        result = skill.stats()
-    else:
-        parser.print_help()
-        sys.exit(1)
+            parser.print_help()
+            sys.exit(1)
 
     # Output result
-    print(json.dumps(result, indent=2))
+    try:
+        print(json.dumps(result, indent=2))
+        sys.stdout.flush()
+    except BrokenPipeError:
+        _discard_stdout()
 
     if not result.get("success", True):
         sys.exit(1)
@@ -0,0 +1,46 @@
+"""Inter-process locks for state files shared by concurrent CLI invocations."""
+
+import contextlib
+import os
+from pathlib import Path
+from typing import Iterator, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextlib.contextmanager
+def exclusive_lock(path: Union[str, Path]) -> Iterator[None]:
+    """
+    Hold an exclusive advisory lock for a state file.
+
+    The lock is taken on a ``<name>.lock`` sidecar rather than the file
+    itself, because state files are rewritten with ``os.replace`` and a lock
+    on the replaced inode would no longer exclude anyone. Blocks until the
+    lock is available; it is released when the block exits or the process
+    dies.
+
+    Args:
+        path: State file to guard
+    """
+    lock_path = Path(path).with_name(f"{Path(path).name}.lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(str(lock_path), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    finally:
+        os.close(fd)
@@ -0,0 +1,389 @@
+"""Self-metrics for the capture pipeline: counters and latency histograms."""
+
+import atexit
+import json
+import os
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    from locking import exclusive_lock
+except ImportError:
+    from .locking import exclusive_lock
+
+# Environment switches read by ``metrics_from_env``.
+METRICS_ENV = "PAX_CAPTURE_METRICS"
+METRICS_INTERVAL_ENV = "PAX_CAPTURE_METRICS_INTERVAL"
+
+DEFAULT_DUMP_INTERVAL = 60.0
+
+# Histogram bucket upper bounds in microseconds: 1us, 2us, 4us ... ~16.8s.
+BUCKET_BOUNDS_US = tuple(2 ** i for i in range(25))
+
+
+class Histogram:
+    """Latency histogram with fixed power-of-two microsecond buckets.
+
+    Observations cost one ``bit_length`` and one list increment, and
+    histograms from different processes merge by adding bucket counts.
+    Percentiles are reported as the upper bound of the containing bucket.
+    """
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_US) + 1)
+        self.total = 0
+        self.sum_us = 0
+        self.max_us = 0
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration."""
+        micros = int(round(seconds * 1e6))
+        index = min(max(micros - 1, 0).bit_length(), len(BUCKET_BOUNDS_US))
+        self.counts[index] += 1
+        self.total += 1
+        self.sum_us += micros
+        if micros > self.max_us:
+            self.max_us = micros
+
+    def percentile(self, pct: float) -> int:
+        """
+        Estimate a percentile in microseconds.
+
+        Args:
+            pct: Percentile in [0, 100]
+
+        Returns:
+            Upper bound of the bucket holding the percentile (0 when empty)
+        """
+        if not self.total:
+            return 0
+
+        rank = max(1, int(round(pct / 100.0 * self.total)))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                if index < len(BUCKET_BOUNDS_US):
+                    return min(BUCKET_BOUNDS_US[index], self.max_us)
+                return self.max_us
+        return self.max_us
+
+    def merge(self, data: Dict[str, Any]) -> None:
+        """Add a serialized histogram (see ``to_dict``) into this one."""
+        for index, count in enumerate(data.get("buckets", [])[: len(self.counts)]):
+            self.counts[index] += count
+        self.total += data.get("count", 0)
+        self.sum_us += data.get("sum_us", 0)
+        self.max_us = max(self.max_us, data.get("max_us", 0))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize counts and summary statistics."""
+        return {
+            "count": self.total,
+            "sum_us": self.sum_us,
+            "max_us": self.max_us,
+            "mean_us": round(self.sum_us / self.total, 1) if self.total else 0.0,
+            "p50_us": self.percentile(50),
+            "p90_us": self.percentile(90),
+            "p99_us": self.percentile(99),
+            "buckets": list(self.counts),
+        }
+
+
+class _Timer:
+    """Context manager that records elapsed time into a histogram."""
+
+    __slots__ = ("_metrics", "_name", "_start")
+
+    def __init__(self, metrics: "CaptureMetrics", name: str):
+        self._metrics = metrics
+        self._name = name
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._metrics.observe(self._name, time.perf_counter() - self._start)
+
+
+class _NullTimer:
+    """Shared no-op timer."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class NullMetrics:
+    """Metrics sink used when instrumentation is disabled.
+
+    Every method is a constant-time no-op, so instrumented code paths cost
+    one attribute lookup and call.
+    """
+
+    enabled = False
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        """Ignore a counter increment."""
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Ignore a latency observation."""
+
+    def timer(self, name: str) -> _NullTimer:
+        """Return the shared no-op timer."""
+        return _NULL_TIMER
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return an empty snapshot."""
+        return {"counters": {}, "latency": {}}
+
+    def maybe_dump(self) -> None:
+        """Nothing to dump."""
+
+    def dump(self) -> None:
+        """Nothing to dump."""
+
+
+NULL_METRICS = NullMetrics()
+
+
+class CaptureMetrics:
+    """Thread-safe counters and latency histograms for one process.
+
+    When ``dump_path`` is set, ``maybe_dump`` (called after instrumented
+    operations) merges the counts accumulated since the previous dump into
+    that JSON file at most once per ``dump_interval`` seconds, and a final
+    dump runs at interpreter exit for instances still alive then (they are
+    tracked weakly, so an unused instance is not kept until exit). Because
+    dumps add deltas rather than overwrite, short-lived CLI invocations
+    accumulate into one file.
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        dump_path: Optional[str] = None,
+        dump_interval: float = DEFAULT_DUMP_INTERVAL,
+    ):
+        """
+        Initialize metrics.
+
+        Args:
+            dump_path: JSON file that accumulates metrics across processes
+            dump_interval: Minimum seconds between periodic dumps
+        """
+        self.dump_path = Path(dump_path) if dump_path else None
+        self.dump_interval = dump_interval
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._dumped_counters: Dict[str, int] = {}
+        self._dumped_histograms: Dict[str, Dict[str, Any]] = {}
+        self._last_dump = time.monotonic()
+        if self.dump_path is not None:
+            _dump_at_exit.add(self)
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        """
+        Increment a counter.
+
+        Args:
+            name: Counter name (e.g. "events_written")
+            amount: Increment
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def observe(self, name: str, seconds: float) -> None:
+        """
+        Record a latency observation.
+
+        Args:
+            name: Operation name (e.g. "append")
+            seconds: Duration in seconds
+        """
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(seconds)
+
+    def timer(self, name: str) -> _Timer:
+        """
+        Time a block into the named histogram.
+
+        Args:
+            name: Operation name
+
+        Returns:
+            Context manager
+        """
+        return _Timer(self, name)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Report this process's metrics.
+
+        Returns:
+            Dict with "counters" and per-operation "latency" summaries
+        """
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "latency": {name: h.to_dict() for name, h in self._histograms.items()},
+            }
+
+    def maybe_dump(self) -> None:
+        """Dump if a dump file is configured and the interval has elapsed."""
+        if (
+            self.dump_path is not None
+            and time.monotonic() - self._last_dump >= self.dump_interval
+        ):
+            self.dump()
+
+    def dump(self) -> None:
+        """Merge metrics accumulated since the last dump into the dump file."""
+        if self.dump_path is None:
+            return
+
+        with self._lock:
+            counters = {
+                name: value - self._dumped_counters.get(name, 0)
+                for name, value in self._counters.items()
+            }
+            histograms = {}
+            for name, histogram in self._histograms.items():
+                current = histogram.to_dict()
+                previous = self._dumped_histograms.get(name)
+                if previous is not None:
+                    current = _histogram_delta(current, previous)
+                histograms[name] = current
+                self._dumped_histograms[name] = histogram.to_dict()
+            self._dumped_counters = dict(self._counters)
+            self._last_dump = time.monotonic()
+
+        try:
+            merge_metrics_file(str(self.dump_path), counters, histograms)
+        except (IOError, OSError):
+            # Metrics must never break capture.
+            pass
+
+
+# Metrics with a dump file, dumped once more by a single exit hook.
+_dump_at_exit: "weakref.WeakSet[CaptureMetrics]" = weakref.WeakSet()
+
+
+@atexit.register
+def _dump_live_metrics() -> None:
+    for metrics in list(_dump_at_exit):
+        metrics.dump()
+
+
+def _histogram_delta(current: Dict[str, Any], previous: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "count": current["count"] - previous["count"],
+        "sum_us": current["sum_us"] - previous["sum_us"],
+        "max_us": current["max_us"],
+        "buckets": [c - p for c, p in zip(current["buckets"], previous["buckets"])],
+    }
+
+
+def load_metrics_file(path: str) -> Dict[str, Any]:
+    """
+    Read an accumulated metrics file.
+
+    Args:
+        path: Path to metrics.json
+
+    Returns:
+        Dict with "counters" and "latency" summaries (empty if missing)
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (IOError, OSError, ValueError):
+        return {"counters": {}, "latency": {}}
+
+    latency = {}
+    for name, serialized in data.get("latency", {}).items():
+        histogram = Histogram()
+        histogram.merge(serialized)
+        latency[name] = histogram.to_dict()
+    return {"counters": dict(data.get("counters", {})), "latency": latency}
+
+
+def merge_metrics_file(
+    path: str, counters: Dict[str, int], histograms: Dict[str, Dict[str, Any]]
+) -> None:
+    """
+    Atomically add counter and histogram deltas into a metrics file.
+
+    The read-merge-replace runs under an exclusive lock so deltas dumped
+    concurrently by other processes are not lost.
+
+    Args:
+        path: Path to metrics.json
+        counters: Counter increments
+        histograms: Serialized histogram deltas
+
+    Raises:
+        IOError: If write fails
+    """
+    target = Path(path)
+    tmp_path = target.with_name(f".{target.name}.tmp")
+    with exclusive_lock(target):
+        data = load_metrics_file(path)
+        for name, value in counters.items():
+            data["counters"][name] = data["counters"].get(name, 0) + value
+        for name, serialized in histograms.items():
+            histogram = Histogram()
+            histogram.merge(data["latency"].get(name, {}))
+            histogram.merge(serialized)
+            data["latency"][name] = histogram.to_dict()
+
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, target)
+
+
+def metrics_from_env(log_path: str) -> Any:
+    """
+    Build the metrics sink selected by ``PAX_CAPTURE_METRICS``.
+
+    Unset, empty or "0" disables metrics. "1" enables them with dumps to
+    ``metrics.json`` next to the log; any other value is used as the dump
+    file path. ``PAX_CAPTURE_METRICS_INTERVAL`` sets the dump interval.
+
+    Args:
+        log_path: Path to episodes.jsonl
+
+    Returns:
+        CaptureMetrics, or NULL_METRICS when disabled
+    """
+    setting = os.environ.get(METRICS_ENV, "")
+    if setting in ("", "0"):
+        return NULL_METRICS
+
+    dump_path = metrics_path_for_log(log_path) if setting == "1" else setting
+    try:
+        interval = float(os.environ.get(METRICS_INTERVAL_ENV, DEFAULT_DUMP_INTERVAL))
+    except ValueError:
+        interval = DEFAULT_DUMP_INTERVAL
+    return CaptureMetrics(dump_path, interval)
+
+
+def metrics_path_for_log(log_path: str) -> str:
+    """Return the default metrics file beside an episodes log."""
+    return str(Path(log_path).parent / "metrics.json")
@@ -1,6 +1,14 @@
 """Provider adapters for capture-events skill."""
 
-__all__ = ["ProviderFacade", "UniversalProvider"]
+__all__ = [
+    "DiagnosticSnapshotCache",
+    "ProviderFacade",
+    "ProviderRegistry",
+    "UniversalProvider",
+    "get_registry",
+]
 
+from .diagnostic_diff import DiagnosticSnapshotCache
 from .facade import ProviderFacade
+from .registry import ProviderRegistry, get_registry
 from .universal import UniversalProvider
@@ -0,0 +1,204 @@
+"""Per-file diagnostic snapshots for recording only changes."""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from locking import exclusive_lock
+except ImportError:
+    from ..locking import exclusive_lock
+
+DIAGNOSTIC_SEVERITIES = ("error", "warning", "info")
+
+
+def diagnostic_key(line: int, message: str) -> str:
+    """
+    Identify a diagnostic within a file.
+
+    Args:
+        line: Line number
+        message: Diagnostic message
+
+    Returns:
+        "<line>:<message hash>" key
+    """
+    digest = hashlib.sha1(message.encode("utf-8")).hexdigest()[:16]
+    return f"{line}:{digest}"
+
+
+def normalize_diagnostic(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate one published diagnostic.
+
+    Args:
+        data: Dict with "line", "message" and optional "severity" (default "error")
+
+    Returns:
+        Dict with "line", "message" and "severity"
+
+    Raises:
+        ValueError: If the diagnostic is invalid
+    """
+    if not isinstance(data, dict):
+        raise ValueError("diagnostic must be a dict")
+
+    line = data.get("line", 1)
+    message = data.get("message")
+    severity = data.get("severity", "error")
+    if isinstance(line, bool) or not isinstance(line, int):
+        raise ValueError("diagnostic line must be an integer")
+    if not isinstance(message, str) or not message:
+        raise ValueError("diagnostic message must be a non-empty string")
+    if severity not in DIAGNOSTIC_SEVERITIES:
+        raise ValueError(
+            f"Unknown severity: {severity}. Valid options: {list(DIAGNOSTIC_SEVERITIES)}"
+        )
+
+    return {"line": line, "message": message, "severity": severity}
+
+
+class DiagnosticSnapshotCache:
+    """Last published diagnostic set for each file.
+
+    Language servers re-publish every diagnostic of a file on each change.
+    ``diff`` compares a new publication with the previous one, keyed by
+    (line, message hash), and reports only diagnostics that appeared or
+    disappeared. Open diagnostics remember when they were first seen so
+    resolutions can carry how long they stayed open. When ``filepath`` is
+    set the snapshots are persisted, so separate CLI processes share them;
+    ``save`` merges this instance's changed files into the file on disk so
+    concurrent processes do not overwrite each other's snapshots.
+    """
+
+    def __init__(self, filepath: Optional[str] = None):
+        """
+        Initialize snapshot cache.
+
+        Args:
+            filepath: Optional JSON file persisting the snapshots
+        """
+        self.filepath = Path(filepath) if filepath else None
+        self._files: Dict[str, Dict[str, Dict[str, Any]]] = self._load()
+        self._changed: Set[str] = set()
+
+    @classmethod
+    def for_log(cls, log_path: str) -> "DiagnosticSnapshotCache":
+        """
+        Create the cache persisted next to an episodes log.
+
+        Args:
+            log_path: Path to episodes.jsonl
+
+        Returns:
+            DiagnosticSnapshotCache for ``diagnostics.json`` in the log's directory
+        """
+        return cls(str(Path(log_path).parent / "diagnostics.json"))
+
+    def _load(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        if self.filepath is None:
+            return {}
+        try:
+            with open(self.filepath, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+        files = data.get("files") if isinstance(data, dict) else None
+        return files if isinstance(files, dict) else {}
+
+    def save(self) -> None:
+        """
+        Atomically persist the snapshots (no-op without a filepath).
+
+        Under an exclusive lock, the file is re-read and only the files
+        diffed since the last save are replaced, so snapshots saved meanwhile
+        by other processes are kept.
+
+        Raises:
+            IOError: If write fails
+        """
+        if self.filepath is None:
+            return
+
+        tmp_path = self.filepath.with_name(f".{self.filepath.name}.tmp")
+        try:
+            with exclusive_lock(self.filepath):
+                files = self._load()
+                for filepath in self._changed:
+                    if filepath in self._files:
+                        files[filepath] = self._files[filepath]
+                    else:
+                        files.pop(filepath, None)
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"version": 1, "files": files}, f, separators=(",", ":"))
+                os.replace(tmp_path, self.filepath)
+        except (IOError, OSError) as e:
+            raise IOError(f"Failed to save diagnostic snapshots: {e}")
+
+        self._files = files
+        self._changed.clear()
+
+    def open_diagnostics(self, filepath: str) -> List[Dict[str, Any]]:
+        """
+        Return the diagnostics currently open for a file.
+
+        Args:
+            filepath: File path
+
+        Returns:
+            List of dicts with "line", "message", "severity" and "first_seen"
+        """
+        return [dict(entry) for entry in self._files.get(filepath, {}).values()]
+
+    def diff(
+        self,
+        filepath: str,
+        diagnostics: Iterable[Dict[str, Any]],
+        timestamp: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], int]:
+        """
+        Replace a file's snapshot and report what changed.
+
+        Args:
+            filepath: File the diagnostics were published for
+            diagnostics: Complete current set (see ``normalize_diagnostic``);
+                an empty set resolves everything open for the file
+            timestamp: ISO 8601 time of the publication (default: now)
+
+        Returns:
+            (added, resolved, unchanged) where added and resolved are lists of
+            diagnostic dicts (with "first_seen") and unchanged is a count
+
+        Raises:
+            ValueError: If a diagnostic is invalid
+        """
+        timestamp = timestamp or datetime.utcnow().isoformat()
+        previous = self._files.get(filepath, {})
+        current: Dict[str, Dict[str, Any]] = {}
+        added = []
+
+        for data in diagnostics:
+            diagnostic = normalize_diagnostic(data)
+            key = diagnostic_key(diagnostic["line"], diagnostic["message"])
+            if key in current:
+                continue
+            if key in previous:
+                current[key] = previous[key]
+            else:
+                diagnostic["first_seen"] = timestamp
+                current[key] = diagnostic
+                added.append(diagnostic)
+
+        resolved = [entry for key, entry in previous.items() if key not in current]
+        unchanged = len(current) - len(added)
+
+        if current:
+            self._files[filepath] = current
+        else:
+            self._files.pop(filepath, None)
+        self._changed.add(filepath)
+
+        return added, resolved, unchanged
@@ -2,25 +2,48 @@
 
 import os
 import sys
-from typing import Optional
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 try:
-    from universal import UniversalProvider
+    from diagnostic_diff import DiagnosticSnapshotCache
+    from registry import get_registry
+    from sampling import SamplingPolicy
 except ImportError:
-    from .universal import UniversalProvider
+    from .diagnostic_diff import DiagnosticSnapshotCache
+    from .registry import get_registry
+    from .sampling import SamplingPolicy
 
 
 class ProviderDetector:
-    """Detect which provider/assistant is available."""
+    """Detect which provider/assistant is available.
 
-    @staticmethod
-    def detect() -> str:
+    The environment is inspected once per process; call ``cache_clear`` after
+    changing the relevant variables.
+    """
+
+    _detected: Optional[str] = None
+
+    @classmethod
+    def detect(cls) -> str:
         """
-        Detect active provider.
+        Detect active provider (memoized).
 
         Returns:
             Provider name: "copilot", "codex", "cursor", or "universal" (default)
         """
+        if cls._detected is None:
+            cls._detected = cls._detect_from_environment()
+        return cls._detected
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Forget the memoized detection result."""
+        cls._detected = None
+
+    @staticmethod
+    def _detect_from_environment() -> str:
         # Check for GitHub Copilot in VS Code environment
         if "GITHUB_COPILOT_AGENT" in os.environ:
             return "copilot"
@@ -46,49 +69,88 @@ class ProviderDetector:
 class ProviderFacade:
     """Facade for provider-agnostic event capture."""
 
-    def __init__(self, provider: Optional[str] = None):
+    # Bound on skill invocations awaiting an outcome, as in SpanPairer.
+    DEFAULT_MAX_OPEN_SPANS = 10000
+
+    def __init__(
+        self,
+        provider: Optional[str] = None,
+        sampling: Optional[SamplingPolicy] = None,
+        diagnostics: Optional[DiagnosticSnapshotCache] = None,
+        max_open_spans: int = DEFAULT_MAX_OPEN_SPANS,
+    ):
         """
         Initialize provider facade.
 
         Args:
             provider: Explicit provider name or None to auto-detect.
-                     Valid values: "universal", "copilot", "codex", "cursor"
+                     Valid values: "universal", "copilot", "codex", "cursor",
+                     or any provider registered in the provider registry
+            sampling: Optional sampling policy applied to every captured event
+            diagnostics: Snapshot cache for ``capture_diagnostic_snapshot``
+                (default: in-memory)
+            max_open_spans: Maximum skill invocations remembered for pairing
+                with an outcome; the oldest is forgotten past this bound
         """
         if provider is None:
             provider = ProviderDetector.detect()
 
         self.provider_name = provider
+        self.sampling = sampling
+        self.diagnostics = diagnostics if diagnostics is not None else DiagnosticSnapshotCache()
         self._provider = self._create_provider(provider)
+        self.max_open_spans = max_open_spans
+        self._open_spans: Dict[str, List[str]] = {}
+        # Every open span id, oldest first, mapped to its skill name.
+        self._span_order: "OrderedDict[str, str]" = OrderedDict()
+
+    @property
+    def provider(self):
+        """Underlying provider, for building events without sampling."""
+        return self._provider
+
+    def _admit(self, event):
+        """Apply the sampling policy, returning the event or None."""
+        if self.sampling is None:
+            return event
+        return self.sampling.admit(event)
+
+    def drain_samples(self) -> List:
+        """
+        Return sampled events released since the last call.
+
+        Returns:
+            Events from closed reservoir windows, ready to be stored
+        """
+        if self.sampling is None:
+            return []
+        return self.sampling.drain()
+
+    def flush_samples(self) -> List:
+        """
+        Close open sampling windows and return every pending event.
+
+        Returns:
+            Events ready to be stored
+        """
+        if self.sampling is None:
+            return []
+        return self.sampling.flush()
 
     def _create_provider(self, provider: str):
         """
-        Create provider instance.
+        Look up the shared provider instance.
 
         Args:
             provider: Provider name
 
         Returns:
-            Provider instance
+            Provider instance from the process-wide registry
 
         Raises:
             ValueError: If provider is unknown
         """
-        if provider == "universal":
-            return UniversalProvider()
-        elif provider == "copilot":
-            # TODO: Implement Copilot provider (wi-004)
-            return UniversalProvider()  # Fall back to universal
-        elif provider == "codex":
-            # TODO: Implement Codex provider (wi-004)
-            return UniversalProvider()  # Fall back to universal
-        elif provider == "cursor":
-            # TODO: Implement Cursor provider (wi-004)
-            return UniversalProvider()  # Fall back to universal
-        else:
-            raise ValueError(
-                f"Unknown provider: {provider}. "
-                'Valid options: "universal", "copilot", "codex", "cursor"'
-            )
+        return get_registry().get(provider)
 
     def capture_file_event(self, event_type: str, filepath: str) -> dict:
         """
@@ -99,12 +161,18 @@ class ProviderFacade:
             filepath: Path to file
 
         Returns:
-            Event dict
+            Event instance, or None if sampled out
         """
-        return self._provider.capture_file_event(event_type, filepath)
+        return self._admit(self._provider.capture_file_event(event_type, filepath))
 
     def capture_terminal_event(
-        self, event_type: str, command: str, output: str = "", error: str = ""
+        self,
+        event_type: str,
+        command: str,
+        output: str = "",
+        error: str = "",
+        exit_code: Optional[int] = None,
+        duration_ms: Optional[float] = None,
     ) -> dict:
         """
         Capture terminal event.
@@ -114,11 +182,17 @@ class ProviderFacade:
             command: Command executed
             output: Command output (if any)
             error: Error output (if any)
+            exit_code: Process exit status (if known)
+            duration_ms: Run time in milliseconds (if known)
 
         Returns:
-            Event dict
+            Event instance, or None if sampled out
         """
-        return self._provider.capture_terminal_event(event_type, command, output, error)
+        return self._admit(
+            self._provider.capture_terminal_event(
+                event_type, command, output, error, exit_code, duration_ms
+            )
+        )
 
     def capture_diagnostic_event(
         self, event_type: str, file: str, line: int, message: str
@@ -133,20 +207,116 @@ class ProviderFacade:
             message: Diagnostic message
 
         Returns:
-            Event dict
+            Event instance, or None if sampled out
+        """
+        return self._admit(
+            self._provider.capture_diagnostic_event(event_type, file, line, message)
+        )
+
+    def capture_diagnostic_snapshot(
+        self, file: str, diagnostics: Iterable[Dict[str, Any]]
+    ) -> Tuple[List, int]:
+        """
+        Capture only the changes in a file's published diagnostic set.
+
+        New diagnostics become ``diagnostic_<severity>`` events; diagnostics
+        missing from the set become ``diagnostic_resolved`` events carrying
+        ``first_seen`` and ``open_seconds``. Diagnostics already open are not
+        recorded again.
+
+        The diff is committed to the snapshot cache as it is computed, so its
+        events bypass sampling: a dropped event could never be re-emitted,
+        and a lost resolution would take its time-to-fix with it.
+
+        Args:
+            file: File path the diagnostics were published for
+            diagnostics: Complete current set of {"line", "message", "severity"}
+
+        Returns:
+            (added and resolved events, number of unchanged diagnostics)
+
+        Raises:
+            ValueError: If a diagnostic is invalid
         """
-        return self._provider.capture_diagnostic_event(event_type, file, line, message)
+        now = datetime.utcnow()
+        timestamp = now.isoformat()
+        added, resolved, unchanged = self.diagnostics.diff(file, diagnostics, timestamp)
+
+        events = []
+        for diagnostic in added:
+            events.append(
+                self._provider.capture_diagnostic_event(
+                    f"diagnostic_{diagnostic['severity']}",
+                    file,
+                    diagnostic["line"],
+                    diagnostic["message"],
+                )
+            )
+        for diagnostic in resolved:
+            event = self._provider.capture_diagnostic_event(
+                "diagnostic_resolved",
+                file,
+                diagnostic["line"],
+                diagnostic["message"],
+                diagnostic["severity"],
+            )
+            event.metadata["first_seen"] = diagnostic["first_seen"]
+            try:
+                opened = datetime.fromisoformat(diagnostic["first_seen"])
+                event.metadata["open_seconds"] = round((now - opened).total_seconds(), 3)
+            except (TypeError, ValueError):
+                pass
+            events.append(event)
 
-    def capture_skill_event(self, event_type: str, skill_name: str, status: str) -> dict:
+        for event in events:
+            event.timestamp = timestamp
+        return events, unchanged
+
+    def capture_skill_event(
+        self, event_type: str, skill_name: str, status: str, span_id: Optional[str] = None
+    ) -> dict:
         """
         Capture skill invocation event.
 
+        Every invocation gets a span id (generated unless given). An outcome
+        without one closes the most recent invocation of the same skill
+        opened through this facade, so in-process callers get paired spans
+        for free; separate processes must pass the id along. At most
+        ``max_open_spans`` invocations are remembered; past that the oldest
+        is forgotten and its outcome needs an explicit span id.
+
         Args:
             event_type: "skill_invoke", "skill_complete", or "skill_error"
             skill_name: Name of the skill
             status: Status message
+            span_id: Id pairing an invocation with its outcome
 
         Returns:
-            Event dict
+            Event instance, or None if sampled out
         """
-        return self._provider.capture_skill_event(event_type, skill_name, status)
+        open_spans = self._open_spans.setdefault(skill_name, [])
+        if event_type == "skill_invoke":
+            span_id = span_id or os.urandom(8).hex()
+            open_spans.append(span_id)
+            self._span_order[span_id] = skill_name
+        elif span_id:
+            if span_id in open_spans:
+                open_spans.remove(span_id)
+                self._span_order.pop(span_id, None)
+        elif open_spans:
+            span_id = open_spans.pop()
+            self._span_order.pop(span_id, None)
+        if not open_spans:
+            del self._open_spans[skill_name]
+
+        while len(self._span_order) > self.max_open_spans:
+            oldest, oldest_skill = self._span_order.popitem(last=False)
+            stack = self._open_spans.get(oldest_skill)
+            if stack and oldest in stack:
+                stack.remove(oldest)
+                if not stack:
+                    del self._open_spans[oldest_skill]
+
+        return self._admit(
+            self._provider.capture_skill_event(event_type, skill_name, status, span_id)
+        )
@@ -0,0 +1,182 @@
+"""Process-wide registry of capture providers with lazy plugin loading."""
+
+import importlib
+import os
+import threading
+from typing import Any, Dict, List, Optional, Union
+
+ENTRY_POINT_GROUP = "pax.capture_providers"
+
+# Set to "1" to let installed plugins replace built-in providers of the same
+# name. Off by default: deciding that needs a full entry-point scan, which
+# would otherwise be paid on every built-in lookup.
+PLUGIN_OVERRIDE_ENV = "PAX_CAPTURE_PLUGIN_OVERRIDE"
+
+# Built-in providers as "module:attribute" specs relative to this package.
+# Copilot, Codex and Cursor fall back to the universal provider until their
+# dedicated adapters exist (wi-004); see PLUGIN_OVERRIDE_ENV to replace them.
+BUILTIN_PROVIDERS = {
+    "universal": "universal:UniversalProvider",
+    "copilot": "universal:UniversalProvider",
+    "codex": "universal:UniversalProvider",
+    "cursor": "universal:UniversalProvider",
+}
+
+
+def _import_spec(spec: str) -> Any:
+    """Resolve a built-in "module:attribute" spec."""
+    module_name, _, attribute = spec.partition(":")
+    if __package__:
+        module = importlib.import_module(f".{module_name}", __package__)
+    else:
+        module = importlib.import_module(module_name)
+    return getattr(module, attribute)
+
+
+def _plugin_entry_points() -> Dict[str, Any]:
+    """Discover provider plugins advertised under ENTRY_POINT_GROUP."""
+    try:
+        from importlib import metadata
+    except ImportError:
+        return {}
+
+    try:
+        discovered = metadata.entry_points()
+    except Exception:
+        # A broken distribution must not prevent capture.
+        return {}
+
+    if hasattr(discovered, "select"):
+        group = discovered.select(group=ENTRY_POINT_GROUP)
+    else:
+        group = discovered.get(ENTRY_POINT_GROUP, [])
+    return {entry_point.name: entry_point for entry_point in group}
+
+
+class ProviderRegistry:
+    """Lazily loaded, shared provider instances.
+
+    Providers are registered by name as a class, a factory, or a
+    ``"module:attribute"`` spec; nothing is imported until the provider is
+    first requested. Entry points in the ``pax.capture_providers`` group are
+    enumerated once, on the first lookup that neither an explicit
+    registration nor a built-in satisfies, and a plugin module is only
+    imported when its provider is requested, so built-in lookups never pay
+    for the scan and installed plugins cost nothing when unused.
+
+    Providers hold no per-capture state, so one instance per name is shared
+    by every ``ProviderFacade`` in the process.
+    """
+
+    def __init__(
+        self, builtins: Optional[Dict[str, str]] = None, plugins_override: bool = False
+    ):
+        """
+        Initialize provider registry.
+
+        Args:
+            builtins: Mapping of provider name to "module:attribute" spec
+                (default: BUILTIN_PROVIDERS)
+            plugins_override: If True, an installed plugin replaces the
+                built-in provider of the same name; built-in lookups then
+                scan entry points first
+        """
+        self._specs: Dict[str, Any] = dict(BUILTIN_PROVIDERS if builtins is None else builtins)
+        self._registered: Dict[str, Any] = {}
+        self._instances: Dict[str, Any] = {}
+        self._plugins: Optional[Dict[str, Any]] = None
+        self._plugins_override = plugins_override
+        self._lock = threading.Lock()
+
+    def register(self, name: str, target: Union[str, Any]) -> None:
+        """
+        Register (or replace) a provider.
+
+        Args:
+            name: Provider name
+            target: Provider class or factory, or a "module:attribute" spec
+                relative to this package; takes precedence over plugins
+        """
+        with self._lock:
+            self._registered[name] = target
+            self._instances.pop(name, None)
+
+    def _discover_plugins(self) -> Dict[str, Any]:
+        if self._plugins is None:
+            self._plugins = _plugin_entry_points()
+        return self._plugins
+
+    def names(self) -> List[str]:
+        """
+        List known provider names without importing them.
+
+        Returns:
+            Sorted provider names, including discovered plugins
+        """
+        with self._lock:
+            return sorted(self._known(self._discover_plugins()))
+
+    def _known(self, plugins: Dict[str, Any]) -> set:
+        return set(self._specs) | set(self._registered) | set(plugins)
+
+    def _load_factory(self, name: str) -> Any:
+        # Precedence: explicit registration, built-in, installed plugin; with
+        # plugins_override a plugin comes before the built-in.
+        if name in self._registered:
+            target = self._registered[name]
+            return _import_spec(target) if isinstance(target, str) else target
+
+        if name in self._specs and not self._plugins_override:
+            return _import_spec(self._specs[name])
+
+        plugins = self._discover_plugins()
+        if name in plugins:
+            return plugins[name].load()
+
+        if name not in self._specs:
+            valid = ", ".join(f'"{n}"' for n in sorted(self._known(plugins)))
+            raise ValueError(f"Unknown provider: {name}. Valid options: {valid}")
+
+        return _import_spec(self._specs[name])
+
+    def get(self, name: str) -> Any:
+        """
+        Return the shared provider instance for a name, creating it on first use.
+
+        Args:
+            name: Provider name
+
+        Returns:
+            Provider instance
+
+        Raises:
+            ValueError: If provider is unknown
+        """
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            if name not in self._instances:
+                self._instances[name] = self._load_factory(name)()
+            return self._instances[name]
+
+    def reset(self) -> None:
+        """Drop explicit registrations, cached instances and plugin discovery results."""
+        with self._lock:
+            self._registered.clear()
+            self._instances.clear()
+            self._plugins = None
+
+
+_registry = ProviderRegistry(plugins_override=os.environ.get(PLUGIN_OVERRIDE_ENV) == "1")
+
+
+def get_registry() -> ProviderRegistry:
+    """
+    Return the process-wide provider registry.
+
+    Returns:
+        Shared ProviderRegistry instance
+    """
+    return _registry
@@ -0,0 +1,462 @@
+"""Sampling policies that bound capture volume for noisy event types."""
+
+import fnmatch
+import json
+import os
+import random
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from event_schema import Event
+except ImportError:
+    from ..event_schema import Event
+
+SAMPLING_MODES = ("probability", "token_bucket", "reservoir")
+
+# Modes whose decisions depend on earlier events and so need state carried
+# between processes (see ``SamplingPolicy.save_state``).
+STATEFUL_MODES = ("token_bucket", "reservoir")
+
+
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens per second up to ``burst``."""
+
+    def __init__(self, rate: float, burst: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum tokens held (initially full)
+            clock: Monotonic time source
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("token bucket needs rate > 0 and burst >= 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = burst
+        self._updated = clock()
+
+    def allow(self) -> bool:
+        """
+        Take one token if available.
+
+        Returns:
+            True if the caller may proceed
+        """
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+
+class SamplingRule:
+    """Sampling rule for one event type.
+
+    Exactly one mechanism is used per rule:
+
+    - ``probability``: keep each event with probability ``probability``;
+      kept events carry ``sample_weight = 1 / probability``.
+    - ``token_bucket``: keep at most ``rate`` events/sec with bursts of
+      ``burst``; each kept event's ``sample_weight`` counts itself plus the
+      events dropped since the previous kept one.
+    - ``reservoir``: keep a uniform sample of ``size`` events per ``window``
+      seconds; samples are released when the window closes with
+      ``sample_weight = seen / kept``.
+
+    Summing ``sample_weight`` (treating unweighted events as 1) therefore
+    reconstructs the original event counts.
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        probability: float = 1.0,
+        rate: float = 10.0,
+        burst: float = 10.0,
+        size: int = 100,
+        window: float = 60.0,
+        paths: Optional[List[str]] = None,
+    ):
+        """
+        Initialize sampling rule.
+
+        Args:
+            mode: "probability", "token_bucket" or "reservoir"
+            probability: Keep probability for "probability" mode
+            rate: Events per second for "token_bucket" mode
+            burst: Bucket capacity for "token_bucket" mode
+            size: Samples per window for "reservoir" mode
+            window: Window length in seconds for "reservoir" mode
+            paths: Optional glob patterns; if given, the rule only applies to
+                events whose metadata filepath matches one of them
+
+        Raises:
+            ValueError: If the configuration is invalid
+        """
+        if mode not in SAMPLING_MODES:
+            raise ValueError(
+                f"Unknown sampling mode: {mode}. Valid options: {list(SAMPLING_MODES)}"
+            )
+        if mode == "probability" and not 0 < probability <= 1:
+            raise ValueError("probability must be in (0, 1]")
+        if mode == "reservoir" and (size < 1 or window <= 0):
+            raise ValueError("reservoir needs size >= 1 and window > 0")
+
+        self.mode = mode
+        self.probability = probability
+        self.rate = rate
+        self.burst = burst
+        self.size = size
+        self.window = window
+        self.paths = list(paths or [])
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SamplingRule":
+        """
+        Create rule from a config dict.
+
+        Args:
+            data: Dict with "mode" and mode-specific keys
+
+        Returns:
+            SamplingRule instance
+
+        Raises:
+            ValueError: If the configuration is invalid
+        """
+        if not isinstance(data, dict) or "mode" not in data:
+            raise ValueError("sampling rule must be a dict with a 'mode' key")
+
+        allowed = {"mode", "probability", "rate", "burst", "size", "window", "paths"}
+        unknown = set(data) - allowed
+        if unknown:
+            raise ValueError(f"Unknown sampling rule keys: {sorted(unknown)}")
+
+        return cls(**data)
+
+    def applies_to(self, event: Event) -> bool:
+        """Check whether the rule's path patterns cover the event."""
+        if not self.paths:
+            return True
+
+        filepath = event.metadata.get("filepath")
+        return isinstance(filepath, str) and any(
+            fnmatch.fnmatch(filepath, pattern) for pattern in self.paths
+        )
+
+
+class _RuleState:
+    """Mutable per-rule sampling state."""
+
+    def __init__(self, rule: SamplingRule, clock: Callable[[], float]):
+        self.bucket = (
+            TokenBucket(rule.rate, rule.burst, clock) if rule.mode == "token_bucket" else None
+        )
+        self.dropped_since_kept = 0
+        self.window_start = clock()
+        self.window_seen = 0
+        self.reservoir: List[Event] = []
+
+
+class SamplingPolicy:
+    """Per-event-type sampling applied by ``ProviderFacade``.
+
+    Event types without a rule are always kept unchanged. Counters of seen,
+    kept and dropped events are tracked per event type and exposed through
+    ``stats``.
+    """
+
+    def __init__(
+        self,
+        rules: Dict[str, Any],
+        seed: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize sampling policy.
+
+        Args:
+            rules: Mapping of event type value to SamplingRule or rule dict
+            seed: Optional random seed for reproducible sampling
+            clock: Monotonic time source
+
+        Raises:
+            ValueError: If a rule is invalid
+        """
+        self.rules = {
+            event_type: rule if isinstance(rule, SamplingRule) else SamplingRule.from_dict(rule)
+            for event_type, rule in rules.items()
+        }
+        self._random = random.Random(seed)
+        self._clock = clock
+        self._state = {
+            event_type: _RuleState(rule, clock) for event_type, rule in self.rules.items()
+        }
+        self._ready: List[Event] = []
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs: Any) -> "SamplingPolicy":
+        """
+        Load policy from a JSON file of ``{"event_type": {rule}}`` entries.
+
+        Args:
+            path: Path to sampling.json
+            **kwargs: Passed to the constructor
+
+        Returns:
+            SamplingPolicy instance
+
+        Raises:
+            ValueError: If the file is not valid JSON or a rule is invalid
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                rules = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid sampling config {path}: {e}")
+
+        if not isinstance(rules, dict):
+            raise ValueError(f"Sampling config {path} must be a JSON object")
+
+        try:
+            return cls(rules, **kwargs)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid sampling config {path}: {e}")
+
+    def _count(self, event_type: str, key: str, amount: int = 1) -> None:
+        counters = self._stats.setdefault(event_type, {"seen": 0, "kept": 0, "dropped": 0})
+        counters[key] += amount
+
+    def admit(self, event: Event) -> Optional[Event]:
+        """
+        Decide whether to keep an event.
+
+        Args:
+            event: Captured event
+
+        Returns:
+            The event (with ``sample_weight`` metadata if a rule applied), or
+            None if it was dropped or held in a reservoir until its window
+            closes (see ``drain``)
+        """
+        event_type = event.event_type.value
+        self._count(event_type, "seen")
+        rule = self.rules.get(event_type)
+
+        if rule is None or not rule.applies_to(event):
+            self._count(event_type, "kept")
+            return event
+
+        state = self._state[event_type]
+
+        if rule.mode == "probability":
+            if rule.probability < 1 and self._random.random() >= rule.probability:
+                self._count(event_type, "dropped")
+                return None
+            return self._keep(event, 1 / rule.probability)
+
+        if rule.mode == "token_bucket":
+            if not state.bucket.allow():
+                state.dropped_since_kept += 1
+                self._count(event_type, "dropped")
+                return None
+            weight = state.dropped_since_kept + 1
+            state.dropped_since_kept = 0
+            return self._keep(event, weight)
+
+        # Reservoir: Algorithm R over the current window.
+        if self._clock() - state.window_start >= rule.window:
+            self._close_window(event_type)
+        state.window_seen += 1
+        if len(state.reservoir) < rule.size:
+            state.reservoir.append(event)
+        else:
+            slot = self._random.randrange(state.window_seen)
+            if slot < rule.size:
+                state.reservoir[slot] = event
+        return None
+
+    def _keep(self, event: Event, weight: float) -> Event:
+        event.metadata["sample_weight"] = weight
+        self._count(event.event_type.value, "kept")
+        return event
+
+    def _close_window(self, event_type: str) -> None:
+        state = self._state[event_type]
+        if state.reservoir:
+            weight = state.window_seen / len(state.reservoir)
+            for event in state.reservoir:
+                self._ready.append(self._keep(event, weight))
+            self._count(event_type, "dropped", state.window_seen - len(state.reservoir))
+
+        state.reservoir = []
+        state.window_seen = 0
+        state.window_start = self._clock()
+
+    def drain(self) -> List[Event]:
+        """
+        Return reservoir samples whose window has closed.
+
+        Windows that have run their full length are closed here as well, so
+        samples are released even if no further event of that type arrives.
+
+        Returns:
+            Events ready to be stored, in window order
+        """
+        now = self._clock()
+        for event_type, rule in self.rules.items():
+            state = self._state[event_type]
+            if rule.mode == "reservoir" and state.window_seen:
+                if now - state.window_start >= rule.window:
+                    self._close_window(event_type)
+        ready, self._ready = self._ready, []
+        return ready
+
+    def flush(self) -> List[Event]:
+        """
+        Close every open reservoir window and return all pending samples.
+
+        Returns:
+            Events ready to be stored
+        """
+        for event_type, rule in self.rules.items():
+            if rule.mode == "reservoir":
+                self._close_window(event_type)
+        return self.drain()
+
+    @property
+    def stateful(self) -> bool:
+        """True if any rule depends on events seen by earlier processes."""
+        return any(rule.mode in STATEFUL_MODES for rule in self.rules.values())
+
+    def save_state(self, path: str) -> None:
+        """
+        Atomically persist token buckets and open reservoir windows.
+
+        Clock readings are stored as ages relative to the wall clock, because
+        monotonic clocks are not comparable between processes. Call
+        ``drain`` first: released samples are not part of the state.
+
+        Args:
+            path: Path to sampling-state.json
+
+        Raises:
+            IOError: If the state cannot be written
+        """
+        now = self._clock()
+        rules: Dict[str, Dict[str, Any]] = {}
+        for event_type, rule in self.rules.items():
+            state = self._state[event_type]
+            if rule.mode == "token_bucket":
+                rules[event_type] = {
+                    "mode": rule.mode,
+                    "tokens": state.bucket._tokens,
+                    "age": now - state.bucket._updated,
+                    "dropped_since_kept": state.dropped_since_kept,
+                }
+            elif rule.mode == "reservoir":
+                rules[event_type] = {
+                    "mode": rule.mode,
+                    "age": now - state.window_start,
+                    "seen": state.window_seen,
+                    "reservoir": [event.to_dict() for event in state.reservoir],
+                }
+
+        target = Path(path)
+        tmp_path = target.with_name(f".{target.name}.tmp")
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": 1, "saved_at": time.time(), "rules": rules},
+                    f,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp_path, target)
+        except (IOError, OSError) as e:
+            raise IOError(f"Failed to save sampling state: {e}")
+
+    def load_state(self, path: str) -> None:
+        """
+        Restore state written by ``save_state``.
+
+        Missing or unreadable files, and entries whose rule has since changed
+        mode, are ignored: those rules simply start fresh.
+
+        Args:
+            path: Path to sampling-state.json
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            saved = data["rules"]
+            elapsed = max(0.0, time.time() - float(data["saved_at"]))
+        except (IOError, OSError, ValueError, TypeError, KeyError):
+            return
+
+        now = self._clock()
+        for event_type, entry in saved.items():
+            rule = self.rules.get(event_type)
+            if rule is None or not isinstance(entry, dict) or entry.get("mode") != rule.mode:
+                continue
+            state = self._state[event_type]
+            try:
+                if rule.mode == "token_bucket":
+                    state.bucket._tokens = min(rule.burst, float(entry["tokens"]))
+                    state.bucket._updated = now - elapsed - float(entry["age"])
+                    state.dropped_since_kept = int(entry["dropped_since_kept"])
+                elif rule.mode == "reservoir":
+                    reservoir = [Event.from_dict(item) for item in entry["reservoir"]]
+                    state.reservoir = reservoir[: rule.size]
+                    state.window_seen = max(int(entry["seen"]), len(state.reservoir))
+                    state.window_start = now - elapsed - float(entry["age"])
+            except (KeyError, TypeError, ValueError):
+                self._state[event_type] = _RuleState(rule, self._clock)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Report sampling counters per event type.
+
+        Returns:
+            Dict mapping event type to {"seen", "kept", "dropped"} counts
+        """
+        return {event_type: dict(counters) for event_type, counters in self._stats.items()}
+
+
+def load_policy_for_log(log_path: str) -> Optional[SamplingPolicy]:
+    """
+    Load ``sampling.json`` from the episodes log directory, if present.
+
+    Args:
+        log_path: Path to episodes.jsonl
+
+    Returns:
+        SamplingPolicy, or None if no config file exists
+    """
+    config = Path(log_path).parent / "sampling.json"
+    if not config.exists():
+        return None
+    return SamplingPolicy.from_file(str(config))
+
+
+def sampling_state_path(log_path: str) -> str:
+    """
+    Get the sampler state file that lives next to an episodes log.
+
+    Args:
+        log_path: Path to episodes.jsonl
+
+    Returns:
+        Path to ``sampling-state.json`` in the log's directory
+    """
+    return str(Path(log_path).parent / "sampling-state.json")
@@ -1,6 +1,5 @@
 """Universal provider for workspace-only event capture."""
 
-from datetime import datetime
 from typing import Any, Dict, Optional
 
 try:
@@ -27,18 +26,20 @@ class FileWatcher:
         if event_type not in ("file_create", "file_modify", "file_delete"):
             raise ValueError(f"Unknown file event type: {event_type}")
 
-        return {
-            "filepath": filepath,
-            "event_type": event_type,
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+        return {"filepath": filepath}
 
 
 class TerminalListener:
     """Capture terminal command execution."""
 
     @staticmethod
-    def capture_execution(command: str, output: str = "", error: str = "") -> Dict[str, Any]:
+    def capture_execution(
+        command: str,
+        output: str = "",
+        error: str = "",
+        exit_code: Optional[int] = None,
+        duration_ms: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """
         Capture terminal command execution.
 
@@ -46,17 +47,25 @@ class TerminalListener:
             command: Command executed
             output: Command output
             error: Error output
+            exit_code: Process exit status, if known
+            duration_ms: Wall-clock run time in milliseconds, if known
 
         Returns:
             Metadata dict
         """
-        return {
+        metadata = {
             "command": command,
             "output": output[:500],  # Limit output size
             "error": error[:500],    # Limit error size
-            "timestamp": datetime.utcnow().isoformat(),
         }
 
+        if exit_code is not None:
+            metadata["exit_code"] = exit_code
+        if duration_ms is not None:
+            metadata["duration_ms"] = duration_ms
+
+        return metadata
+
 
 class DiagnosticCollector:
     """Collect VS Code diagnostic events."""
@@ -69,16 +78,20 @@ class DiagnosticCollector:
         Capture diagnostic event.
 
         Args:
-            event_type: "diagnostic_error", "diagnostic_warning", or "diagnostic_info"
+            event_type: "diagnostic_error", "diagnostic_warning", "diagnostic_info",
+                or "diagnostic_resolved"
             filepath: File path with diagnostic
             line: Line number (1-indexed)
             message: Diagnostic message
-            severity: Optional severity override
+            severity: Optional severity override (for resolved diagnostics,
+                the severity they had while open)
 
         Returns:
             Metadata dict
         """
-        if event_type not in ("diagnostic_error", "diagnostic_warning", "diagnostic_info"):
+        if event_type not in (
+            "diagnostic_error", "diagnostic_warning", "diagnostic_info", "diagnostic_resolved"
+        ):
             raise ValueError(f"Unknown diagnostic event type: {event_type}")
 
         if severity is None:
@@ -89,7 +102,6 @@ class DiagnosticCollector:
             "line": line,
             "message": message,
             "severity": severity,
-            "timestamp": datetime.utcnow().isoformat(),
         }
 
 
@@ -97,7 +109,12 @@ class SkillTracker:
     """Track skill invocations and completions."""
 
     @staticmethod
-    def capture_invocation(skill_name: str, status: str, details: Optional[Dict] = None) -> Dict[str, Any]:
+    def capture_invocation(
+        skill_name: str,
+        status: str,
+        details: Optional[Dict] = None,
+        span_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Capture skill invocation event.
 
@@ -105,6 +122,7 @@ class SkillTracker:
             skill_name: Name of the skill
             status: Status message or skill outcome
             details: Additional details dict
+            span_id: Id shared by an invocation and its outcome
 
         Returns:
             Metadata dict
@@ -112,12 +130,14 @@ class SkillTracker:
         metadata = {
             "skill_name": skill_name,
             "status": status,
-            "timestamp": datetime.utcnow().isoformat(),
         }
 
         if details:
             metadata["details"] = details
 
+        if span_id:
+            metadata["span_id"] = span_id
+
         return metadata
 
 
@@ -148,7 +168,13 @@ class UniversalProvider:
         return Event(event_type_enum, "universal", metadata)
 
     def capture_terminal_event(
-        self, event_type: str, command: str, output: str = "", error: str = ""
+        self,
+        event_type: str,
+        command: str,
+        output: str = "",
+        error: str = "",
+        exit_code: Optional[int] = None,
+        duration_ms: Optional[float] = None,
     ) -> Event:
         """
         Capture terminal event.
@@ -158,36 +184,51 @@ class UniversalProvider:
             command: Command executed
             output: Command output
             error: Error output
+            exit_code: Process exit status, if known
+            duration_ms: Wall-clock run time in milliseconds, if known
 
         Returns:
             Event instance
         """
         event_type_enum = EventType(event_type)
-        metadata = self.terminal_listener.capture_execution(command, output, error)
+        metadata = self.terminal_listener.capture_execution(
+            command, output, error, exit_code, duration_ms
+        )
 
         return Event(event_type_enum, "universal", metadata)
 
     def capture_diagnostic_event(
-        self, event_type: str, filepath: str, line: int, message: str
+        self,
+        event_type: str,
+        filepath: str,
+        line: int,
+        message: str,
+        severity: Optional[str] = None,
     ) -> Event:
         """
         Capture diagnostic event.
 
         Args:
-            event_type: "diagnostic_error", "diagnostic_warning", or "diagnostic_info"
+            event_type: "diagnostic_error", "diagnostic_warning", "diagnostic_info",
+                or "diagnostic_resolved"
             filepath: File path with diagnostic
             line: Line number
             message: Diagnostic message
+            severity: Optional severity override
 
         Returns:
             Event instance
         """
         event_type_enum = EventType(event_type)
-        metadata = self.diagnostic_collector.capture_diagnostic(event_type, filepath, line, message)
+        metadata = self.diagnostic_collector.capture_diagnostic(
+            event_type, filepath, line, message, severity
+        )
 
         return Event(event_type_enum, "universal", metadata)
 
-    def capture_skill_event(self, event_type: str, skill_name: str, status: str) -> Event:
+    def capture_skill_event(
+        self, event_type: str, skill_name: str, status: str, span_id: Optional[str] = None
+    ) -> Event:
         """
         Capture skill invocation event.
 
@@ -195,11 +236,12 @@ class UniversalProvider:
             event_type: "skill_invoke", "skill_complete", or "skill_error"
             skill_name: Name of the skill
             status: Status message
+            span_id: Id pairing an invocation with its outcome
 
         Returns:
             Event instance
         """
         event_type_enum = EventType(event_type)
-        metadata = self.skill_tracker.capture_invocation(skill_name, status)
+        metadata = self.skill_tracker.capture_invocation(skill_name, status, span_id=span_id)
 
         return Event(event_type_enum, "universal", metadata)
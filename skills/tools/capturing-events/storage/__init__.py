@@ -1,5 +1,58 @@
 """Storage handlers for capture-events skill."""
 
-__all__ = ["JSONLStorage", "TTLCleaner"]
+import importlib
+
+__all__ = [
+    "AsyncJSONLStorage",
+    "CommandIndex",
+    "ConsumerCursors",
+    "FederatedStore",
+    "JSONLStorage",
+    "MmapReader",
+    "OTLPExporter",
+    "ParallelScanner",
+    "RollupStore",
+    "SQLiteStorage",
+    "SQLiteTTLCleaner",
+    "SkillProfiler",
+    "SpanPairer",
+    "TTLCleaner",
+    "discover_stores",
+    "field_prefilter",
+    "fingerprint",
+    "migrate_jsonl",
+    "split_line_ranges",
+]
 
 from .jsonl_handler import JSONLStorage, TTLCleaner
+
+# Every CLI capture imports this package, so only the JSONL handler is loaded
+# eagerly; the rest (asyncio, sqlite3, urllib, process pools) load on first use.
+_LAZY_EXPORTS = {
+    "AsyncJSONLStorage": "async_jsonl",
+    "CommandIndex": "command_index",
+    "ConsumerCursors": "cursors",
+    "FederatedStore": "federation",
+    "MmapReader": "mmap_reader",
+    "OTLPExporter": "otlp_exporter",
+    "ParallelScanner": "parallel_scan",
+    "RollupStore": "rollup",
+    "SQLiteStorage": "sqlite_handler",
+    "SQLiteTTLCleaner": "sqlite_handler",
+    "SkillProfiler": "skill_spans",
+    "SpanPairer": "skill_spans",
+    "discover_stores": "federation",
+    "field_prefilter": "mmap_reader",
+    "fingerprint": "command_index",
+    "migrate_jsonl": "sqlite_handler",
+    "split_line_ranges": "mmap_reader",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,258 @@
+"""Asyncio front end for JSONL storage with batched, off-loop writes."""
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Iterator, List, Optional, Tuple
+
+try:
+    from event_schema import Event
+except ImportError:
+    from ..event_schema import Event
+
+try:
+    from jsonl_handler import JSONLStorage
+except ImportError:
+    from .jsonl_handler import JSONLStorage
+
+
+def _take(iterator: Iterator[Event], count: int) -> List[Event]:
+    return list(islice(iterator, count))
+
+
+class AsyncJSONLStorage:
+    """Awaitable ``JSONLStorage`` that never touches the file on the event loop.
+
+    Appends are validated on the loop, queued, and written in batches by a
+    single drain task through ``JSONLStorage.append_many`` on a dedicated
+    executor: a batch goes out when ``batch_size`` events are queued or
+    ``flush_interval`` seconds after the first one, whichever comes first.
+    Only one batch is in flight at a time, so lines from concurrent
+    coroutines never interleave. Reads flush queued appends first (so a
+    coroutine reads its own writes) and then run on the same executor.
+    """
+
+    DEFAULT_BATCH_SIZE = 256
+    DEFAULT_FLUSH_INTERVAL = 0.005
+    DEFAULT_CHUNK_SIZE = 512
+
+    def __init__(
+        self,
+        filepath: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        executor: Optional[Executor] = None,
+        epoch_timestamps: bool = False,
+        metrics=None,
+    ):
+        """
+        Initialize async JSONL storage.
+
+        Args:
+            filepath: Path to episodes.jsonl file
+            batch_size: Queued appends that trigger an immediate write
+            flush_interval: Seconds a partial batch may wait for more appends
+            executor: Executor for file I/O (default: a private two-thread
+                pool, shut down by ``aclose``)
+            epoch_timestamps: Passed to ``JSONLStorage``
+            metrics: Optional CaptureMetrics sink (default: disabled)
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+
+        self.storage = JSONLStorage(filepath, epoch_timestamps=epoch_timestamps, metrics=metrics)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="pax-capture-io"
+        )
+        self._pending: List[Tuple[Event, "asyncio.Future[bool]"]] = []
+        self._drain_task: Optional["asyncio.Task[None]"] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._closed = False
+
+    @property
+    def filepath(self):
+        """Path of the underlying log."""
+        return self.storage.filepath
+
+    @property
+    def pending(self) -> int:
+        """Number of appends queued but not yet written."""
+        return len(self._pending)
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a blocking callable on the storage executor.
+
+        Args:
+            func: Callable to run
+            *args: Positional arguments
+
+        Returns:
+            The callable's return value
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def submit(self, event: Event) -> "asyncio.Future[bool]":
+        """
+        Queue an event without waiting for it to be written.
+
+        Must be called from a running event loop.
+
+        Args:
+            event: Event to append
+
+        Returns:
+            Future resolving to True once the event's batch is written, or
+            raising IOError if that write failed
+
+        Raises:
+            ValueError: If the event is invalid or the storage is closed
+        """
+        if self._closed:
+            raise ValueError("Storage is closed")
+        event.validate()
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((event, future))
+        if self._drain_task is None:
+            self._wake = asyncio.Event()
+            self._drain_task = loop.create_task(self._drain())
+        if len(self._pending) >= self.batch_size:
+            self._wake.set()
+        return future
+
+    async def append(self, event: Event) -> bool:
+        """
+        Append an event and wait until its batch is written.
+
+        Args:
+            event: Event to append
+
+        Returns:
+            True if successful
+
+        Raises:
+            IOError: If write fails
+            ValueError: If the event is invalid
+        """
+        return await self.submit(event)
+
+    async def _drain(self) -> None:
+        """Write queued appends batch by batch until the queue is empty."""
+        try:
+            while self._pending:
+                if len(self._pending) < self.batch_size and self.flush_interval > 0:
+                    # Linger for more appends unless a full batch or flush wakes us.
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                self._wake.clear()
+
+                batch = self._pending[: self.batch_size]
+                del self._pending[: self.batch_size]
+
+                try:
+                    await self.run(self.storage.append_many, [event for event, _ in batch])
+                except Exception as e:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_result(True)
+                self.storage.metrics.incr("async_batches")
+        finally:
+            self._drain_task = None
+
+    async def flush(self) -> None:
+        """Write every queued append now and wait for the writes to finish."""
+        while self._drain_task is not None:
+            self._wake.set()
+            await asyncio.shield(self._drain_task)
+
+    async def aclose(self) -> None:
+        """Flush queued appends and release the private executor."""
+        if self._closed:
+            return
+        await self.flush()
+        self._closed = True
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "AsyncJSONLStorage":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def read_all(self) -> List[Event]:
+        """Read all events (see ``JSONLStorage.read_all``)."""
+        await self.flush()
+        return await self.run(self.storage.read_all)
+
+    async def read_since(self, since_timestamp: str) -> List[Event]:
+        """Read events at or after a timestamp (see ``JSONLStorage.read_since``)."""
+        await self.flush()
+        return await self.run(self.storage.read_since, since_timestamp)
+
+    async def read_by_type(self, event_type: str) -> List[Event]:
+        """Read events of one type (see ``JSONLStorage.read_by_type``)."""
+        await self.flush()
+        return await self.run(self.storage.read_by_type, event_type)
+
+    async def read_by_provider(self, provider: str) -> List[Event]:
+        """Read events from one provider (see ``JSONLStorage.read_by_provider``)."""
+        await self.flush()
+        return await self.run(self.storage.read_by_provider, provider)
+
+    async def read_new(self, consumer: str, commit: bool = True) -> List[Event]:
+        """Read events new to a consumer (see ``JSONLStorage.read_new``)."""
+        await self.flush()
+        return await self.run(self.storage.read_new, consumer, commit)
+
+    async def count(self) -> int:
+        """Count stored events."""
+        await self.flush()
+        return await self.run(self.storage.count)
+
+    async def iter_events(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE, **filters: Any
+    ) -> AsyncIterator[Event]:
+        """
+        Stream matching events without loading the log into memory.
+
+        The synchronous scan is advanced ``chunk_size`` events at a time on
+        the executor, so the loop only ever waits on one chunk.
+
+        Args:
+            chunk_size: Events decoded per executor call
+            **filters: Filters accepted by ``JSONLStorage.iter_events``
+
+        Yields:
+            Matching Event instances
+
+        Raises:
+            IOError: If read fails
+        """
+        await self.flush()
+        iterator = self.storage.iter_events(**filters)
+        try:
+            while True:
+                chunk = await self.run(_take, iterator, chunk_size)
+                if not chunk:
+                    return
+                for event in chunk:
+                    yield event
+        finally:
+            try:
+                iterator.close()
+            except ValueError:
+                # Still running on the executor after a cancellation.
+                pass
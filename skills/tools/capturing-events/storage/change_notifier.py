@@ -0,0 +1,126 @@
+"""File change notification for live episode consumers."""
+
+import os
+import select
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+# inotify(7) constants from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+)
+
+
+class ChangeNotifier:
+    """Wait for changes to a file, using inotify when available.
+
+    The parent directory is watched rather than the file itself so that
+    creation, deletion and atomic replacement (as done by ``TTLCleaner``) all
+    wake the waiter. On platforms without inotify, or when it cannot be
+    initialized, ``wait`` degrades to sleeping for the poll interval.
+    """
+
+    def __init__(self, filepath: str, poll_interval: float = 0.5, use_inotify: bool = True):
+        """
+        Initialize change notifier.
+
+        Args:
+            filepath: File to watch
+            poll_interval: Maximum seconds to block in a single wait
+            use_inotify: If False, always use the polling fallback
+        """
+        self.filepath = Path(filepath)
+        self.poll_interval = poll_interval
+        self._fd: Optional[int] = None
+
+        if use_inotify:
+            self._fd = self._init_inotify()
+
+    @property
+    def uses_inotify(self) -> bool:
+        """True if waits are driven by inotify rather than polling."""
+        return self._fd is not None
+
+    def _init_inotify(self) -> Optional[int]:
+        """Create an inotify watch on the parent directory, or None."""
+        if not sys.platform.startswith("linux"):
+            return None
+
+        # Imported here: jsonl_handler imports this module for every capture,
+        # but only follow() needs ctypes.
+        import ctypes
+        import ctypes.util
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd < 0:
+                return None
+
+            directory = os.fsencode(str(self.filepath.parent))
+            if libc.inotify_add_watch(fd, directory, WATCH_MASK) < 0:
+                os.close(fd)
+                return None
+
+            return fd
+        except (OSError, AttributeError):
+            return None
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """
+        Block until the watched directory changes or the timeout expires.
+
+        Args:
+            timeout: Seconds to wait (defaults to the poll interval)
+        """
+        if timeout is None:
+            timeout = self.poll_interval
+
+        if self._fd is None:
+            time.sleep(timeout)
+            return
+
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if ready:
+            self._drain()
+
+    def _drain(self) -> None:
+        """Discard pending inotify records; callers re-stat the file anyway."""
+        while True:
+            try:
+                if not os.read(self._fd, 4096):
+                    return
+            except BlockingIOError:
+                return
+            except OSError:
+                return
+
+    def close(self) -> None:
+        """Release the inotify descriptor."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "ChangeNotifier":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
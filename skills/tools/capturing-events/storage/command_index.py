@@ -0,0 +1,310 @@
+"""Command fingerprints and an incrementally maintained index of terminal runs."""
+
+import json
+import os
+import re
+import shlex
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from event_schema import Event, EventType
+    from metrics import Histogram
+except ImportError:
+    from ..event_schema import Event, EventType
+    from ..metrics import Histogram
+
+TERMINAL_TYPES = (EventType.TERMINAL_EXECUTE, EventType.TERMINAL_OUTPUT, EventType.TERMINAL_ERROR)
+
+SORT_KEYS = ("count", "failures", "failure_rate", "p95_ms", "last_seen")
+
+# Volatile argument shapes, checked in order; the first match masks the token.
+_MASKS = (
+    ("<url>", re.compile(r"^[a-z][a-z0-9+.-]*://", re.IGNORECASE)),
+    ("<num>", re.compile(r"^[+-]?\d+(\.\d+)?[a-z%]{0,3}$", re.IGNORECASE)),
+    ("<id>", re.compile(r"^([0-9a-f]{7,}|[0-9a-f]{8}(-[0-9a-f]{4}){3}-[0-9a-f]{12})$", re.I)),
+    ("<path>", re.compile(r"[/\\]|^~|^\.{1,2}$|\.[a-z0-9]{1,5}$", re.IGNORECASE)),
+)
+_ENV_ASSIGNMENT = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*=")
+_PIPELINE_OPERATORS = {"|", "||", "&&", ";"}
+MAX_EXAMPLE_LENGTH = 200
+
+
+def _mask(token: str) -> str:
+    if token.startswith("-"):
+        flag, sep, value = token.partition("=")
+        return f"{flag}={_mask(value)}" if sep else token
+    if any(ch.isspace() for ch in token):
+        return "<str>"
+    for placeholder, pattern in _MASKS:
+        if pattern.search(token):
+            return placeholder
+    return token
+
+
+def fingerprint(command: str) -> str:
+    """
+    Normalize a command line into its argv shape.
+
+    Leading environment assignments are dropped, the program is reduced to
+    its basename, and volatile arguments (numbers, hashes/ids, paths, URLs,
+    quoted strings, ``--flag=value`` values) are masked, while subcommands,
+    flag names and plain words are kept. ``pytest tests/test_a.py -x`` and
+    ``pytest tests/test_b.py -x`` therefore share the fingerprint
+    ``pytest <path> -x``.
+
+    Args:
+        command: Raw command line
+
+    Returns:
+        Fingerprint string (empty for a blank command)
+    """
+    try:
+        tokens = shlex.split(command, posix=True)
+    except ValueError:
+        # Unbalanced quotes: fall back to whitespace splitting.
+        tokens = command.split()
+
+    shape = []
+    program_next = True
+    for token in tokens:
+        if token in _PIPELINE_OPERATORS:
+            shape.append(token)
+            program_next = True
+        elif program_next:
+            if _ENV_ASSIGNMENT.match(token):
+                continue
+            shape.append(re.split(r"[/\\]", token)[-1] or token)
+            program_next = False
+        else:
+            shape.append(_mask(token))
+    return " ".join(shape)
+
+
+def _failed(event: Event) -> bool:
+    exit_code = event.metadata.get("exit_code")
+    if isinstance(exit_code, int) and not isinstance(exit_code, bool):
+        return exit_code != 0
+    return event.event_type == EventType.TERMINAL_ERROR
+
+
+class CommandIndex:
+    """Fingerprint → run statistics for terminal events, kept beside the log.
+
+    Each entry holds the run count, failures (non-zero ``exit_code``, or a
+    ``terminal_error`` event when no exit code was recorded), a duration
+    histogram from ``duration_ms``, first/last seen timestamps, and the byte
+    offset of the most recent run's line in the log so it can be read back
+    without a scan. Like ``RollupStore``, ``update`` folds in only events
+    appended since the previous update, through a ``JSONLStorage`` consumer
+    cursor. Offsets refer to the log as it was when the run was indexed; a
+    TTL rewrite moves lines, so ``last_offset`` is a hint that should be
+    checked against ``last_seen``.
+    """
+
+    CONSUMER = "command-index"
+    VERSION = 1
+
+    def __init__(self, filepath: str):
+        """
+        Initialize command index.
+
+        Args:
+            filepath: Path to commands.json
+        """
+        self.filepath = Path(filepath)
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+
+    @classmethod
+    def for_log(cls, log_path: str) -> "CommandIndex":
+        """
+        Create the command index that lives next to an episodes log.
+
+        Args:
+            log_path: Path to episodes.jsonl
+
+        Returns:
+            CommandIndex for ``commands.json`` in the log's directory
+        """
+        return cls(str(Path(log_path).parent / "commands.json"))
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.filepath, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return {}
+        entries = data.get("commands")
+        return entries if isinstance(entries, dict) else {}
+
+    def save(self) -> None:
+        """
+        Atomically persist the index.
+
+        Raises:
+            IOError: If write fails
+        """
+        tmp_path = self.filepath.with_name(f".{self.filepath.name}.tmp")
+        try:
+            self.filepath.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": self.VERSION, "commands": self._entries},
+                    f,
+                    separators=(",", ":"),
+                )
+            os.replace(tmp_path, self.filepath)
+        except (IOError, OSError) as e:
+            raise IOError(f"Failed to save command index: {e}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, events: Iterable[Tuple[Event, Optional[int]]]) -> int:
+        """
+        Fold terminal events into the in-memory index (call ``save`` to persist).
+
+        Args:
+            events: (event, byte offset of its line or None) tuples; events
+                that are not terminal events are ignored
+
+        Returns:
+            Number of terminal events indexed
+        """
+        indexed = 0
+        for event, offset in events:
+            if event.event_type not in TERMINAL_TYPES:
+                continue
+            command = event.metadata.get("command")
+            if not isinstance(command, str):
+                continue
+            key = fingerprint(command)
+            if not key:
+                continue
+
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = {
+                    "example": command[:MAX_EXAMPLE_LENGTH],
+                    "count": 0,
+                    "failures": 0,
+                    "first_seen": event.timestamp,
+                    "last_seen": event.timestamp,
+                    "last_offset": offset,
+                    "last_failure": None,
+                    "durations": None,
+                }
+
+            entry["count"] += 1
+            if _failed(event):
+                entry["failures"] += 1
+                entry["last_failure"] = event.timestamp
+            if event.timestamp >= entry["last_seen"]:
+                entry["last_seen"] = event.timestamp
+                entry["last_offset"] = offset
+
+            duration_ms = event.metadata.get("duration_ms")
+            if isinstance(duration_ms, (int, float)) and not isinstance(duration_ms, bool):
+                histogram = Histogram()
+                if entry["durations"]:
+                    histogram.merge(entry["durations"])
+                histogram.observe(max(duration_ms, 0) / 1000.0)
+                serialized = histogram.to_dict()
+                entry["durations"] = {
+                    field: serialized[field] for field in ("count", "sum_us", "max_us", "buckets")
+                }
+            indexed += 1
+        return indexed
+
+    def update(self, storage: Any) -> int:
+        """
+        Index terminal events appended to storage since the last update.
+
+        Args:
+            storage: JSONLStorage whose ``command-index`` consumer cursor is advanced
+
+        Returns:
+            Number of terminal events indexed
+        """
+        events = storage.read_new(self.CONSUMER, commit=False, with_offsets=True)
+        indexed = self.add(events)
+        if events:
+            self.save()
+        storage.commit(self.CONSUMER)
+        return indexed
+
+    @staticmethod
+    def _summary(key: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        count = entry["count"]
+        histogram = Histogram()
+        if entry.get("durations"):
+            histogram.merge(entry["durations"])
+        timed = histogram.total
+        return {
+            "fingerprint": key,
+            "example": entry["example"],
+            "count": count,
+            "failures": entry["failures"],
+            "failure_rate": round(entry["failures"] / count, 4) if count else 0.0,
+            "timed_runs": timed,
+            "mean_ms": round(histogram.sum_us / timed / 1000, 3) if timed else None,
+            "p50_ms": histogram.percentile(50) / 1000 if timed else None,
+            "p95_ms": histogram.percentile(95) / 1000 if timed else None,
+            "max_ms": histogram.max_us / 1000 if timed else None,
+            "first_seen": entry["first_seen"],
+            "last_seen": entry["last_seen"],
+            "last_offset": entry["last_offset"],
+            "last_failure": entry["last_failure"],
+        }
+
+    def lookup(self, command: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the statistics for the fingerprint of a raw command.
+
+        Args:
+            command: Raw command line, e.g. "npm test"
+
+        Returns:
+            Summary dict, or None if no run with that fingerprint was indexed
+        """
+        key = fingerprint(command)
+        entry = self._entries.get(key)
+        return self._summary(key, entry) if entry is not None else None
+
+    def query(
+        self,
+        match: Optional[str] = None,
+        sort: str = "count",
+        limit: Optional[int] = 20,
+        min_count: int = 1,
+    ) -> List[Dict[str, Any]]:
+        """
+        List fingerprints with their run statistics.
+
+        Durations are estimated from power-of-two histogram buckets, so
+        percentiles are upper bounds accurate to within a factor of two.
+
+        Args:
+            match: Only fingerprints containing this substring
+            sort: One of SORT_KEYS, highest first
+            limit: Maximum entries (None for all)
+            min_count: Skip fingerprints with fewer runs
+
+        Returns:
+            List of summary dicts
+
+        Raises:
+            ValueError: If sort is unknown
+        """
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Unknown sort: {sort}. Valid options: {list(SORT_KEYS)}")
+
+        summaries = [
+            self._summary(key, entry)
+            for key, entry in self._entries.items()
+            if entry["count"] >= min_count and (match is None or match in key)
+        ]
+        summaries.sort(key=lambda item: (item[sort] is not None, item[sort] or 0), reverse=True)
+        return summaries if limit is None else summaries[:limit]
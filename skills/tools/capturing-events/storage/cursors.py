@@ -0,0 +1,182 @@
+"""Persistent consumer cursors for incremental episode processing."""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+CONSUMER_NAME_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+
+def empty_cursor() -> Dict[str, Any]:
+    """
+    Build the cursor of a consumer that has not read anything yet.
+
+    Returns:
+        Cursor dict: {"offset": int, "inode": int|None, "last_timestamp": str|None,
+        "last_timestamp_count": int|None}
+    """
+    return {"offset": 0, "inode": None, "last_timestamp": None, "last_timestamp_count": None}
+
+
+class SeenEvents:
+    """Recognize already-consumed events when a rewritten log is re-read.
+
+    Tracks the newest timestamp consumed and how many consumed events carry
+    it. After ``replay()`` (the log was compacted into a new file or
+    truncated, so reading restarts at offset 0), events older than that
+    timestamp are skipped, as are only that many events sharing it, so
+    events appended later within the same microsecond are still delivered.
+    Replay ends at the first event delivered.
+
+    Events appended with a timestamp older than the newest one consumed
+    (clock skew, imported history) cannot be told apart from consumed ones
+    and are skipped if they fall inside a replay. A count of None (cursors
+    saved before counts were kept) skips every event at the newest timestamp.
+    """
+
+    __slots__ = ("newest", "count", "_replaying", "_matched")
+
+    def __init__(self, newest: Optional[str] = None, count: Optional[int] = 0):
+        """
+        Initialize from a saved cursor.
+
+        Args:
+            newest: Newest timestamp consumed so far
+            count: Consumed events carrying ``newest`` (None if unknown)
+        """
+        self.newest = newest
+        self.count = count
+        self._replaying = False
+        self._matched = 0
+
+    def replay(self) -> None:
+        """Start skipping consumed events from the beginning of the log."""
+        self._replaying = True
+        self._matched = 0
+
+    def admit(self, timestamp: str) -> bool:
+        """
+        Decide whether an event is new, recording it as consumed if so.
+
+        Args:
+            timestamp: The event's ISO 8601 timestamp
+
+        Returns:
+            False if the event was consumed before the log was rewritten
+        """
+        if self._replaying and self.newest is not None:
+            if timestamp < self.newest:
+                return False
+            if timestamp == self.newest and (self.count is None or self._matched < self.count):
+                self._matched += 1
+                return False
+        self._replaying = False
+
+        if self.newest is None or timestamp > self.newest:
+            self.newest, self.count = timestamp, 1
+        elif timestamp == self.newest and self.count is not None:
+            self.count += 1
+        return True
+
+
+class ConsumerCursors:
+    """Named read positions stored next to an episodes log.
+
+    Each consumer gets its own ``cursors/<name>.json`` file beside the log so
+    that independent jobs never overwrite each other's position. A cursor
+    records the byte offset reached, the inode of the file it refers to, and
+    the newest timestamp consumed with the number of events carrying it; the
+    inode and timestamp let readers recover after ``TTLCleaner`` compacts
+    the log into a new file (see ``SeenEvents``).
+    """
+
+    def __init__(self, log_path: str):
+        """
+        Initialize cursor store.
+
+        Args:
+            log_path: Path to the episodes.jsonl file the cursors refer to
+        """
+        self.directory = Path(log_path).parent / "cursors"
+
+    def _path(self, consumer: str) -> Path:
+        if not CONSUMER_NAME_PATTERN.match(consumer):
+            raise ValueError(
+                f"Invalid consumer name: {consumer!r}. "
+                "Use letters, digits, '.', '_' or '-'"
+            )
+        return self.directory / f"{consumer}.json"
+
+    def load(self, consumer: str) -> Dict[str, Any]:
+        """
+        Load a consumer's cursor.
+
+        Args:
+            consumer: Consumer name
+
+        Returns:
+            Cursor dict (an empty cursor if none was saved or it is unreadable)
+        """
+        path = self._path(consumer)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (IOError, OSError, ValueError):
+            return empty_cursor()
+
+        cursor = empty_cursor()
+        if isinstance(data, dict):
+            cursor.update({k: data[k] for k in cursor if k in data})
+        return cursor
+
+    def save(self, consumer: str, cursor: Dict[str, Any]) -> None:
+        """
+        Atomically persist a consumer's cursor.
+
+        Args:
+            consumer: Consumer name
+            cursor: Cursor dict
+
+        Raises:
+            IOError: If write fails
+        """
+        path = self._path(consumer)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cursor, f)
+            os.replace(tmp_path, path)
+        except (IOError, OSError) as e:
+            raise IOError(f"Failed to save cursor for {consumer}: {e}")
+
+    def reset(self, consumer: str) -> bool:
+        """
+        Forget a consumer's cursor so it re-reads from the beginning.
+
+        Args:
+            consumer: Consumer name
+
+        Returns:
+            True if successful
+        """
+        try:
+            path = self._path(consumer)
+            if path.exists():
+                path.unlink()
+            return True
+        except (IOError, OSError):
+            return False
+
+    def names(self) -> List[str]:
+        """
+        List consumers with a saved cursor.
+
+        Returns:
+            Sorted consumer names
+        """
+        if not self.directory.exists():
+            return []
+        return sorted(p.stem for p in self.directory.glob("*.json"))
@@ -0,0 +1,290 @@
+"""Federated queries across the episode logs of many workspaces."""
+
+import heapq
+import os
+from itertools import count, repeat
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from event_schema import Event
+except ImportError:
+    from ..event_schema import Event
+
+try:
+    from jsonl_handler import JSONLStorage
+    from mmap_reader import split_line_ranges
+except ImportError:
+    from .jsonl_handler import JSONLStorage
+    from .mmap_reader import split_line_ranges
+
+# Location of a workspace's log relative to its root, as used by get_storage_path.
+STORE_RELATIVE_PATH = Path(".vscode") / "pax-memory" / "episodes.jsonl"
+
+# Directories that never contain workspaces worth scanning.
+SKIP_DIRS = {
+    ".git",
+    ".hg",
+    ".svn",
+    ".tox",
+    ".venv",
+    "__pycache__",
+    "build",
+    "dist",
+    "node_modules",
+    "venv",
+}
+
+EXECUTORS = ("thread", "process")
+
+
+def discover_stores(roots: Iterable[str], max_depth: int = 3) -> List[Path]:
+    """
+    Find workspace episode logs below the given roots.
+
+    A directory is a workspace if it contains ``.vscode/pax-memory/episodes.jsonl``.
+    Version-control, virtualenv and dependency directories are not descended
+    into.
+
+    Args:
+        roots: Directories to search (e.g. ~/src)
+        max_depth: Directory levels below each root to search for workspaces
+
+    Returns:
+        Sorted, de-duplicated paths to episodes.jsonl files
+    """
+    found = set()
+    for root in roots:
+        root_path = Path(root).expanduser().resolve()
+        base_depth = len(root_path.parts)
+        for dirpath, dirnames, _ in os.walk(root_path):
+            current = Path(dirpath)
+            candidate = current / STORE_RELATIVE_PATH
+            if candidate.is_file():
+                found.add(candidate)
+
+            if len(current.parts) - base_depth >= max_depth:
+                dirnames[:] = []
+            else:
+                dirnames[:] = [
+                    d for d in dirnames if d not in SKIP_DIRS and d != ".vscode"
+                ]
+
+    return sorted(found)
+
+
+def workspace_of(store: Path) -> str:
+    """Return the workspace root that owns an episodes.jsonl path."""
+    return str(store.parents[len(STORE_RELATIVE_PATH.parts) - 1])
+
+
+class _Descending:
+    """Heap key that orders timestamps newest first."""
+
+    __slots__ = ("timestamp",)
+
+    def __init__(self, timestamp: str):
+        self.timestamp = timestamp
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return self.timestamp > other.timestamp
+
+
+def _scan_chunk(
+    store: str, byte_range: Tuple[int, int], filters: Dict[str, Any], reverse: bool
+) -> List[Event]:
+    """Scan one line-aligned slice of a log (worker entry point)."""
+    return list(JSONLStorage(store).iter_events(reverse=reverse, byte_range=byte_range, **filters))
+
+
+def _count_store(store: str) -> int:
+    """Count one log's events (worker entry point)."""
+    return JSONLStorage(store).count()
+
+
+class FederatedStore:
+    """Read-only view over the episode logs of many workspaces.
+
+    Each store is streamed in line-aligned chunks of about ``chunk_bytes``,
+    scanned by pool workers with the same filters as
+    ``JSONLStorage.iter_events``. The first chunk of every store is submitted
+    before merging starts, and each store's next chunk is scanned while its
+    current one is merged. Appends are only roughly chronological
+    (clock skew, imported history), so each store stream passes through a
+    heap of ``reorder_window`` events before the k-way merge; an event
+    displaced by more than that many positions in its log is merged late.
+    Memory therefore grows with the number of stores, not their size.
+    """
+
+    DEFAULT_CHUNK_BYTES = 1 << 20
+    DEFAULT_REORDER_WINDOW = 1000
+
+    def __init__(
+        self,
+        stores: Iterable[str],
+        max_workers: Optional[int] = None,
+        executor: str = "thread",
+        chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+        reorder_window: int = DEFAULT_REORDER_WINDOW,
+    ):
+        """
+        Initialize federated store.
+
+        Args:
+            stores: Paths to episodes.jsonl files
+            max_workers: Concurrent scans (default: executor default)
+            executor: "thread" (default) or "process"; processes help when
+                many large logs are scanned with little I/O wait
+            chunk_bytes: Approximate log bytes scanned per worker task
+            reorder_window: Events per store held back to restore
+                timestamp order
+
+        Raises:
+            ValueError: If executor is unknown or chunk_bytes/reorder_window < 1
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor: {executor}. Valid options: {list(EXECUTORS)}")
+        if chunk_bytes < 1 or reorder_window < 1:
+            raise ValueError("chunk_bytes and reorder_window must be >= 1")
+
+        self.stores = [Path(store) for store in stores]
+        self.max_workers = max_workers
+        self.executor = executor
+        self.chunk_bytes = chunk_bytes
+        self.reorder_window = reorder_window
+
+    @classmethod
+    def discover(
+        cls, roots: Iterable[str], max_depth: int = 3, **kwargs: Any
+    ) -> "FederatedStore":
+        """
+        Create a federated store over every workspace found below roots.
+
+        Args:
+            roots: Directories to search
+            max_depth: Directory levels below each root to search
+            **kwargs: Passed to the constructor
+
+        Returns:
+            FederatedStore instance
+        """
+        return cls([str(store) for store in discover_stores(roots, max_depth)], **kwargs)
+
+    def _pool(self) -> Executor:
+        if self.executor == "process":
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def _stream_store(
+        self, pool: Executor, store: Path, filters: Dict[str, Any], reverse: bool
+    ) -> Iterator[Event]:
+        """
+        Start scanning one log and stream its matches in timestamp order.
+
+        The first chunk is submitted before this returns, so every store is
+        being scanned by the time the merge first pulls from any of them.
+        """
+        try:
+            size = store.stat().st_size
+        except FileNotFoundError:
+            return iter(())
+
+        ranges = split_line_ranges(str(store), max(1, size // self.chunk_bytes))
+        if reverse:
+            ranges.reverse()
+        pending = iter(ranges)
+
+        def submit() -> Optional[Future]:
+            byte_range = next(pending, None)
+            if byte_range is None:
+                return None
+            return pool.submit(_scan_chunk, str(store), byte_range, filters, reverse)
+
+        return self._reorder(submit(), submit, reverse)
+
+    def _reorder(
+        self, future: Optional[Future], submit: Callable[[], Optional[Future]], reverse: bool
+    ) -> Iterator[Event]:
+        """Yield scanned chunks through the reorder window, prefetching the next chunk."""
+        window: List[Tuple[Any, int, Event]] = []
+        sequence = count()
+        while future is not None:
+            chunk = future.result()
+            future = submit()
+            for event in chunk:
+                key = _Descending(event.timestamp) if reverse else event.timestamp
+                heapq.heappush(window, (key, next(sequence), event))
+                if len(window) > self.reorder_window:
+                    yield heapq.heappop(window)[2]
+        while window:
+            yield heapq.heappop(window)[2]
+
+    def iter_events(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        event_type: Optional[str] = None,
+        provider: Optional[str] = None,
+        filepath: Optional[str] = None,
+        reverse: bool = False,
+        limit: Optional[int] = None,
+    ) -> Iterator[Tuple[str, Event]]:
+        """
+        Stream matching events from every workspace in timestamp order.
+
+        Args:
+            since: Include events at or after this ISO 8601 timestamp
+            until: Include events strictly before this ISO 8601 timestamp
+            event_type: Only events of this type
+            provider: Only events from this provider
+            filepath: Only events whose metadata filepath matches
+            reverse: If True, newest events first
+            limit: Stop after this many events in total
+
+        Yields:
+            (workspace root, Event) tuples
+
+        Raises:
+            IOError: If a store cannot be read
+        """
+        if limit is not None and limit <= 0:
+            return
+
+        filters = {
+            "since": since,
+            "until": until,
+            "event_type": event_type,
+            "provider": provider,
+            "filepath": filepath,
+        }
+        if not self.stores:
+            return
+
+        with self._pool() as pool:
+            streams = [
+                zip(repeat(workspace_of(store)), self._stream_store(pool, store, filters, reverse))
+                for store in self.stores
+            ]
+            merged = heapq.merge(*streams, key=lambda item: item[1].timestamp, reverse=reverse)
+            for emitted, item in enumerate(merged, 1):
+                yield item
+                if limit is not None and emitted >= limit:
+                    return
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Count events per workspace.
+
+        Returns:
+            Dict mapping workspace root to number of events
+        """
+        if not self.stores:
+            return {}
+
+        with self._pool() as pool:
+            futures = {
+                workspace_of(store): pool.submit(_count_store, str(store))
+                for store in self.stores
+            }
+            return {workspace: future.result() for workspace, future in futures.items()}
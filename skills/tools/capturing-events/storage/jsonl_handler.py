@@ -2,28 +2,48 @@
 
 import json
 import os
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 
 try:
-    from event_schema import Event
+    from event_schema import Event, EventDecoder, iso_to_epoch_us
+    from metrics import NULL_METRICS
 except ImportError:
-    from ..event_schema import Event
+    from ..event_schema import Event, EventDecoder, iso_to_epoch_us
+    from ..metrics import NULL_METRICS
+
+try:
+    from change_notifier import ChangeNotifier
+    from cursors import ConsumerCursors, SeenEvents
+    from mmap_reader import MmapReader, field_prefilter
+except ImportError:
+    from .change_notifier import ChangeNotifier
+    from .cursors import ConsumerCursors, SeenEvents
+    from .mmap_reader import MmapReader, field_prefilter
 
 
 class JSONLStorage:
     """Append-only JSONL storage for events."""
 
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, epoch_timestamps: bool = False, metrics=None):
         """
         Initialize JSONL storage.
 
         Args:
             filepath: Path to episodes.jsonl file
+            epoch_timestamps: If True, write timestamps as integer epoch
+                microseconds (smaller records, integer time comparisons).
+                Reading always accepts both forms.
+            metrics: Optional CaptureMetrics sink (default: disabled)
         """
         self.filepath = Path(filepath)
+        self.epoch_timestamps = epoch_timestamps
+        self.metrics = NULL_METRICS if metrics is None else metrics
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self.cursors = ConsumerCursors(str(self.filepath))
+        self._pending_cursors: Dict[str, Dict[str, Any]] = {}
 
     def append(self, event: Event) -> bool:
         """
@@ -39,16 +59,58 @@ class JSONLStorage:
             IOError: If write fails
         """
         try:
-            event.validate()
-            json_line = event.to_json() + "\n"
+            with self.metrics.timer("append"):
+                event.validate()
+                json_line = event.to_json(self.epoch_timestamps) + "\n"
 
-            with open(self.filepath, "a", encoding="utf-8") as f:
-                f.write(json_line)
+                with open(self.filepath, "a", encoding="utf-8") as f:
+                    f.write(json_line)
 
+            if self.metrics.enabled:
+                self.metrics.incr("events_written")
+                self.metrics.incr("bytes_written", len(json_line.encode("utf-8")))
             return True
         except (IOError, OSError) as e:
             raise IOError(f"Failed to append event: {e}")
 
+    def append_many(self, events: Iterable[Event], buffer_size: int = 1 << 20) -> int:
+        """
+        Append events through a single buffered writer.
+
+        The file is opened once and lines are flushed in ``buffer_size``
+        chunks, so bulk imports avoid a syscall and open/close per event.
+
+        Args:
+            events: Events to append
+            buffer_size: Write buffer size in bytes
+
+        Returns:
+            Number of events written
+
+        Raises:
+            IOError: If write fails
+            ValueError: If an event is invalid (earlier events stay written)
+        """
+        written = 0
+        nbytes = 0
+        try:
+            with self.metrics.timer("append_many"), open(
+                self.filepath, "ab", buffering=buffer_size
+            ) as f:
+                for event in events:
+                    event.validate()
+                    line = (event.to_json(self.epoch_timestamps) + "\n").encode("utf-8")
+                    f.write(line)
+                    written += 1
+                    nbytes += len(line)
+        except (IOError, OSError) as e:
+            raise IOError(f"Failed to append events: {e}")
+        finally:
+            self.metrics.incr("events_written", written)
+            self.metrics.incr("bytes_written", nbytes)
+
+        return written
+
     def read_all(self) -> List[Event]:
         """
         Read all events from storage.
@@ -62,25 +124,105 @@ class JSONLStorage:
         if not self.filepath.exists():
             return []
 
-        events = []
         try:
-            with open(self.filepath, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    try:
-                        event = Event.from_json(line)
-                        events.append(event)
-                    except ValueError:
-                        # Skip invalid lines
-                        continue
-
-            return events
+            with self.metrics.timer("read"), open(self.filepath, "r", encoding="utf-8") as f:
+                # Invalid lines are skipped by the decoder
+                events = list(EventDecoder().decode_lines(f))
         except (IOError, OSError) as e:
             raise IOError(f"Failed to read events: {e}")
 
+        self.metrics.incr("events_read", len(events))
+        return events
+
+    def iter_events(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        event_type: Optional[str] = None,
+        provider: Optional[str] = None,
+        filepath: Optional[str] = None,
+        reverse: bool = False,
+        limit: Optional[int] = None,
+        byte_range: Optional[Tuple[int, int]] = None,
+    ) -> Iterator[Event]:
+        """
+        Stream events matching all given filters.
+
+        Filters are evaluated during a memory-mapped scan, and the most
+        selective equality filter is applied as a byte-level prefilter so
+        non-matching lines are never decoded. Remaining filters run on the
+        raw record before an ``Event`` is built, comparing epoch-microsecond
+        timestamps as integers. Memory use is constant regardless of log size.
+
+        Args:
+            since: Include events at or after this ISO 8601 timestamp
+            until: Include events strictly before this ISO 8601 timestamp
+            event_type: Only events of this type
+            provider: Only events from this provider
+            filepath: Only events whose metadata filepath matches
+            reverse: If True, stream newest lines first
+            limit: Stop after this many matching events
+            byte_range: Only scan this line-aligned (start, end) slice of the
+                log (see ``split_line_ranges``)
+
+        Yields:
+            Matching Event instances
+        """
+        if limit is not None and limit <= 0:
+            return
+
+        prefilter = None
+        if event_type is not None:
+            prefilter = field_prefilter("event_type", event_type)
+        elif filepath is not None:
+            prefilter = field_prefilter("filepath", filepath)
+        elif provider is not None:
+            prefilter = field_prefilter("provider", provider)
+
+        since_us = iso_to_epoch_us(since) if since is not None else None
+        until_us = iso_to_epoch_us(until) if until is not None else None
+
+        decoder = EventDecoder()
+        matched = 0
+        for line in MmapReader(str(self.filepath)).iter_lines(prefilter, reverse, byte_range):
+            try:
+                data = json.loads(bytes(line))
+                timestamp = data["timestamp"]
+                metadata = data["metadata"]
+            except (ValueError, TypeError, KeyError):
+                # Skip invalid lines
+                continue
+
+            if isinstance(timestamp, int):
+                if since_us is not None and timestamp < since_us:
+                    continue
+                if until_us is not None and timestamp >= until_us:
+                    continue
+            else:
+                if since is not None and timestamp < since:
+                    continue
+                if until is not None and timestamp >= until:
+                    continue
+
+            if event_type is not None and data.get("event_type") != event_type:
+                continue
+            if provider is not None and data.get("provider") != provider:
+                continue
+            if filepath is not None and (
+                not isinstance(metadata, dict) or metadata.get("filepath") != filepath
+            ):
+                continue
+
+            try:
+                event = decoder.decode_dict(data)
+            except (ValueError, TypeError):
+                continue
+
+            yield event
+            matched += 1
+            if limit is not None and matched >= limit:
+                return
+
     def read_since(self, since_timestamp: str) -> List[Event]:
         """
         Read events since timestamp.
@@ -150,22 +292,276 @@ class JSONLStorage:
         except (IOError, OSError):
             return False
 
+    def rewrite(self, events: List[Event]) -> bool:
+        """
+        Atomically replace storage contents with the given events.
+
+        The new file is written next to the log and moved into place with
+        ``os.replace``, so concurrent readers see either the old or the new
+        file, never a partially written one.
+
+        Args:
+            events: Events to keep
+
+        Returns:
+            True if successful
+
+        Raises:
+            IOError: If write fails
+        """
+        tmp_path = self.filepath.with_name(f".{self.filepath.name}.tmp")
+        try:
+            with self.metrics.timer("rewrite"):
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    for event in events:
+                        event.validate()
+                        f.write(event.to_json(self.epoch_timestamps) + "\n")
+
+                os.replace(tmp_path, self.filepath)
+
+            if self.metrics.enabled:
+                self.metrics.incr("bytes_rewritten", self.filepath.stat().st_size)
+            return True
+        except (IOError, OSError) as e:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise IOError(f"Failed to rewrite events: {e}")
+
+    def follow(
+        self,
+        offset: int = 0,
+        poll_interval: float = 0.5,
+        idle_timeout: Optional[float] = None,
+    ) -> Iterator[Tuple[Event, int]]:
+        """
+        Yield events as they are appended to storage.
+
+        Waits are driven by inotify where available and fall back to polling.
+        Rotation (the file being replaced or removed, as ``TTLCleaner`` does)
+        and truncation restart reading from the beginning of the new file,
+        skipping the events already yielded (see ``SeenEvents``): events
+        sharing the newest timestamp yielded are told apart by count, but
+        events appended with an older timestamp than that (clock skew) are
+        skipped too.
+
+        Args:
+            offset: Byte offset to resume from (e.g. a previously yielded offset)
+            poll_interval: Maximum seconds between file checks
+            idle_timeout: Stop after this many seconds without new events
+                (None follows forever)
+
+        Yields:
+            (event, offset) tuples, where offset is the byte position just
+            past the event's line and can be saved to resume later
+        """
+        handle: Optional[BinaryIO] = None
+        inode: Optional[int] = None
+        seen = SeenEvents()
+        idle_since = time.monotonic()
+
+        with ChangeNotifier(str(self.filepath), poll_interval) as notifier:
+            try:
+                while True:
+                    if handle is None:
+                        handle, inode = self._open_binary()
+                        if handle is not None:
+                            if os.fstat(handle.fileno()).st_size < offset:
+                                offset = 0
+                            handle.seek(offset)
+
+                    progressed = False
+                    if handle is not None:
+                        for event, _, offset in self._read_complete_lines(handle, offset):
+                            progressed = True
+                            if seen.admit(event.timestamp):
+                                yield event, offset
+
+                        try:
+                            stat = os.stat(self.filepath)
+                        except FileNotFoundError:
+                            stat = None
+
+                        if stat is None or stat.st_ino != inode:
+                            # Rotated or removed: reopen from the start.
+                            handle.close()
+                            handle, offset = None, 0
+                            seen.replay()
+                            continue
+
+                        if stat.st_size < offset:
+                            # Truncated in place.
+                            offset = 0
+                            seen.replay()
+                            handle.seek(0)
+                            continue
+
+                    if progressed:
+                        idle_since = time.monotonic()
+                    elif (
+                        idle_timeout is not None
+                        and time.monotonic() - idle_since >= idle_timeout
+                    ):
+                        return
+
+                    notifier.wait(poll_interval)
+            finally:
+                if handle is not None:
+                    handle.close()
+
+    def read_new(
+        self, consumer: str, commit: bool = True, with_offsets: bool = False
+    ) -> List[Any]:
+        """
+        Read events appended since the consumer's last committed read.
+
+        The consumer's cursor (byte offset, inode, and the newest timestamp
+        consumed with the number of events carrying it) is kept in
+        ``cursors/<consumer>.json`` next to the log. If the log was compacted
+        into a new file or truncated since the cursor was saved, reading
+        restarts from the beginning and skips the events already consumed
+        (see ``SeenEvents``): events sharing the newest timestamp are told
+        apart by count, but events appended with an older timestamp than
+        that (clock skew) are skipped too.
+
+        Args:
+            consumer: Consumer name (letters, digits, '.', '_' or '-')
+            commit: If True, persist the new cursor immediately. If False, the
+                cursor is held until ``commit(consumer)`` is called, so a job
+                can acknowledge only after it has processed the events.
+            with_offsets: If True, return (event, byte offset of its line)
+                tuples so consumers can later seek straight to an event
+
+        Returns:
+            List of new Event instances (or (event, offset) tuples)
+
+        Raises:
+            IOError: If read fails
+            ValueError: If the consumer name is invalid
+        """
+        cursor = self.cursors.load(consumer)
+        handle, inode = self._open_binary()
+        if handle is None:
+            return []
+
+        events = []
+        offset = cursor["offset"]
+        seen = SeenEvents(cursor["last_timestamp"], cursor["last_timestamp_count"])
+        try:
+            size = os.fstat(handle.fileno()).st_size
+            if (cursor["inode"] is not None and cursor["inode"] != inode) or size < offset:
+                offset = 0
+                seen.replay()
+
+            handle.seek(offset)
+            for event, line_start, offset in self._read_complete_lines(handle, offset):
+                if seen.admit(event.timestamp):
+                    events.append((event, line_start) if with_offsets else event)
+        except (IOError, OSError) as e:
+            raise IOError(f"Failed to read new events: {e}")
+        finally:
+            handle.close()
+
+        self._pending_cursors[consumer] = {
+            "offset": offset,
+            "inode": inode,
+            "last_timestamp": seen.newest,
+            "last_timestamp_count": seen.count,
+        }
+        if commit:
+            self.commit(consumer)
+
+        return events
+
+    def commit(self, consumer: str) -> bool:
+        """
+        Persist the cursor produced by the consumer's last ``read_new``.
+
+        Args:
+            consumer: Consumer name
+
+        Returns:
+            True if a pending cursor was saved, False if there was none
+
+        Raises:
+            IOError: If write fails
+        """
+        cursor = self._pending_cursors.pop(consumer, None)
+        if cursor is None:
+            return False
+
+        self.cursors.save(consumer, cursor)
+        return True
+
+    def _open_binary(self) -> Tuple[Optional[BinaryIO], Optional[int]]:
+        """Open storage for binary reading, returning (handle, inode)."""
+        try:
+            handle = open(self.filepath, "rb")
+        except FileNotFoundError:
+            return None, None
+
+        return handle, os.fstat(handle.fileno()).st_ino
+
+    @staticmethod
+    def _read_complete_lines(
+        handle: BinaryIO, offset: int
+    ) -> Iterator[Tuple[Event, int, int]]:
+        """
+        Read newline-terminated lines from the handle's current position.
+
+        A trailing partial line is left unread so that a concurrent writer can
+        finish it; the handle is rewound to the start of that line.
+
+        Args:
+            handle: Binary file handle positioned at offset
+            offset: Byte offset of the handle's current position
+
+        Yields:
+            (event, line_start, line_end) tuples: the byte offsets of the
+            event's own line and of the position after it
+        """
+        while True:
+            line = handle.readline()
+            if not line:
+                return
+
+            if not line.endswith(b"\n"):
+                handle.seek(offset)
+                return
+
+            line_start = offset
+            offset += len(line)
+            if not line.strip():
+                continue
+
+            try:
+                yield Event.from_dict(json.loads(line)), line_start, offset
+            except (ValueError, TypeError):
+                # Skip invalid lines
+                continue
+
 
 class TTLCleaner:
     """TTL-based cleanup for episodic memory."""
 
     DEFAULT_TTL_DAYS = 7
 
-    def __init__(self, filepath: str, ttl_days: int = DEFAULT_TTL_DAYS):
+    def __init__(
+        self, filepath: str, ttl_days: int = DEFAULT_TTL_DAYS, rollup=None, metrics=None
+    ):
         """
         Initialize TTL cleaner.
 
         Args:
             filepath: Path to episodes.jsonl file
             ttl_days: Number of days to retain (default: 7)
+            rollup: Optional RollupStore brought up to date before events
+                are dropped, so long-horizon counters survive cleanup
+            metrics: Optional CaptureMetrics sink (default: disabled)
         """
-        self.storage = JSONLStorage(filepath)
+        self.storage = JSONLStorage(filepath, metrics=metrics)
+        self.metrics = self.storage.metrics
         self.ttl_days = ttl_days
+        self.rollup = rollup
 
     def cleanup(self, dry_run: bool = False) -> dict:
         """
@@ -177,7 +573,14 @@ class TTLCleaner:
         Returns:
             Dict with cleanup stats: {"removed": int, "kept": int, "total": int}
         """
+        with self.metrics.timer("cleanup"):
+            return self._cleanup(dry_run)
+
+    def _cleanup(self, dry_run: bool) -> dict:
         try:
+            if not dry_run and self.rollup is not None:
+                self.rollup.update(self.storage)
+
             all_events = self.storage.read_all()
 
             if not all_events:
@@ -197,9 +600,8 @@ class TTLCleaner:
 
             if not dry_run and removed_count > 0:
                 # Write-back remaining events (mark-and-sweep approach)
-                self.storage.clear()
-                for event in recent_events:
-                    self.storage.append(event)
+                self.storage.rewrite(recent_events)
+                self.metrics.incr("events_expired", removed_count)
 
             return {
                 "removed": removed_count,
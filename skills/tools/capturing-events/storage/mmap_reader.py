@@ -0,0 +1,234 @@
+"""Memory-mapped reader for scanning large episodes.jsonl files."""
+
+import json
+import mmap
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    from event_schema import Event
+except ImportError:
+    from ..event_schema import Event
+
+
+Prefilter = Union[bytes, Sequence[bytes]]
+
+
+def field_prefilter(field: str, value: str) -> Tuple[bytes, ...]:
+    """
+    Build byte needles matching a top-level ``"field": "value"`` pair.
+
+    Python writers emit ``json.dumps`` output (``": "`` separator) while the
+    VS Code extension emits ``JSON.stringify`` output (``":"`` separator), so
+    both spellings are returned. Non-ASCII text may be written either as
+    ``\\uXXXX`` escapes (``json.dumps`` default) or as raw UTF-8
+    (``JSON.stringify``, ``ensure_ascii=False``), so both encodings are
+    returned too.
+
+    Args:
+        field: JSON field name (e.g. "event_type")
+        value: Expected string value (e.g. "diagnostic_error")
+
+    Returns:
+        Tuple of byte needles, any of which indicates a candidate line
+    """
+    needles: List[bytes] = []
+    for ensure_ascii in (True, False):
+        key = json.dumps(field, ensure_ascii=ensure_ascii).encode("utf-8")
+        encoded = json.dumps(value, ensure_ascii=ensure_ascii).encode("utf-8")
+        for separator in (b": ", b":"):
+            needle = key + separator + encoded
+            if needle not in needles:
+                needles.append(needle)
+    return tuple(needles)
+
+
+def split_line_ranges(filepath: str, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split a file into byte ranges that start and end on line boundaries.
+
+    Each boundary is moved forward to just past the next newline, so every
+    line falls in exactly one range and ranges can be scanned independently.
+
+    Args:
+        filepath: Path to a JSONL file
+        parts: Desired number of ranges (fewer are returned for short files)
+
+    Returns:
+        List of (start, end) byte offsets covering the whole file, in order
+    """
+    try:
+        with open(filepath, "rb") as f:
+            size = f.seek(0, 2)
+            if size == 0:
+                return []
+
+            bounds = [0]
+            for i in range(1, max(parts, 1)):
+                target = max(size * i // parts, bounds[-1])
+                f.seek(target)
+                if target > 0:
+                    f.readline()
+                position = f.tell()
+                if position >= size:
+                    break
+                if position > bounds[-1]:
+                    bounds.append(position)
+    except FileNotFoundError:
+        return []
+
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+class MmapReader:
+    """Zero-copy line reader over a JSONL file.
+
+    Lines are yielded as ``memoryview`` slices of the mapped file, and only
+    lines passing the byte-level prefilter are decoded into ``Event``
+    instances. The prefilter is a necessary condition only: a needle may also
+    occur inside metadata, so callers should confirm matches on the decoded
+    event.
+    """
+
+    def __init__(self, filepath: str):
+        """
+        Initialize mmap reader.
+
+        Args:
+            filepath: Path to episodes.jsonl file
+        """
+        self.filepath = Path(filepath)
+
+    def iter_lines(
+        self,
+        prefilter: Optional[Prefilter] = None,
+        reverse: bool = False,
+        byte_range: Optional[Tuple[int, int]] = None,
+    ) -> Iterator[memoryview]:
+        """
+        Iterate non-empty lines as memoryview slices.
+
+        Each slice is released when the iterator advances, so callers must
+        copy (``bytes(line)``) anything they want to keep.
+
+        Args:
+            prefilter: Byte needle, or sequence of needles, a line must contain
+            reverse: If True, yield lines from the end of the file backwards
+            byte_range: Only scan lines within this (start, end) range, which
+                must fall on line boundaries (see ``split_line_ranges``)
+
+        Yields:
+            memoryview over a single line (without the trailing newline)
+
+        Raises:
+            IOError: If the file cannot be mapped
+        """
+        needles = self._normalize_prefilter(prefilter)
+
+        if not self.filepath.exists():
+            return
+
+        try:
+            with open(self.filepath, "rb") as f:
+                size = f.seek(0, 2)
+                if size == 0:
+                    return
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (IOError, OSError, ValueError) as e:
+            raise IOError(f"Failed to map events: {e}")
+
+        low, high = byte_range if byte_range is not None else (0, size)
+        high = min(high, size)
+        view = memoryview(mm)
+        try:
+            spans = (
+                self._reverse_spans(mm, low, high)
+                if reverse
+                else self._forward_spans(mm, low, high)
+            )
+            for start, end in spans:
+                if end > start and (
+                    needles is None
+                    or any(mm.find(needle, start, end) != -1 for needle in needles)
+                ):
+                    line = view[start:end]
+                    try:
+                        yield line
+                    finally:
+                        line.release()
+        finally:
+            view.release()
+            try:
+                mm.close()
+            except BufferError:
+                # A caller still holds a derived view; let GC unmap it.
+                pass
+
+    @staticmethod
+    def _forward_spans(mm: mmap.mmap, low: int, high: int) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) offsets of each line in [low, high), first to last."""
+        pos = low
+        while pos < high:
+            end = mm.find(b"\n", pos, high)
+            if end == -1:
+                end = high
+            yield pos, end
+            pos = end + 1
+
+    @staticmethod
+    def _reverse_spans(mm: mmap.mmap, low: int, high: int) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) offsets of each line in [low, high), last to first."""
+        end = high
+        while end > low:
+            start = mm.rfind(b"\n", low, end) + 1
+            start = max(start, low)
+            yield start, end
+            end = start - 1
+
+    def iter_events(
+        self, prefilter: Optional[Prefilter] = None, reverse: bool = False
+    ) -> Iterator[Event]:
+        """
+        Iterate events, decoding only lines that pass the prefilter.
+
+        Args:
+            prefilter: Byte needle, or sequence of needles, a line must contain
+            reverse: If True, yield events from the end of the file backwards
+
+        Yields:
+            Event instances (invalid lines are skipped)
+        """
+        for line in self.iter_lines(prefilter, reverse):
+            try:
+                yield Event.from_dict(json.loads(bytes(line)))
+            except (ValueError, TypeError):
+                # Skip invalid lines
+                continue
+
+    def count(self, prefilter: Optional[Prefilter] = None) -> int:
+        """
+        Count non-empty lines passing the prefilter without decoding them.
+
+        Args:
+            prefilter: Byte needle, or sequence of needles, a line must contain
+
+        Returns:
+            Number of candidate lines
+        """
+        return sum(1 for _ in self.iter_lines(prefilter))
+
+    @staticmethod
+    def _normalize_prefilter(prefilter: Optional[Prefilter]) -> Optional[Tuple[bytes, ...]]:
+        """Normalize a prefilter argument into a tuple of byte needles."""
+        if prefilter is None:
+            return None
+
+        if isinstance(prefilter, (bytes, bytearray)):
+            return (bytes(prefilter),)
+
+        needles = tuple(bytes(needle) for needle in prefilter)
+        if not needles:
+            raise ValueError("prefilter must contain at least one needle")
+
+        return needles
@@ -0,0 +1,320 @@
+"""Streaming export of episodes as OTLP-JSON logs and skill spans."""
+
+import hashlib
+import json
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    from event_schema import Event, EventType, iso_to_epoch_us
+except ImportError:
+    from ..event_schema import Event, EventType, iso_to_epoch_us
+
+try:
+    from skill_spans import SpanPairer
+except ImportError:
+    from .skill_spans import SpanPairer
+
+SCOPE_NAME = "pax.capturing-events"
+DEFAULT_SERVICE_NAME = "pax-capture"
+
+# OTLP SeverityNumber values.
+SEVERITY_INFO = 9
+SEVERITY_WARN = 13
+SEVERITY_ERROR = 17
+
+_SEVERITIES = {
+    EventType.DIAGNOSTIC_ERROR: (SEVERITY_ERROR, "ERROR"),
+    EventType.DIAGNOSTIC_WARNING: (SEVERITY_WARN, "WARN"),
+    EventType.TERMINAL_ERROR: (SEVERITY_ERROR, "ERROR"),
+    EventType.SKILL_ERROR: (SEVERITY_ERROR, "ERROR"),
+}
+
+# OTLP span kind INTERNAL and status codes OK / ERROR.
+SPAN_KIND_INTERNAL = 1
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+def _any_value(value: Any) -> Dict[str, Any]:
+    """Encode a metadata value as an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # int64 is a decimal string in the protobuf JSON mapping.
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, str):
+        return {"stringValue": value}
+    return {"stringValue": json.dumps(value, separators=(",", ":"))}
+
+
+def _attributes(values: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _any_value(value)} for key, value in values.items()]
+
+
+def _unix_nano(timestamp: str) -> str:
+    return str(iso_to_epoch_us(timestamp) * 1000)
+
+
+def _hex_id(seed: str, nbytes: int) -> str:
+    """Derive a stable trace/span id so re-exports produce the same ids."""
+    return hashlib.sha256(seed.encode("utf-8")).hexdigest()[: nbytes * 2]
+
+
+class FileSink:
+    """Append each OTLP export request as one JSON line.
+
+    The layout matches what the OpenTelemetry Collector's ``otlpjsonfile``
+    receiver reads; logs and traces go to separate files so each line holds
+    a single signal.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize file sink.
+
+        Args:
+            path: Output file; traces go to ``<stem>.traces<suffix>`` beside it
+        """
+        self.logs_path = Path(path)
+        self.traces_path = self.logs_path.with_name(
+            f"{self.logs_path.stem}.traces{self.logs_path.suffix or '.json'}"
+        )
+        self.logs_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def send(self, signal: str, payload: Dict[str, Any]) -> None:
+        """
+        Write one export request.
+
+        Args:
+            signal: "logs" or "traces"
+            payload: OTLP-JSON export request
+
+        Raises:
+            IOError: If write fails
+        """
+        path = self.logs_path if signal == "logs" else self.traces_path
+        try:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(payload, separators=(",", ":")) + "\n")
+        except (IOError, OSError) as e:
+            raise IOError(f"Failed to write OTLP export: {e}")
+
+
+class HttpSink:
+    """POST export requests to an OTLP/HTTP collector (JSON encoding)."""
+
+    def __init__(
+        self, endpoint: str, timeout: float = 10.0, headers: Optional[Dict[str, str]] = None
+    ):
+        """
+        Initialize HTTP sink.
+
+        Args:
+            endpoint: Collector base URL, e.g. http://localhost:4318
+            timeout: Request timeout in seconds
+            headers: Extra request headers
+        """
+        self.endpoint = endpoint.rstrip("/")
+        self.timeout = timeout
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+
+    def send(self, signal: str, payload: Dict[str, Any]) -> None:
+        """
+        POST one export request to ``/v1/logs`` or ``/v1/traces``.
+
+        Args:
+            signal: "logs" or "traces"
+            payload: OTLP-JSON export request
+
+        Raises:
+            IOError: If the collector rejects the request or is unreachable
+        """
+        request = urllib.request.Request(
+            f"{self.endpoint}/v1/{signal}",
+            data=json.dumps(payload, separators=(",", ":")).encode("utf-8"),
+            headers=self.headers,
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                response.read()
+        except (urllib.error.URLError, OSError) as e:
+            raise IOError(f"Failed to export {signal} to {self.endpoint}: {e}")
+
+
+class OTLPExporter:
+    """Convert an event stream into batched OTLP-JSON logs and spans.
+
+    Every event becomes a log record. Each ``skill_invoke`` is additionally
+    held until the matching ``skill_complete`` or ``skill_error`` arrives
+    (see ``SpanPairer``), and the pair is emitted as a span whose duration is
+    the time between them (``skill_error`` sets an error status). Only the
+    current batch and the open invocations are kept in memory, so arbitrarily
+    large logs can be exported from ``JSONLStorage.iter_events``. Spans reuse
+    the ``span_id`` recorded on skill events when present.
+    """
+
+    DEFAULT_BATCH_SIZE = 512
+
+    def __init__(
+        self,
+        sink: Any,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        service_name: str = DEFAULT_SERVICE_NAME,
+        resource_attributes: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize exporter.
+
+        Args:
+            sink: FileSink, HttpSink, or any object with ``send(signal, payload)``
+            batch_size: Log records or spans per export request
+            service_name: ``service.name`` resource attribute
+            resource_attributes: Extra resource attributes
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+
+        self.sink = sink
+        self.batch_size = batch_size
+        self.resource = {
+            "attributes": _attributes(
+                {"service.name": service_name, **(resource_attributes or {})}
+            )
+        }
+        self._logs: List[Dict[str, Any]] = []
+        self._spans: List[Dict[str, Any]] = []
+        self._pairer = SpanPairer()
+        self._stats = {"logs": 0, "spans": 0, "requests": 0}
+
+    def _log_record(self, event: Event) -> Dict[str, Any]:
+        severity, text = _SEVERITIES.get(event.event_type, (SEVERITY_INFO, "INFO"))
+        attributes = {"event.type": event.event_type.value, "pax.provider": event.provider}
+        for key, value in event.metadata.items():
+            attributes[f"pax.{key}"] = value
+        return {
+            "timeUnixNano": _unix_nano(event.timestamp),
+            "severityNumber": severity,
+            "severityText": text,
+            "body": {"stringValue": event.event_type.value},
+            "attributes": _attributes(attributes),
+        }
+
+    def _span(self, start: Event, end: Event) -> Dict[str, Any]:
+        skill_name = start.metadata.get("skill_name", "")
+        span_id = start.metadata.get("span_id")
+        if isinstance(span_id, str) and len(span_id) == 16:
+            seed = span_id
+        else:
+            # Events captured before span ids existed.
+            seed = f"{start.provider}|{skill_name}|{start.timestamp}"
+            span_id = _hex_id(f"span|{seed}", 8)
+        failed = end.event_type == EventType.SKILL_ERROR
+        span = {
+            "traceId": _hex_id(f"trace|{seed}", 16),
+            "spanId": span_id,
+            "name": f"skill {skill_name}",
+            "kind": SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": _unix_nano(start.timestamp),
+            "endTimeUnixNano": _unix_nano(end.timestamp),
+            "attributes": _attributes(
+                {
+                    "pax.skill_name": skill_name,
+                    "pax.provider": start.provider,
+                    "pax.status": end.metadata.get("status", ""),
+                }
+            ),
+            "status": {"code": STATUS_ERROR if failed else STATUS_OK},
+        }
+        if failed:
+            span["status"]["message"] = str(end.metadata.get("status", ""))
+        return span
+
+    def add(self, event: Event) -> None:
+        """
+        Add one event to the current batch, sending full batches.
+
+        Args:
+            event: Event to export
+
+        Raises:
+            IOError: If the sink fails
+        """
+        self._logs.append(self._log_record(event))
+        if len(self._logs) >= self.batch_size:
+            self._flush_logs()
+
+        pair = self._pairer.add(event)
+        if pair is not None:
+            self._spans.append(self._span(*pair))
+            if len(self._spans) >= self.batch_size:
+                self._flush_spans()
+
+    def _flush_logs(self) -> None:
+        if not self._logs:
+            return
+        payload = {
+            "resourceLogs": [
+                {
+                    "resource": self.resource,
+                    "scopeLogs": [{"scope": {"name": SCOPE_NAME}, "logRecords": self._logs}],
+                }
+            ]
+        }
+        self.sink.send("logs", payload)
+        self._stats["logs"] += len(self._logs)
+        self._stats["requests"] += 1
+        self._logs = []
+
+    def _flush_spans(self) -> None:
+        if not self._spans:
+            return
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": self.resource,
+                    "scopeSpans": [{"scope": {"name": SCOPE_NAME}, "spans": self._spans}],
+                }
+            ]
+        }
+        self.sink.send("traces", payload)
+        self._stats["spans"] += len(self._spans)
+        self._stats["requests"] += 1
+        self._spans = []
+
+    def flush(self) -> None:
+        """
+        Send partially filled batches.
+
+        Raises:
+            IOError: If the sink fails
+        """
+        self._flush_logs()
+        self._flush_spans()
+
+    def export(self, events: Iterable[Event]) -> Dict[str, int]:
+        """
+        Export an event stream and flush.
+
+        Invocations still open at the end of the stream are counted as
+        unpaired and not exported as spans.
+
+        Args:
+            events: Events in log order (e.g. ``JSONLStorage.iter_events()``)
+
+        Returns:
+            Dict with "logs", "spans", "requests" and "unpaired" counts
+
+        Raises:
+            IOError: If the sink fails
+        """
+        for event in events:
+            self.add(event)
+        self.flush()
+
+        return {**self._stats, "unpaired": self._pairer.unpaired + self._pairer.open_count}
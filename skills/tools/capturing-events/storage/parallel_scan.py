@@ -0,0 +1,167 @@
+"""Parallel scans of one large episodes log split into line-aligned chunks."""
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from event_schema import Event
+except ImportError:
+    from ..event_schema import Event
+
+try:
+    from jsonl_handler import JSONLStorage
+    from mmap_reader import split_line_ranges
+except ImportError:
+    from .jsonl_handler import JSONLStorage
+    from .mmap_reader import split_line_ranges
+
+ByteRange = Tuple[int, int]
+
+EXECUTORS = ("thread", "process")
+
+
+def _scan_range(filepath: str, byte_range: ByteRange, filters: Dict[str, Any]) -> List[Event]:
+    """Filter one chunk of the log (worker entry point)."""
+    return list(JSONLStorage(filepath).iter_events(byte_range=byte_range, **filters))
+
+
+def _stats_range(filepath: str, byte_range: ByteRange) -> Dict[str, Any]:
+    """Count one chunk's events by type and provider (worker entry point)."""
+    event_types: Dict[str, int] = {}
+    providers: Dict[str, int] = {}
+    total = 0
+    for event in JSONLStorage(filepath).iter_events(byte_range=byte_range):
+        event_type = event.event_type.value
+        event_types[event_type] = event_types.get(event_type, 0) + 1
+        providers[event.provider] = providers.get(event.provider, 0) + 1
+        total += 1
+    return {"total_events": total, "event_types": event_types, "providers": providers}
+
+
+class ParallelScanner:
+    """Fan filtered reads and aggregations of one log out across workers.
+
+    The log is split into line-aligned byte ranges (about two per worker,
+    none smaller than ``min_chunk_bytes``). Each worker memory-maps the file,
+    scans only its range with the same filters as ``JSONLStorage.iter_events``,
+    and returns either its matching events or partial counts; results are
+    merged in file order. Logs smaller than one chunk are scanned in-process,
+    so small stores pay no pool start-up cost.
+    """
+
+    DEFAULT_MIN_CHUNK_BYTES = 16 << 20
+
+    def __init__(
+        self,
+        filepath: str,
+        workers: Optional[int] = None,
+        min_chunk_bytes: int = DEFAULT_MIN_CHUNK_BYTES,
+        executor: str = "process",
+    ):
+        """
+        Initialize parallel scanner.
+
+        Args:
+            filepath: Path to episodes.jsonl
+            workers: Concurrent chunk scans (default: CPU count)
+            min_chunk_bytes: Smallest range handed to a worker
+            executor: "process" (default, uses every core for JSON decoding)
+                or "thread"
+
+        Raises:
+            ValueError: If executor is unknown or workers/min_chunk_bytes < 1
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor: {executor}. Valid options: {list(EXECUTORS)}")
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be >= 1")
+        if min_chunk_bytes < 1:
+            raise ValueError("min_chunk_bytes must be >= 1")
+
+        self.filepath = Path(filepath)
+        self.workers = workers or os.cpu_count() or 1
+        self.min_chunk_bytes = min_chunk_bytes
+        self.executor = executor
+
+    def ranges(self) -> List[ByteRange]:
+        """
+        Plan the chunks for a scan of the log as it is now.
+
+        Returns:
+            Line-aligned (start, end) byte ranges in file order
+        """
+        try:
+            size = self.filepath.stat().st_size
+        except FileNotFoundError:
+            return []
+
+        parts = max(1, min(self.workers * 2, size // self.min_chunk_bytes))
+        return split_line_ranges(str(self.filepath), parts)
+
+    def _pool(self) -> Executor:
+        if self.executor == "process":
+            return ProcessPoolExecutor(max_workers=self.workers)
+        return ThreadPoolExecutor(max_workers=self.workers)
+
+    def _map(self, func: Callable[..., Any], *args: Any) -> List[Any]:
+        """Run ``func(filepath, range, *args)`` per chunk, returning results in order."""
+        ranges = self.ranges()
+        filepath = str(self.filepath)
+        if len(ranges) <= 1 or self.workers == 1:
+            return [func(filepath, byte_range, *args) for byte_range in ranges]
+
+        with self._pool() as pool:
+            futures = [pool.submit(func, filepath, byte_range, *args) for byte_range in ranges]
+            return [future.result() for future in futures]
+
+    def query(self, **filters: Any) -> List[Event]:
+        """
+        Read matching events in file order.
+
+        Args:
+            **filters: ``since``, ``until``, ``event_type``, ``provider`` or
+                ``filepath`` as accepted by ``JSONLStorage.iter_events``
+
+        Returns:
+            List of matching Event instances
+
+        Raises:
+            IOError: If the log cannot be read
+        """
+        return [event for chunk in self._map(_scan_range, filters) for event in chunk]
+
+    def read_since(self, since_timestamp: str) -> List[Event]:
+        """Read events at or after an ISO 8601 timestamp."""
+        return self.query(since=since_timestamp)
+
+    def read_by_type(self, event_type: str) -> List[Event]:
+        """Read events of one type."""
+        return self.query(event_type=event_type)
+
+    def read_by_provider(self, provider: str) -> List[Event]:
+        """Read events from one provider."""
+        return self.query(provider=provider)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Count events by type and provider, aggregating inside the workers.
+
+        Returns:
+            Dict with "total_events", "event_types", "providers" and the
+            number of "chunks" scanned
+
+        Raises:
+            IOError: If the log cannot be read
+        """
+        partials = self._map(_stats_range)
+        merged: Dict[str, Any] = {"total_events": 0, "event_types": {}, "providers": {}}
+        for partial in partials:
+            merged["total_events"] += partial["total_events"]
+            for key in ("event_types", "providers"):
+                counts = merged[key]
+                for name, count in partial[key].items():
+                    counts[name] = counts.get(name, 0) + count
+        merged["chunks"] = len(partials)
+        return merged
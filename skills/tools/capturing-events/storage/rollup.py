@@ -0,0 +1,231 @@
+"""Time-bucketed rollups of episodes for long-horizon analytics."""
+
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    from event_schema import Event
+except ImportError:
+    from ..event_schema import Event
+
+# Length of the ISO 8601 prefix identifying each bucket, e.g. "2026-02-26T10".
+GRANULARITIES = {"hour": 13, "day": 10}
+
+DIMENSIONS = ("event_type", "provider", "skill_name", "filepath")
+
+
+def _dimension_values(event: Event) -> Dict[str, Optional[str]]:
+    values = {"event_type": event.event_type.value, "provider": event.provider}
+    for key in ("skill_name", "filepath"):
+        value = event.metadata.get(key)
+        values[key] = value if isinstance(value, str) else None
+    return values
+
+
+class RollupStore:
+    """Per-hour and per-day event counters kept beside the episodes log.
+
+    Counters are keyed by bucket (an ISO 8601 prefix) and then by dimension
+    (event_type, provider, skill_name, filepath), so trend queries touch one
+    entry per bucket instead of every raw event. ``update`` folds in events
+    through a ``JSONLStorage`` consumer cursor, which means every event is
+    counted once as it arrives and ``TTLCleaner`` can drop raw events
+    afterwards without losing history.
+    """
+
+    CONSUMER = "rollup"
+    DEFAULT_RETENTION_DAYS = 90
+
+    def __init__(self, filepath: str, retention_days: int = DEFAULT_RETENTION_DAYS):
+        """
+        Initialize rollup store.
+
+        Args:
+            filepath: Path to rollups.json
+            retention_days: Days of buckets to keep (default: 90)
+        """
+        self.filepath = Path(filepath)
+        self.retention_days = retention_days
+        self._buckets = self._load()
+
+    @classmethod
+    def for_log(cls, log_path: str, **kwargs: Any) -> "RollupStore":
+        """
+        Create the rollup store that lives next to an episodes log.
+
+        Args:
+            log_path: Path to episodes.jsonl
+            **kwargs: Passed to the constructor
+
+        Returns:
+            RollupStore for ``rollups.json`` in the log's directory
+        """
+        return cls(str(Path(log_path).parent / "rollups.json"), **kwargs)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        empty = {granularity: {} for granularity in GRANULARITIES}
+        try:
+            with open(self.filepath, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (IOError, OSError, ValueError):
+            return empty
+
+        for granularity in GRANULARITIES:
+            if isinstance(data.get(granularity), dict):
+                empty[granularity] = data[granularity]
+        return empty
+
+    def save(self) -> None:
+        """
+        Prune expired buckets and atomically persist the store.
+
+        Raises:
+            IOError: If write fails
+        """
+        self.prune()
+        tmp_path = self.filepath.with_name(f".{self.filepath.name}.tmp")
+        try:
+            self.filepath.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, **self._buckets}, f, separators=(",", ":"))
+            os.replace(tmp_path, self.filepath)
+        except (IOError, OSError) as e:
+            raise IOError(f"Failed to save rollups: {e}")
+
+    def add(self, events: Iterable[Event]) -> int:
+        """
+        Fold events into the in-memory counters (call ``save`` to persist).
+
+        Args:
+            events: Events to count
+
+        Returns:
+            Number of events counted
+        """
+        counted = 0
+        for event in events:
+            values = _dimension_values(event)
+            for granularity, width in GRANULARITIES.items():
+                bucket = self._buckets[granularity].setdefault(event.timestamp[:width], {})
+                for dimension, value in values.items():
+                    if value is None:
+                        continue
+                    counters = bucket.setdefault(dimension, {})
+                    counters[value] = counters.get(value, 0) + 1
+            counted += 1
+        return counted
+
+    def update(self, storage: Any) -> int:
+        """
+        Count events appended to storage since the last update.
+
+        Args:
+            storage: JSONLStorage whose ``rollup`` consumer cursor is advanced
+
+        Returns:
+            Number of events folded in
+        """
+        events = storage.read_new(self.CONSUMER, commit=False)
+        counted = self.add(events)
+        self.save()
+        storage.commit(self.CONSUMER)
+        return counted
+
+    def prune(self) -> int:
+        """
+        Drop buckets older than the retention window.
+
+        Returns:
+            Number of buckets removed
+        """
+        cutoff = (datetime.utcnow() - timedelta(days=self.retention_days)).isoformat()
+        removed = 0
+        for granularity, width in GRANULARITIES.items():
+            buckets = self._buckets[granularity]
+            for key in [k for k in buckets if k < cutoff[:width]]:
+                del buckets[key]
+                removed += 1
+        return removed
+
+    def _select(
+        self, granularity: str, since: Optional[str], until: Optional[str]
+    ) -> List[str]:
+        if granularity not in GRANULARITIES:
+            raise ValueError(
+                f"Unknown granularity: {granularity}. Valid options: {sorted(GRANULARITIES)}"
+            )
+        width = GRANULARITIES[granularity]
+        return sorted(
+            key
+            for key in self._buckets[granularity]
+            if (since is None or key >= since[:width])
+            and (until is None or key < until[:width])
+        )
+
+    def query(
+        self,
+        dimension: str = "event_type",
+        granularity: str = "day",
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        value: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return a time series of counters for one dimension.
+
+        ``since`` and ``until`` are compared at bucket granularity: the bucket
+        containing ``since`` is included, the one containing ``until`` is not.
+
+        Args:
+            dimension: One of DIMENSIONS
+            granularity: "hour" or "day"
+            since: ISO 8601 lower bound (inclusive)
+            until: ISO 8601 upper bound (exclusive)
+            value: If given, report only this value's count per bucket
+
+        Returns:
+            List of {"bucket": str, "counts": {value: int}} (or
+            {"bucket": str, "count": int} when ``value`` is given), oldest first
+
+        Raises:
+            ValueError: If dimension or granularity is unknown
+        """
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Unknown dimension: {dimension}. Valid options: {list(DIMENSIONS)}")
+
+        series = []
+        for key in self._select(granularity, since, until):
+            counts = self._buckets[granularity][key].get(dimension, {})
+            if value is None:
+                series.append({"bucket": key, "counts": dict(counts)})
+            else:
+                series.append({"bucket": key, "count": counts.get(value, 0)})
+        return series
+
+    def totals(
+        self,
+        dimension: str = "event_type",
+        granularity: str = "day",
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """
+        Sum a dimension's counters over a time range.
+
+        Args:
+            dimension: One of DIMENSIONS
+            granularity: "hour" or "day"
+            since: ISO 8601 lower bound (inclusive, bucket granularity)
+            until: ISO 8601 upper bound (exclusive, bucket granularity)
+
+        Returns:
+            Dict mapping dimension value to total count
+        """
+        totals: Dict[str, int] = {}
+        for point in self.query(dimension, granularity, since, until):
+            for value, count in point["counts"].items():
+                totals[value] = totals.get(value, 0) + count
+        return totals
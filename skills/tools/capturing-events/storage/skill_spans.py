@@ -0,0 +1,235 @@
+"""Pair skill invocations with their outcome and profile skill latency."""
+
+import json
+import os
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from event_schema import Event, EventType
+except ImportError:
+    from ..event_schema import Event, EventType
+
+SKILL_END_TYPES = (EventType.SKILL_COMPLETE, EventType.SKILL_ERROR)
+
+PROFILE_VERSION = 1
+
+
+class SpanPairer:
+    """Match ``skill_invoke`` events with their ``skill_complete``/``skill_error``.
+
+    Events carrying a ``span_id`` are matched by id. Older events without
+    one fall back to the most recent open invocation of the same skill from
+    the same provider. Open invocations are bounded by ``max_open``; the
+    oldest is forgotten (and counted as unpaired) when the bound is hit.
+    """
+
+    DEFAULT_MAX_OPEN = 10000
+
+    def __init__(self, max_open: int = DEFAULT_MAX_OPEN):
+        """
+        Initialize span pairer.
+
+        Args:
+            max_open: Maximum invocations held while waiting for their outcome
+        """
+        self.max_open = max_open
+        self.unpaired = 0
+        self._open: "OrderedDict[str, Event]" = OrderedDict()
+        self._anonymous: Dict[Tuple[str, Any], List[str]] = {}
+        self._sequence = 0
+
+    @property
+    def open_count(self) -> int:
+        """Number of invocations still waiting for an outcome."""
+        return len(self._open)
+
+    @staticmethod
+    def _skill_key(event: Event) -> Tuple[str, Any]:
+        return event.provider, event.metadata.get("skill_name")
+
+    def _forget(self, key: str) -> None:
+        """Drop an anonymous open key from its per-skill stack."""
+        start = self._open.pop(key)
+        stack = self._anonymous.get(self._skill_key(start))
+        if stack and key in stack:
+            stack.remove(key)
+            if not stack:
+                del self._anonymous[self._skill_key(start)]
+
+    def add(self, event: Event) -> Optional[Tuple[Event, Event]]:
+        """
+        Feed one event.
+
+        Args:
+            event: Any event; non-skill events are ignored
+
+        Returns:
+            (invoke event, outcome event) when the event closes a span, else None
+        """
+        event_type = event.event_type
+        if event_type != EventType.SKILL_INVOKE and event_type not in SKILL_END_TYPES:
+            return None
+
+        span_id = event.metadata.get("span_id")
+        if event_type == EventType.SKILL_INVOKE:
+            if span_id:
+                key = f"id:{span_id}"
+            else:
+                self._sequence += 1
+                key = f"seq:{self._sequence}"
+                self._anonymous.setdefault(self._skill_key(event), []).append(key)
+            self._open[key] = event
+            if len(self._open) > self.max_open:
+                oldest = next(iter(self._open))
+                if oldest.startswith("seq:"):
+                    self._forget(oldest)
+                else:
+                    del self._open[oldest]
+                self.unpaired += 1
+            return None
+
+        if span_id:
+            start = self._open.pop(f"id:{span_id}", None)
+        else:
+            # Innermost (most recent) invocation completes first.
+            stack = self._anonymous.get(self._skill_key(event))
+            start = None
+            if stack:
+                key = stack[-1]
+                start = self._open[key]
+                self._forget(key)
+
+        if start is None:
+            self.unpaired += 1
+            return None
+        return start, event
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of pre-sorted values (0.0 for empty input)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class SkillProfiler:
+    """Streaming per-skill latency and error-rate profile.
+
+    Feed events in log order (e.g. from ``JSONLStorage.iter_events``); only
+    open invocations and one duration per finished span are kept.
+    """
+
+    def __init__(self, max_open: int = SpanPairer.DEFAULT_MAX_OPEN):
+        """
+        Initialize skill profiler.
+
+        Args:
+            max_open: Maximum invocations held while waiting for their outcome
+        """
+        self.pairer = SpanPairer(max_open)
+        self._invocations: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+        self._durations: Dict[str, List[float]] = {}
+
+    def add(self, event: Event) -> None:
+        """
+        Feed one event.
+
+        Args:
+            event: Any event; non-skill events are ignored
+        """
+        if event.event_type == EventType.SKILL_INVOKE:
+            name = str(event.metadata.get("skill_name", ""))
+            self._invocations[name] = self._invocations.get(name, 0) + 1
+
+        pair = self.pairer.add(event)
+        if pair is None:
+            return
+
+        start, end = pair
+        name = str(start.metadata.get("skill_name", ""))
+        try:
+            duration = (
+                datetime.fromisoformat(end.timestamp) - datetime.fromisoformat(start.timestamp)
+            ).total_seconds() * 1000
+        except ValueError:
+            return
+        self._durations.setdefault(name, []).append(max(duration, 0.0))
+        if end.event_type == EventType.SKILL_ERROR:
+            self._errors[name] = self._errors.get(name, 0) + 1
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize durations and error rates per skill.
+
+        Returns:
+            Dict with "version", per-skill "skills" entries (invocations,
+            finished, errors, error_rate, mean/p50/p95/p99/max in ms) and the
+            total number of unpaired events
+        """
+        skills = {}
+        for name in sorted(set(self._invocations) | set(self._durations)):
+            durations = sorted(self._durations.get(name, []))
+            finished = len(durations)
+            errors = self._errors.get(name, 0)
+            skills[name] = {
+                "invocations": self._invocations.get(name, 0),
+                "finished": finished,
+                "errors": errors,
+                "error_rate": round(errors / finished, 4) if finished else 0.0,
+                "mean_ms": round(sum(durations) / finished, 3) if finished else 0.0,
+                "p50_ms": round(_percentile(durations, 50), 3),
+                "p95_ms": round(_percentile(durations, 95), 3),
+                "p99_ms": round(_percentile(durations, 99), 3),
+                "max_ms": round(durations[-1], 3) if durations else 0.0,
+            }
+
+        return {
+            "version": PROFILE_VERSION,
+            "skills": skills,
+            "unpaired": self.pairer.unpaired + self.pairer.open_count,
+        }
+
+    def profile(self, events: Iterable[Event]) -> Dict[str, Any]:
+        """
+        Feed an event stream and summarize it.
+
+        Args:
+            events: Events in log order
+
+        Returns:
+            Summary (see ``summary``)
+        """
+        for event in events:
+            self.add(event)
+        return self.summary()
+
+
+def write_profile(summary: Dict[str, Any], path: str) -> None:
+    """
+    Atomically write a profile as stable, diff-friendly JSON.
+
+    Keys are sorted and each skill sits on its own block, so profiles from
+    two releases can be compared with a plain ``diff``.
+
+    Args:
+        summary: Output of ``SkillProfiler.summary``
+        path: Destination file
+
+    Raises:
+        IOError: If write fails
+    """
+    target = Path(path)
+    tmp_path = target.with_name(f".{target.name}.tmp")
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=1, sort_keys=True)
+            f.write("\n")
+        os.replace(tmp_path, target)
+    except (IOError, OSError) as e:
+        raise IOError(f"Failed to write skill profile: {e}")
@@ -0,0 +1,424 @@
+"""SQLite storage backend for episodes with indexed queries."""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+try:
+    from event_schema import Event
+except ImportError:
+    from ..event_schema import Event
+
+try:
+    from cursors import SeenEvents
+except ImportError:
+    from .cursors import SeenEvents
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    filepath TEXT,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_timestamp ON events (timestamp);
+CREATE INDEX IF NOT EXISTS idx_events_type ON events (event_type, timestamp);
+CREATE INDEX IF NOT EXISTS idx_events_provider ON events (provider, timestamp);
+CREATE INDEX IF NOT EXISTS idx_events_filepath ON events (filepath, timestamp);
+CREATE TABLE IF NOT EXISTS migrations (
+    source TEXT PRIMARY KEY,
+    byte_offset INTEGER NOT NULL,
+    inode INTEGER,
+    last_timestamp TEXT,
+    last_timestamp_count INTEGER
+);
+"""
+
+
+class SQLiteStorage:
+    """Indexed SQLite storage for events.
+
+    Drop-in alternative to ``JSONLStorage`` for workspaces whose queries by
+    type, provider, time range or file path have outgrown linear scans. The
+    database runs in WAL mode so readers do not block the capture writer.
+    """
+
+    DEFAULT_BATCH_SIZE = 1000
+
+    def __init__(self, filepath: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Initialize SQLite storage.
+
+        Args:
+            filepath: Path to the SQLite database file
+            batch_size: Rows per transaction for append_many
+        """
+        self.filepath = Path(filepath)
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.filepath), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    @staticmethod
+    def _to_row(event: Event) -> tuple:
+        event.validate()
+        filepath = event.metadata.get("filepath")
+        return (
+            event.timestamp,
+            event.event_type.value,
+            event.provider,
+            filepath if isinstance(filepath, str) else None,
+            json.dumps(event.metadata),
+        )
+
+    @staticmethod
+    def _from_rows(rows: Iterable[tuple]) -> List[Event]:
+        events = []
+        for event_type, provider, timestamp, metadata in rows:
+            try:
+                events.append(
+                    Event.from_dict(
+                        {
+                            "event_type": event_type,
+                            "provider": provider,
+                            "timestamp": timestamp,
+                            "metadata": json.loads(metadata),
+                        }
+                    )
+                )
+            except ValueError:
+                # Skip invalid rows
+                continue
+        return events
+
+    def _query(self, where: str = "", params: tuple = ()) -> List[Event]:
+        sql = "SELECT event_type, provider, timestamp, metadata FROM events"
+        if where:
+            sql += f" WHERE {where}"
+        sql += " ORDER BY id"
+
+        try:
+            with self._lock:
+                rows = self._conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            raise IOError(f"Failed to read events: {e}")
+
+        return self._from_rows(rows)
+
+    def append(self, event: Event) -> bool:
+        """
+        Append event to the database.
+
+        Args:
+            event: Event to append
+
+        Returns:
+            True if successful
+
+        Raises:
+            IOError: If write fails
+        """
+        return self.append_many([event]) == 1
+
+    def append_many(self, events: Iterable[Event]) -> int:
+        """
+        Append events in batched transactions.
+
+        Args:
+            events: Events to append
+
+        Returns:
+            Number of events written
+
+        Raises:
+            IOError: If write fails
+        """
+        written = 0
+        batch = []
+        try:
+            for event in events:
+                batch.append(self._to_row(event))
+                if len(batch) >= self.batch_size:
+                    written += self._insert(batch)
+                    batch = []
+
+            if batch:
+                written += self._insert(batch)
+        except sqlite3.Error as e:
+            raise IOError(f"Failed to append events: {e}")
+
+        return written
+
+    def _insert(self, rows: List[tuple]) -> int:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO events (timestamp, event_type, provider, filepath, metadata) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def _insert_migrated(self, source: str, rows: List[tuple], progress: tuple) -> int:
+        """Insert migrated rows and record the source's progress in one transaction."""
+        with self._lock, self._conn:
+            if rows:
+                self._conn.executemany(
+                    "INSERT INTO events (timestamp, event_type, provider, filepath, metadata) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO migrations "
+                "(source, byte_offset, inode, last_timestamp, last_timestamp_count) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (source, *progress),
+            )
+        return len(rows)
+
+    def _migration_progress(self, source: str) -> tuple:
+        """Return (byte offset, inode, newest timestamp, its count) recorded for a source."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT byte_offset, inode, last_timestamp, last_timestamp_count "
+                "FROM migrations WHERE source = ?",
+                (source,),
+            ).fetchone()
+        return row if row is not None else (0, None, None, 0)
+
+    def read_all(self) -> List[Event]:
+        """
+        Read all events from storage.
+
+        Returns:
+            List of Event instances in insertion order
+        """
+        return self._query()
+
+    def read_since(self, since_timestamp: str) -> List[Event]:
+        """
+        Read events since timestamp.
+
+        Args:
+            since_timestamp: ISO 8601 timestamp
+
+        Returns:
+            List of Event instances at or after timestamp
+        """
+        return self._query("timestamp >= ?", (since_timestamp,))
+
+    def read_by_type(self, event_type: str) -> List[Event]:
+        """
+        Read events of specific type.
+
+        Args:
+            event_type: Event type to filter
+
+        Returns:
+            List of matching Event instances
+        """
+        return self._query("event_type = ?", (event_type,))
+
+    def read_by_provider(self, provider: str) -> List[Event]:
+        """
+        Read events from specific provider.
+
+        Args:
+            provider: Provider name to filter
+
+        Returns:
+            List of matching Event instances
+        """
+        return self._query("provider = ?", (provider,))
+
+    def read_by_filepath(self, filepath: str) -> List[Event]:
+        """
+        Read events whose metadata refers to a file path.
+
+        Args:
+            filepath: File path to filter
+
+        Returns:
+            List of matching Event instances
+        """
+        return self._query("filepath = ?", (filepath,))
+
+    def count(self) -> int:
+        """
+        Count events in storage.
+
+        Returns:
+            Number of events
+        """
+        try:
+            with self._lock:
+                return self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+        except sqlite3.Error:
+            return 0
+
+    def clear(self) -> bool:
+        """
+        Clear all events from storage.
+
+        Returns:
+            True if successful
+        """
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM events")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class SQLiteTTLCleaner:
+    """TTL-based cleanup for the SQLite backend."""
+
+    DEFAULT_TTL_DAYS = 7
+
+    def __init__(self, storage: SQLiteStorage, ttl_days: int = DEFAULT_TTL_DAYS):
+        """
+        Initialize TTL cleaner.
+
+        Args:
+            storage: SQLite storage to clean
+            ttl_days: Number of days to retain (default: 7)
+        """
+        self.storage = storage
+        self.ttl_days = ttl_days
+
+    def _cutoff(self) -> str:
+        return (datetime.utcnow() - timedelta(days=self.ttl_days)).isoformat()
+
+    def cleanup(self, dry_run: bool = False) -> dict:
+        """
+        Remove events older than TTL using the timestamp index.
+
+        Args:
+            dry_run: If True, don't actually remove events
+
+        Returns:
+            Dict with cleanup stats: {"removed": int, "kept": int, "total": int}
+        """
+        cutoff = self._cutoff()
+        conn = self.storage._conn
+        try:
+            with self.storage._lock, conn:
+                total = conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+                removed = conn.execute(
+                    "SELECT COUNT(*) FROM events WHERE timestamp < ?", (cutoff,)
+                ).fetchone()[0]
+
+                if not dry_run and removed > 0:
+                    conn.execute("DELETE FROM events WHERE timestamp < ?", (cutoff,))
+
+            return {"removed": removed, "kept": total - removed, "total": total}
+        except sqlite3.Error:
+            return {"removed": 0, "kept": 0, "total": 0, "error": "Cleanup failed"}
+
+    def should_cleanup(self) -> bool:
+        """
+        Check if cleanup is needed.
+
+        Returns:
+            True if storage has events older than TTL
+        """
+        try:
+            with self.storage._lock:
+                row = self.storage._conn.execute(
+                    "SELECT MIN(timestamp) FROM events"
+                ).fetchone()
+        except sqlite3.Error:
+            return False
+
+        return row[0] is not None and row[0] < self._cutoff()
+
+
+def migrate_jsonl(jsonl_path: str, db_path: str, batch_size: Optional[int] = None) -> dict:
+    """
+    Copy events from an episodes.jsonl file into a SQLite database.
+
+    The JSONL file is streamed line by line and inserted in batched
+    transactions, so memory use does not depend on the log size. The source
+    file is left untouched.
+
+    Migration is incremental and safe to re-run. Each batch is committed
+    together with the source's byte offset, inode, and newest migrated
+    timestamp with its event count in the ``migrations`` table, so a later
+    run copies only lines appended since and an interrupted run resumes
+    where it stopped. If the log was compacted or truncated in between, it
+    is re-read from the start and already migrated events are skipped as
+    consumer cursors do (see ``SeenEvents``), including its clock-skew
+    limitation. A trailing partial line is left for the next run.
+
+    Args:
+        jsonl_path: Source episodes.jsonl file
+        db_path: Destination SQLite database (created if missing)
+        batch_size: Rows per transaction (default: SQLiteStorage.DEFAULT_BATCH_SIZE)
+
+    Returns:
+        Dict with migration stats: {"migrated": int, "skipped": int}
+
+    Raises:
+        IOError: If the source cannot be read or the destination written
+    """
+    storage = SQLiteStorage(db_path, batch_size or SQLiteStorage.DEFAULT_BATCH_SIZE)
+    source = str(Path(jsonl_path).resolve())
+    migrated = 0
+    skipped = 0
+
+    try:
+        with open(jsonl_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            offset, inode, newest, count = storage._migration_progress(source)
+            seen = SeenEvents(newest, count)
+            if (inode is not None and inode != stat.st_ino) or stat.st_size < offset:
+                offset = 0
+                seen.replay()
+            f.seek(offset)
+
+            rows = []
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                offset += len(line)
+                if not line.strip():
+                    continue
+
+                try:
+                    event = Event.from_json(line.decode("utf-8"))
+                except (ValueError, TypeError):
+                    skipped += 1
+                    continue
+
+                if not seen.admit(event.timestamp):
+                    continue
+                rows.append(SQLiteStorage._to_row(event))
+                if len(rows) >= storage.batch_size:
+                    migrated += storage._insert_migrated(
+                        source, rows, (offset, stat.st_ino, seen.newest, seen.count)
+                    )
+                    rows = []
+
+            migrated += storage._insert_migrated(
+                source, rows, (offset, stat.st_ino, seen.newest, seen.count)
+            )
+    except (IOError, OSError, sqlite3.Error) as e:
+        raise IOError(f"Failed to migrate events: {e}")
+    finally:
+        storage.close()
+
+    return {"migrated": migrated, "skipped": skipped}
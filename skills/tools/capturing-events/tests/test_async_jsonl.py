@@ -0,0 +1,85 @@
+"""Unit tests for asyncio JSONL storage."""
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# Handle imports from hyphenated parent directory
+try:
+    # Try relative imports first (when run via standard unittest discovery)
+    from ..event_schema import Event, EventType
+    from ..storage.async_jsonl import AsyncJSONLStorage
+except (ImportError, ValueError):
+    # Fall back to sys.modules lookup (when run via custom test runner)
+    Event = sys.modules['event_schema'].Event
+    EventType = sys.modules['event_schema'].EventType
+    AsyncJSONLStorage = sys.modules['async_jsonl'].AsyncJSONLStorage
+
+
+def _event(i):
+    return Event(
+        EventType.FILE_MODIFY if i % 2 else EventType.TERMINAL_EXECUTE,
+        "universal",
+        {"filepath": f"{i}.py", "command": f"run {i}"},
+        f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}",
+    )
+
+
+class TestAsyncJSONLStorage(unittest.IsolatedAsyncioTestCase):
+    """Test batched appends, reads and async iteration."""
+
+    async def asyncSetUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_path = Path(self.temp_dir.name) / "episodes.jsonl"
+        self.storage = AsyncJSONLStorage(str(self.log_path), batch_size=8, flush_interval=0.05)
+
+    async def asyncTearDown(self):
+        await self.storage.aclose()
+        self.temp_dir.cleanup()
+
+    async def test_concurrent_appends_are_batched(self):
+        """Test concurrent appends land as whole lines in few batches."""
+        results = await asyncio.gather(*(self.storage.append(_event(i)) for i in range(20)))
+
+        self.assertTrue(all(results))
+        lines = self.log_path.read_text().splitlines()
+        self.assertEqual(len(lines), 20)
+        self.assertEqual(await self.storage.count(), 20)
+
+    async def test_reads_see_queued_appends(self):
+        """Test reads flush pending appends before reading."""
+        for i in range(3):
+            self.storage.submit(_event(i))
+        self.assertEqual(self.storage.pending, 3)
+
+        events = await self.storage.read_by_type("terminal_execute")
+        self.assertEqual(len(events), 2)
+        self.assertEqual(self.storage.pending, 0)
+
+    async def test_invalid_event_rejected_before_queueing(self):
+        """Test validation errors surface immediately and leave the queue alone."""
+        with self.assertRaises(ValueError):
+            self.storage.submit(Event(EventType.FILE_MODIFY, "", {}))
+        self.assertEqual(self.storage.pending, 0)
+
+    async def test_iter_events_in_chunks(self):
+        """Test async iteration streams filtered events across chunks."""
+        await asyncio.gather(*(self.storage.append(_event(i)) for i in range(10)))
+
+        seen = [
+            event.metadata["filepath"]
+            async for event in self.storage.iter_events(chunk_size=2, event_type="file_modify")
+        ]
+        self.assertEqual(seen, ["1.py", "3.py", "5.py", "7.py", "9.py"])
+
+    async def test_closed_storage_rejects_appends(self):
+        """Test appends after aclose fail instead of being dropped."""
+        await self.storage.aclose()
+        with self.assertRaises(ValueError):
+            self.storage.submit(_event(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
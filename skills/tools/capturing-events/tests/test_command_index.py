@@ -0,0 +1,122 @@
+"""Unit tests for command fingerprints and the command index."""
+
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# Handle imports from hyphenated parent directory
+try:
+    # Try relative imports first (when run via standard unittest discovery)
+    from ..event_schema import Event, EventType
+    from ..providers.universal import UniversalProvider
+    from ..storage.command_index import CommandIndex, fingerprint
+    from ..storage.jsonl_handler import JSONLStorage
+except (ImportError, ValueError):
+    # Fall back to sys.modules lookup (when run via custom test runner)
+    Event = sys.modules['event_schema'].Event
+    EventType = sys.modules['event_schema'].EventType
+    UniversalProvider = sys.modules['universal'].UniversalProvider
+    CommandIndex = sys.modules['command_index'].CommandIndex
+    fingerprint = sys.modules['command_index'].fingerprint
+    JSONLStorage = sys.modules['jsonl_handler'].JSONLStorage
+
+
+class TestFingerprint(unittest.TestCase):
+    """Test command normalization."""
+
+    def test_masks_volatile_arguments(self):
+        """Test paths, numbers, ids, URLs and quoted strings are masked."""
+        self.assertEqual(fingerprint("pytest tests/test_a.py -x"), "pytest <path> -x")
+        self.assertEqual(fingerprint("git log -n 5"), "git log -n <num>")
+        self.assertEqual(fingerprint("git checkout 3f37107"), "git checkout <id>")
+        self.assertEqual(fingerprint('git commit -m "fix bug"'), "git commit -m <str>")
+        self.assertEqual(fingerprint("curl https://x.io/a"), "curl <url>")
+        self.assertEqual(fingerprint("pytest --maxfail=3"), "pytest --maxfail=<num>")
+
+    def test_keeps_command_shape(self):
+        """Test env assignments and program directories are dropped."""
+        self.assertEqual(
+            fingerprint("CI=1 /usr/bin/npm test && make build"), "npm test && make build"
+        )
+        self.assertEqual(fingerprint("echo 'unbalanced"), "echo 'unbalanced")
+        self.assertEqual(fingerprint("   "), "")
+
+
+class TestCommandIndex(unittest.TestCase):
+    """Test incremental indexing and queries."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_path = str(Path(self.temp_dir.name) / "episodes.jsonl")
+        self.storage = JSONLStorage(self.log_path)
+        self.provider = UniversalProvider()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _run(self, command, exit_code=None, duration_ms=None, event_type="terminal_execute"):
+        self.storage.append(
+            self.provider.capture_terminal_event(
+                event_type, command, exit_code=exit_code, duration_ms=duration_ms
+            )
+        )
+
+    def test_terminal_metadata(self):
+        """Test exit code and duration are recorded only when given."""
+        event = self.provider.capture_terminal_event("terminal_execute", "ls", exit_code=0)
+        self.assertEqual(event.metadata["exit_code"], 0)
+        self.assertNotIn("duration_ms", event.metadata)
+
+    def test_update_is_incremental(self):
+        """Test each update indexes only new terminal events."""
+        self._run("pytest tests/test_a.py", exit_code=1, duration_ms=1000)
+        self._run("pytest tests/test_b.py", exit_code=0, duration_ms=3000)
+        self.storage.append(
+            Event(EventType.FILE_MODIFY, "universal", {"filepath": "a.py"})
+        )
+        index = CommandIndex.for_log(self.log_path)
+        self.assertEqual(index.update(self.storage), 2)
+
+        self._run("pytest tests/test_c.py", event_type="terminal_error")
+        reloaded = CommandIndex.for_log(self.log_path)
+        self.assertEqual(reloaded.update(self.storage), 1)
+        self.assertEqual(reloaded.update(self.storage), 0)
+
+        entry = reloaded.lookup("pytest tests/other.py")
+        self.assertEqual(entry["count"], 3)
+        self.assertEqual(entry["failures"], 2)
+        self.assertEqual(entry["timed_runs"], 2)
+        self.assertEqual(entry["mean_ms"], 2000.0)
+        self.assertEqual(entry["max_ms"], 3000.0)
+
+    def test_last_offset_points_at_latest_run(self):
+        """Test the stored offset seeks straight to the latest run's line."""
+        self._run("make build")
+        self._run("make test")
+        self._run("make build -j8")
+        index = CommandIndex.for_log(self.log_path)
+        index.update(self.storage)
+
+        offset = index.lookup("make test")["last_offset"]
+        with open(self.log_path, "rb") as f:
+            f.seek(offset)
+            self.assertIn(b'"make test"', f.readline())
+
+    def test_query_sort_and_match(self):
+        """Test queries filter by substring and sort by failure rate."""
+        self._run("npm test", exit_code=1)
+        self._run("npm test", exit_code=0)
+        self._run("npm run lint", exit_code=1)
+        self._run("git status", exit_code=0)
+        index = CommandIndex.for_log(self.log_path)
+        index.update(self.storage)
+
+        ranked = index.query(match="npm", sort="failure_rate")
+        self.assertEqual([entry["fingerprint"] for entry in ranked], ["npm run lint", "npm test"])
+        with self.assertRaises(ValueError):
+            index.query(sort="bogus")
+
+
+if __name__ == '__main__':
+    unittest.main()
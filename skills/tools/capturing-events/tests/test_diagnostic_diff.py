@@ -0,0 +1,140 @@
+"""Unit tests for diagnostic snapshot diffing."""
+
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# Handle imports from hyphenated parent directory
+try:
+    # Try relative imports first (when run via standard unittest discovery)
+    from ..event_schema import EventType
+    from ..providers.diagnostic_diff import DiagnosticSnapshotCache
+    from ..providers.facade import ProviderFacade
+    from ..providers.sampling import SamplingPolicy
+except (ImportError, ValueError):
+    # Fall back to sys.modules lookup (when run via custom test runner)
+    EventType = sys.modules['event_schema'].EventType
+    DiagnosticSnapshotCache = sys.modules['diagnostic_diff'].DiagnosticSnapshotCache
+    ProviderFacade = sys.modules['facade'].ProviderFacade
+    SamplingPolicy = sys.modules['sampling'].SamplingPolicy
+
+
+UNDEFINED = {"line": 3, "message": "Undefined name 'x'", "severity": "error"}
+UNUSED = {"line": 9, "message": "Unused import", "severity": "warning"}
+
+
+class TestDiagnosticSnapshotCache(unittest.TestCase):
+    """Test per-file diffing of published diagnostic sets."""
+
+    def setUp(self):
+        self.cache = DiagnosticSnapshotCache()
+
+    def test_republished_set_is_unchanged(self):
+        """Test re-publishing the same set records nothing new."""
+        added, resolved, unchanged = self.cache.diff("a.py", [UNDEFINED, UNUSED])
+        self.assertEqual((len(added), len(resolved), unchanged), (2, 0, 0))
+
+        for _ in range(100):
+            added, resolved, unchanged = self.cache.diff("a.py", [UNUSED, UNDEFINED])
+            self.assertEqual((added, resolved, unchanged), ([], [], 2))
+
+    def test_added_and_resolved(self):
+        """Test changes are reported and first_seen is kept."""
+        self.cache.diff("a.py", [UNDEFINED], "2026-01-01T00:00:00")
+        added, resolved, unchanged = self.cache.diff("a.py", [UNUSED], "2026-01-01T00:05:00")
+
+        self.assertEqual([d["message"] for d in added], ["Unused import"])
+        self.assertEqual(resolved[0]["message"], "Undefined name 'x'")
+        self.assertEqual(resolved[0]["first_seen"], "2026-01-01T00:00:00")
+        self.assertEqual(unchanged, 0)
+
+    def test_files_are_independent(self):
+        """Test snapshots are kept per file and empty sets clear them."""
+        self.cache.diff("a.py", [UNDEFINED])
+        self.cache.diff("b.py", [UNDEFINED])
+        _, resolved, _ = self.cache.diff("a.py", [])
+
+        self.assertEqual(len(resolved), 1)
+        self.assertEqual(self.cache.open_diagnostics("a.py"), [])
+        self.assertEqual(len(self.cache.open_diagnostics("b.py")), 1)
+
+    def test_invalid_diagnostic(self):
+        """Test invalid diagnostics raise ValueError."""
+        with self.assertRaises(ValueError):
+            self.cache.diff("a.py", [{"line": 1, "message": "m", "severity": "fatal"}])
+        with self.assertRaises(ValueError):
+            self.cache.diff("a.py", [{"line": "1", "message": "m"}])
+
+    def test_persistence(self):
+        """Test snapshots survive a reload from disk."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = str(Path(temp_dir) / "episodes.jsonl")
+            cache = DiagnosticSnapshotCache.for_log(log_path)
+            cache.diff("a.py", [UNDEFINED])
+            cache.save()
+
+            reloaded = DiagnosticSnapshotCache.for_log(log_path)
+            self.assertEqual(reloaded.diff("a.py", [UNDEFINED]), ([], [], 1))
+
+    def test_concurrent_saves_merge(self):
+        """Test two caches saving different files keep both snapshots."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = str(Path(temp_dir) / "episodes.jsonl")
+            first = DiagnosticSnapshotCache.for_log(log_path)
+            second = DiagnosticSnapshotCache.for_log(log_path)
+            first.diff("a.py", [UNDEFINED])
+            second.diff("b.py", [UNUSED])
+            first.save()
+            second.save()
+
+            reloaded = DiagnosticSnapshotCache.for_log(log_path)
+            self.assertEqual(len(reloaded.open_diagnostics("a.py")), 1)
+            self.assertEqual(len(reloaded.open_diagnostics("b.py")), 1)
+
+
+class TestFacadeDiagnosticSnapshot(unittest.TestCase):
+    """Test snapshot capture through the provider facade."""
+
+    def test_events_for_changes_only(self):
+        """Test only added and resolved diagnostics become events."""
+        facade = ProviderFacade(provider="universal")
+
+        events, unchanged = facade.capture_diagnostic_snapshot("a.py", [UNDEFINED, UNUSED])
+        self.assertEqual(
+            sorted(e.event_type for e in events),
+            sorted([EventType.DIAGNOSTIC_ERROR, EventType.DIAGNOSTIC_WARNING]),
+        )
+
+        events, unchanged = facade.capture_diagnostic_snapshot("a.py", [UNUSED])
+        self.assertEqual(unchanged, 1)
+        self.assertEqual(len(events), 1)
+        resolved = events[0]
+        self.assertEqual(resolved.event_type, EventType.DIAGNOSTIC_RESOLVED)
+        self.assertEqual(resolved.metadata["severity"], "error")
+        self.assertEqual(resolved.metadata["line"], 3)
+        self.assertIn("first_seen", resolved.metadata)
+        self.assertGreaterEqual(resolved.metadata["open_seconds"], 0)
+
+    def test_changes_bypass_sampling(self):
+        """Test a policy that drops every diagnostic never loses a change."""
+        drop_all = {"mode": "token_bucket", "rate": 0.001, "burst": 1}
+        sampling = SamplingPolicy(
+            {"diagnostic_error": drop_all, "diagnostic_resolved": drop_all}
+        )
+        facade = ProviderFacade(provider="universal", sampling=sampling)
+        for event_type in ("diagnostic_error", "diagnostic_resolved"):
+            # Spend each bucket's only token so further events are dropped.
+            spent = facade.provider.capture_diagnostic_event(event_type, "b.py", 1, "x", "error")
+            self.assertIsNotNone(sampling.admit(spent))
+
+        added, _ = facade.capture_diagnostic_snapshot("a.py", [UNDEFINED])
+        resolved, _ = facade.capture_diagnostic_snapshot("a.py", [])
+
+        self.assertEqual([e.event_type for e in added], [EventType.DIAGNOSTIC_ERROR])
+        self.assertEqual([e.event_type for e in resolved], [EventType.DIAGNOSTIC_RESOLVED])
+        self.assertIn("first_seen", resolved[0].metadata)
+
+
+if __name__ == '__main__':
+    unittest.main()
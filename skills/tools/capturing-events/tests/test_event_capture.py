@@ -1,15 +1,27 @@
 """Unit tests for event capture logic."""
 
 import json
+import subprocess
+import tempfile
 import unittest
 from datetime import datetime
+from pathlib import Path
 import sys
 import os
 
 # Handle imports from hyphenated parent directory
 try:
     # Try relative imports first (when run via standard unittest discovery)
-    from ..event_schema import Event, EventType, EventValidator
+    from ..event_schema import (
+        SCHEMA_VERSION,
+        Event,
+        EventDecoder,
+        EventType,
+        EventValidator,
+        epoch_us_to_iso,
+        event_type_from_value,
+        iso_to_epoch_us,
+    )
     from ..providers.universal import (
         UniversalProvider,
         FileWatcher,
@@ -22,12 +34,18 @@ except (ImportError, ValueError):
     Event = sys.modules['event_schema'].Event
     EventType = sys.modules['event_schema'].EventType
     EventValidator = sys.modules['event_schema'].EventValidator
+    SCHEMA_VERSION = sys.modules['event_schema'].SCHEMA_VERSION
+    EventDecoder = sys.modules['event_schema'].EventDecoder
+    event_type_from_value = sys.modules['event_schema'].event_type_from_value
+    epoch_us_to_iso = sys.modules['event_schema'].epoch_us_to_iso
+    iso_to_epoch_us = sys.modules['event_schema'].iso_to_epoch_us
     UniversalProvider = sys.modules['universal'].UniversalProvider
     FileWatcher = sys.modules['universal'].FileWatcher
     TerminalListener = sys.modules['universal'].TerminalListener
     DiagnosticCollector = sys.modules['universal'].DiagnosticCollector
     SkillTracker = sys.modules['universal'].SkillTracker
 
+IMPLEMENTATION = Path(__file__).resolve().parent.parent / "implementation.py"
 
 
 class TestEventType(unittest.TestCase):
@@ -50,6 +68,7 @@ class TestEventType(unittest.TestCase):
         self.assertEqual(EventType.DIAGNOSTIC_ERROR.value, "diagnostic_error")
         self.assertEqual(EventType.DIAGNOSTIC_WARNING.value, "diagnostic_warning")
         self.assertEqual(EventType.DIAGNOSTIC_INFO.value, "diagnostic_info")
+        self.assertEqual(EventType.DIAGNOSTIC_RESOLVED.value, "diagnostic_resolved")
 
     def test_skill_events(self):
         """Test skill event types."""
@@ -188,6 +207,104 @@ class TestEvent(unittest.TestCase):
         self.assertEqual(event1, event2)
 
 
+class TestEventRecordLayout(unittest.TestCase):
+    """Test compact on-disk records and legacy upgrades."""
+
+    def test_record_has_schema_version(self):
+        """Test records carry the schema version and compact separators."""
+        event = Event(EventType.FILE_CREATE, "universal", {"filepath": "a.py"},
+                      timestamp="2026-02-26T10:30:00")
+
+        line = event.to_json()
+
+        self.assertEqual(json.loads(line)["v"], SCHEMA_VERSION)
+        self.assertNotIn(": ", line)
+
+    def test_epoch_timestamp_round_trip(self):
+        """Test epoch-microsecond timestamps decode to the same ISO string."""
+        event = Event(EventType.FILE_CREATE, "universal", {},
+                      timestamp="2026-02-26T10:30:00.123456")
+
+        record = event.to_record(epoch_timestamps=True)
+
+        self.assertIsInstance(record["timestamp"], int)
+        self.assertEqual(Event.from_dict(record), event)
+
+    def test_epoch_helpers(self):
+        """Test ISO and epoch conversions are exact inverses."""
+        self.assertEqual(iso_to_epoch_us("1970-01-01T00:00:01"), 1_000_000)
+        self.assertEqual(epoch_us_to_iso(1_000_001), "1970-01-01T00:00:01.000001")
+        self.assertEqual(iso_to_epoch_us("1970-01-01T01:00:00+01:00"), 0)
+
+    def test_legacy_line_upgraded(self):
+        """Test version 1 lines drop metadata duplicating top-level fields."""
+        line = (
+            '{"event_type": "file_create", "provider": "universal", '
+            '"timestamp": "2026-02-26T10:30:00", "metadata": {"filepath": "a.py", '
+            '"event_type": "file_create", "timestamp": "2026-02-26T10:29:59"}}'
+        )
+
+        event = Event.from_json(line)
+
+        self.assertEqual(event.metadata, {"filepath": "a.py"})
+        self.assertEqual(event.timestamp, "2026-02-26T10:30:00")
+
+    def test_current_metadata_untouched(self):
+        """Test versioned records keep metadata exactly as written."""
+        data = {"v": SCHEMA_VERSION, "event_type": "skill_invoke", "provider": "universal",
+                "timestamp": "2026-02-26T10:30:00", "metadata": {"timestamp": "custom"}}
+
+        self.assertEqual(Event.from_dict(data).metadata, {"timestamp": "custom"})
+
+
+class TestEventDecoder(unittest.TestCase):
+    """Test bulk decoding with string interning."""
+
+    def _lines(self, count):
+        return [
+            Event(EventType.FILE_MODIFY, "universal", {"filepath": f"src/{i % 3}.py"},
+                  timestamp=f"2026-02-26T10:30:{i:02d}").to_json() + "\n"
+            for i in range(count)
+        ]
+
+    def test_event_type_lookup(self):
+        """Test the precomputed event type map."""
+        self.assertIs(event_type_from_value("file_create"), EventType.FILE_CREATE)
+        with self.assertRaises(ValueError):
+            event_type_from_value("unknown")
+        with self.assertRaises(ValueError):
+            event_type_from_value(["file_create"])
+
+    def test_decode_matches_from_json(self):
+        """Test bulk decoding matches per-line decoding across chunks."""
+        lines = self._lines(7)
+
+        events = list(EventDecoder(chunk_size=3).decode_lines(lines))
+
+        self.assertEqual(events, [Event.from_json(line) for line in lines])
+
+    def test_repeated_strings_are_shared(self):
+        """Test providers and metadata values are interned."""
+        events = list(EventDecoder(chunk_size=2).decode_lines(self._lines(6)))
+
+        self.assertIs(events[0].provider, events[5].provider)
+        self.assertIs(events[0].metadata["filepath"], events[3].metadata["filepath"])
+        self.assertIs(
+            next(iter(events[0].metadata)), next(iter(events[1].metadata))
+        )
+
+    def test_invalid_lines_skipped(self):
+        """Test a corrupt line only drops itself, not its chunk."""
+        lines = self._lines(4)
+        lines.insert(2, "invalid json line\n")
+        lines.insert(3, "\n")
+        lines.insert(4, "42\n")
+
+        events = list(EventDecoder(chunk_size=10).decode_lines(lines))
+
+        self.assertEqual(len(events), 4)
+
+
 class TestFileWatcher(unittest.TestCase):
     """Test FileWatcher class."""
 
@@ -196,20 +313,20 @@ class TestFileWatcher(unittest.TestCase):
         metadata = FileWatcher.capture_event("file_create", "/test/file.txt")
 
         self.assertEqual(metadata["filepath"], "/test/file.txt")
-        self.assertEqual(metadata["event_type"], "file_create")
-        self.assertIn("timestamp", metadata)
+        self.assertNotIn("event_type", metadata)
+        self.assertNotIn("timestamp", metadata)
 
     def test_capture_modify_event(self):
         """Test capturing file modify event."""
         metadata = FileWatcher.capture_event("file_modify", "/test/file.txt")
 
-        self.assertEqual(metadata["event_type"], "file_modify")
+        self.assertEqual(metadata, {"filepath": "/test/file.txt"})
 
     def test_capture_delete_event(self):
         """Test capturing file delete event."""
         metadata = FileWatcher.capture_event("file_delete", "/test/file.txt")
 
-        self.assertEqual(metadata["event_type"], "file_delete")
+        self.assertEqual(metadata, {"filepath": "/test/file.txt"})
 
     def test_invalid_event_type(self):
         """Test invalid event type."""
@@ -231,7 +348,7 @@ class TestTerminalListener(unittest.TestCase):
         self.assertEqual(metadata["command"], "ls -la")
         self.assertEqual(metadata["output"], "file1.txt file2.txt")
         self.assertEqual(metadata["error"], "")
-        self.assertIn("timestamp", metadata)
+        self.assertNotIn("timestamp", metadata)
 
     def test_output_truncation(self):
         """Test that large output is truncated."""
@@ -290,7 +407,7 @@ class TestSkillTracker(unittest.TestCase):
 
         self.assertEqual(metadata["skill_name"], "my-skill")
         self.assertEqual(metadata["status"], "start")
-        self.assertIn("timestamp", metadata)
+        self.assertNotIn("timestamp", metadata)
 
     def test_capture_with_details(self):
         """Test capturing with details."""
@@ -399,5 +516,187 @@ class TestEventValidator(unittest.TestCase):
         self.assertIsNone(result["event"])
 
 
+
+class CLITestCase(unittest.TestCase):
+    """Base for tests running implementation.py in a scratch workspace."""
+
+    def setUp(self):
+        """Create a workspace with an empty pax-memory directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.memory_dir = Path(self.temp_dir.name) / ".vscode" / "pax-memory"
+        self.memory_dir.mkdir(parents=True)
+        self.log_path = self.memory_dir / "episodes.jsonl"
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        self.temp_dir.cleanup()
+
+    def run_cli(self, *args, stdin=""):
+        """Run the CLI from the workspace root and return the completed process."""
+        env = {k: v for k, v in os.environ.items() if not k.startswith("PAX_CAPTURE_")}
+        return subprocess.run(
+            [sys.executable, str(IMPLEMENTATION), *args],
+            cwd=self.temp_dir.name,
+            input=stdin,
+            capture_output=True,
+            text=True,
+            env=env,
+            timeout=60,
+        )
+
+    def stored_records(self):
+        """Return the raw records in the workspace log."""
+        if not self.log_path.exists():
+            return []
+        with open(self.log_path, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+
+class TestSamplingConfigCLI(CLITestCase):
+    """Test how the CLI treats a broken sampling.json."""
+
+    def setUp(self):
+        """Write a malformed sampling policy."""
+        super().setUp()
+        (self.memory_dir / "sampling.json").write_text('{"rules": 5}', encoding="utf-8")
+
+    def test_capture_reports_error(self):
+        """Test captures fail with a result document on stderr, not a traceback."""
+        result = self.run_cli("file", "modify", "app.py")
+
+        self.assertEqual(result.returncode, 1)
+        report = json.loads(result.stderr)
+        self.assertFalse(report["success"])
+        self.assertIn("sampling.json", report["error"])
+        self.assertEqual(self.stored_records(), [])
+
+    def test_read_only_commands_ignore_policy(self):
+        """Test commands that do not capture never load the policy."""
+        for args in (("read",), ("stats",), ("cleanup", "--dry-run")):
+            result = self.run_cli(*args)
+            self.assertEqual(result.returncode, 0, result.stderr)
+
+
+
+class TestIngestCLI(CLITestCase):
+    """Test bulk NDJSON ingestion through the ingest subcommand."""
+
+    def ingest(self, lines, *args):
+        """Ingest description dicts or raw lines and return (process, result)."""
+        stdin = "".join(
+            (line if isinstance(line, str) else json.dumps(line)) + "\n" for line in lines
+        )
+        result = self.run_cli("ingest", *args, stdin=stdin)
+        return result, json.loads(result.stdout)
+
+    def test_kind_descriptions(self):
+        """Test each kind builds the same event as its capture subcommand."""
+        _, report = self.ingest([
+            {"kind": "file", "type": "create", "filepath": "app.py"},
+            {"kind": "terminal", "command": "npm test", "exit_code": 1},
+            {"kind": "diagnostic", "filepath": "app.py", "line": 3, "message": "Undefined",
+             "severity": "warning"},
+            {"kind": "skill", "type": "invoke", "name": "reflect", "status": "started"},
+        ])
+
+        self.assertTrue(report["success"])
+        self.assertEqual(report["ingested"], 4)
+        records = self.stored_records()
+        self.assertEqual(
+            [r["event_type"] for r in records],
+            ["file_create", "terminal_execute", "diagnostic_warning", "skill_invoke"],
+        )
+        self.assertEqual(records[2]["metadata"]["line"], 3)
+
+    def test_full_records_and_timestamps(self):
+        """Test records with event_type and both timestamp forms are kept as given."""
+        epoch_us = iso_to_epoch_us("2026-02-26T10:15:00.000250")
+        _, report = self.ingest([
+            {"event_type": "file_modify", "metadata": {"filepath": "a.py"},
+             "timestamp": "2026-02-26T10:00:00"},
+            {"kind": "terminal", "command": "make", "timestamp": epoch_us},
+        ])
+
+        self.assertEqual(report["ingested"], 2)
+        events = [Event.from_dict(r) for r in self.stored_records()]
+        self.assertEqual(events[0].event_type, EventType.FILE_MODIFY)
+        self.assertEqual(events[0].timestamp, "2026-02-26T10:00:00")
+        self.assertEqual(events[1].timestamp, epoch_us_to_iso(epoch_us))
+        self.assertEqual(events[1].timestamp, "2026-02-26T10:15:00.000250")
+
+    def test_invalid_lines_reported(self):
+        """Test invalid lines are skipped, counted and reported up to --max-errors."""
+        _, report = self.ingest(
+            [
+                {"kind": "file", "type": "modify", "filepath": "ok.py"},
+                "{not json",
+                {"kind": "spaceship"},
+                {"kind": "file", "type": "modify"},
+                {"event_type": "file_modify", "timestamp": "yesterday"},
+            ],
+            "--max-errors", "2",
+        )
+
+        self.assertTrue(report["success"])
+        self.assertEqual(report["ingested"], 1)
+        self.assertEqual(report["invalid"], 4)
+        self.assertEqual([e["line"] for e in report["errors"]], [2, 3])
+        self.assertEqual(len(self.stored_records()), 1)
+
+    def test_strict_writes_nothing(self):
+        """Test --strict rejects the whole input when any line is invalid."""
+        result, report = self.ingest(
+            [{"kind": "file", "type": "modify", "filepath": "ok.py"}, {"kind": "file"}],
+            "--strict",
+        )
+
+        self.assertEqual(result.returncode, 1)
+        self.assertFalse(report["success"])
+        self.assertEqual(report["invalid"], 1)
+        self.assertEqual(report["errors"][0]["line"], 2)
+        self.assertEqual(self.stored_records(), [])
+
+
+
+class TestReadCLI(CLITestCase):
+    """Test the read subcommand's output formats."""
+
+    def test_ndjson_matches_json_format(self):
+        """Test NDJSON lines carry the same event dicts as --format json."""
+        self.run_cli("file", "create", "app.py")
+        self.run_cli("terminal", "make", "--exit-code", "0")
+
+        ndjson = self.run_cli("read").stdout.splitlines()
+        document = json.loads(self.run_cli("read", "--format", "json").stdout)
+
+        self.assertEqual([json.loads(line) for line in ndjson], document["events"])
+        self.assertNotIn("v", json.loads(ndjson[0]))
+
+    def test_json_format_into_closed_pipe(self):
+        """Test --format json exits quietly when the reader stops early."""
+        self.run_cli(
+            "ingest",
+            stdin="".join(
+                json.dumps({"kind": "file", "type": "modify", "filepath": f"f{i}.py"}) + "\n"
+                for i in range(2000)
+            ),
+        )
+        env = {k: v for k, v in os.environ.items() if not k.startswith("PAX_CAPTURE_")}
+        process = subprocess.Popen(
+            [sys.executable, str(IMPLEMENTATION), "read", "--format", "json"],
+            cwd=self.temp_dir.name,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+        )
+        process.stdout.read(16)
+        process.stdout.close()
+        stderr = process.stderr.read().decode()
+        process.stderr.close()
+
+        self.assertEqual(process.wait(timeout=60), 0)
+        self.assertNotIn("Traceback", stderr)
+
+
 if __name__ == "__main__":
     unittest.main()
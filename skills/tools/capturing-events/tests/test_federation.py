@@ -0,0 +1,139 @@
+"""Unit tests for federated multi-workspace queries."""
+
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+import sys
+
+# Handle imports from hyphenated parent directory
+try:
+    # Try relative imports first (when run via standard unittest discovery)
+    from ..event_schema import Event, EventType
+    from ..storage import federation
+    from ..storage.federation import FederatedStore, discover_stores
+    from ..storage.jsonl_handler import JSONLStorage
+except (ImportError, ValueError):
+    # Fall back to sys.modules lookup (when run via custom test runner)
+    Event = sys.modules['event_schema'].Event
+    EventType = sys.modules['event_schema'].EventType
+    federation = sys.modules['federation']
+    FederatedStore = sys.modules['federation'].FederatedStore
+    discover_stores = sys.modules['federation'].discover_stores
+    JSONLStorage = sys.modules['jsonl_handler'].JSONLStorage
+
+
+class TestFederatedStore(unittest.TestCase):
+    """Test discovery and k-way merged reads across workspaces."""
+
+    def setUp(self):
+        """Create three workspaces with interleaved timestamps."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.workspaces = {}
+        layout = {
+            "alpha": [1, 4, 7],
+            "group/beta": [2, 5],
+            # Out-of-order appends must still merge correctly.
+            "gamma": [6, 3],
+        }
+        for name, seconds in layout.items():
+            workspace = self.root / name
+            storage = JSONLStorage(str(workspace / ".vscode" / "pax-memory" / "episodes.jsonl"))
+            for second in seconds:
+                event_type = EventType.FILE_MODIFY if second % 2 else EventType.TERMINAL_EXECUTE
+                storage.append(
+                    Event(event_type, "universal", {"filepath": f"{name}.py", "command": "x"},
+                          f"2026-01-01T00:00:0{second}")
+                )
+            self.workspaces[name] = str(workspace.resolve())
+
+        # Stores inside dependency directories are ignored.
+        JSONLStorage(str(self.root / "node_modules" / "pkg" / ".vscode" / "pax-memory"
+                         / "episodes.jsonl")).append(Event(EventType.FILE_CREATE, "universal", {}))
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        self.temp_dir.cleanup()
+
+    def test_discover_stores(self):
+        """Test discovery finds nested workspaces and skips excluded dirs."""
+        stores = discover_stores([str(self.root)])
+        self.assertEqual(len(stores), 3)
+        self.assertFalse(any("node_modules" in str(store) for store in stores))
+
+        self.assertEqual(len(discover_stores([str(self.root)], max_depth=1)), 2)
+
+    def test_merged_in_timestamp_order(self):
+        """Test events from all workspaces come out in timestamp order."""
+        store = FederatedStore.discover([str(self.root)])
+        results = list(store.iter_events())
+
+        self.assertEqual(
+            [event.timestamp[-1] for _, event in results], list("1234567")
+        )
+        self.assertEqual(results[0][0], self.workspaces["alpha"])
+        self.assertEqual(results[1][0], self.workspaces["group/beta"])
+        self.assertEqual(results[2][0], self.workspaces["gamma"])
+
+    def test_filters_reverse_and_limit(self):
+        """Test filters apply per store and limit applies globally."""
+        store = FederatedStore.discover([str(self.root)])
+
+        odd = list(store.iter_events(event_type="file_modify"))
+        self.assertEqual([e.timestamp[-1] for _, e in odd], list("1357"))
+
+        newest = list(store.iter_events(reverse=True, limit=3))
+        self.assertEqual([e.timestamp[-1] for _, e in newest], list("765"))
+
+        window = list(store.iter_events(since="2026-01-01T00:00:03", until="2026-01-01T00:00:05"))
+        self.assertEqual([e.timestamp[-1] for _, e in window], list("34"))
+
+    def test_streams_stores_in_small_chunks(self):
+        """Test chunked scans with a small reorder window keep the merge order."""
+        store = FederatedStore.discover([str(self.root)], chunk_bytes=64, reorder_window=1)
+
+        forward = [e.timestamp[-1] for _, e in store.iter_events()]
+        backward = [e.timestamp[-1] for _, e in store.iter_events(reverse=True)]
+
+        self.assertEqual(forward, list("1234567"))
+        self.assertEqual(backward, list("7654321"))
+        with self.assertRaises(ValueError):
+            FederatedStore([], reorder_window=0)
+
+    def test_stores_scanned_concurrently(self):
+        """Test every store's first chunk is scanned before the merge pulls from any."""
+        scan_chunk = federation._scan_chunk
+        barrier = threading.Barrier(3, timeout=5)
+
+        def scan_together(*args):
+            # Breaks (and fails the read) unless all three stores scan at once.
+            barrier.wait()
+            return scan_chunk(*args)
+
+        store = FederatedStore.discover([str(self.root)], max_workers=3)
+        with mock.patch.object(federation, "_scan_chunk", scan_together):
+            results = list(store.iter_events())
+
+        self.assertEqual([e.timestamp[-1] for _, e in results], list("1234567"))
+
+    def test_counts(self):
+        """Test per-workspace counts."""
+        counts = FederatedStore.discover([str(self.root)]).counts()
+        self.assertEqual(counts[self.workspaces["alpha"]], 3)
+        self.assertEqual(sum(counts.values()), 7)
+
+    def test_invalid_executor(self):
+        """Test unknown executor raises ValueError."""
+        with self.assertRaises(ValueError):
+            FederatedStore([], executor="fiber")
+
+    def test_empty(self):
+        """Test federating no stores yields nothing."""
+        self.assertEqual(list(FederatedStore([]).iter_events()), [])
+        self.assertEqual(FederatedStore([]).counts(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+"""Unit tests for capture self-metrics."""
+
+import gc
+import os
+import tempfile
+import threading
+import unittest
+import weakref
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+from unittest import mock
+
+# Handle imports from hyphenated parent directory
+try:
+    # Try relative imports first (when run via standard unittest discovery)
+    from ..event_schema import Event, EventType
+    from ..metrics import (
+        NULL_METRICS,
+        CaptureMetrics,
+        Histogram,
+        load_metrics_file,
+        merge_metrics_file,
+        metrics_from_env,
+    )
+    from ..storage.jsonl_handler import JSONLStorage, TTLCleaner
+except (ImportError, ValueError):
+    # Fall back to sys.modules lookup (when run via custom test runner)
+    Event = sys.modules['event_schema'].Event
+    EventType = sys.modules['event_schema'].EventType
+    NULL_METRICS = sys.modules['metrics'].NULL_METRICS
+    CaptureMetrics = sys.modules['metrics'].CaptureMetrics
+    Histogram = sys.modules['metrics'].Histogram
+    load_metrics_file = sys.modules['metrics'].load_metrics_file
+    merge_metrics_file = sys.modules['metrics'].merge_metrics_file
+    metrics_from_env = sys.modules['metrics'].metrics_from_env
+    JSONLStorage = sys.modules['jsonl_handler'].JSONLStorage
+    TTLCleaner = sys.modules['jsonl_handler'].TTLCleaner
+
+
+class TestHistogram(unittest.TestCase):
+    """Test power-of-two latency histograms."""
+
+    def test_percentiles_use_bucket_bounds(self):
+        """Test percentiles report the containing bucket's upper bound."""
+        histogram = Histogram()
+        for micros in [3] * 90 + [1000] * 10:
+            histogram.observe(micros / 1e6)
+
+        self.assertEqual(histogram.percentile(50), 4)
+        self.assertEqual(histogram.percentile(99), 1000)
+        summary = histogram.to_dict()
+        self.assertEqual(summary["count"], 100)
+        self.assertEqual(summary["max_us"], 1000)
+
+    def test_merge(self):
+        """Test serialized histograms add up."""
+        first, second = Histogram(), Histogram()
+        first.observe(0.001)
+        second.observe(0.002)
+        first.merge(second.to_dict())
+        self.assertEqual(first.total, 2)
+        self.assertEqual(first.max_us, 2000)
+
+
+class TestCaptureMetrics(unittest.TestCase):
+    """Test counters, timers and accumulated dumps."""
+
+    def setUp(self):
+        """Create temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dump_path = str(Path(self.temp_dir.name) / "metrics.json")
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        self.temp_dir.cleanup()
+
+    def test_counters_and_timers(self):
+        """Test snapshot reports counters and latency summaries."""
+        metrics = CaptureMetrics()
+        metrics.incr("events_written")
+        metrics.incr("events_written", 2)
+        with metrics.timer("append"):
+            pass
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["counters"]["events_written"], 3)
+        self.assertEqual(snapshot["latency"]["append"]["count"], 1)
+
+    def test_dumps_accumulate_across_processes(self):
+        """Test each dump merges only the delta since the previous one."""
+        first = CaptureMetrics(self.dump_path)
+        first.incr("events_written", 2)
+        first.observe("append", 0.001)
+        first.dump()
+        first.incr("events_written")
+        first.dump()
+
+        # A later process adds to the same file.
+        second = CaptureMetrics(self.dump_path)
+        second.incr("events_written", 4)
+        second.observe("append", 0.002)
+        second.dump()
+
+        report = load_metrics_file(self.dump_path)
+        self.assertEqual(report["counters"]["events_written"], 7)
+        self.assertEqual(report["latency"]["append"]["count"], 2)
+
+    def test_concurrent_merges_keep_every_delta(self):
+        """Test parallel dumps into one file do not overwrite each other."""
+        def merge_many():
+            for _ in range(25):
+                merge_metrics_file(self.dump_path, {"events_written": 1}, {})
+
+        threads = [threading.Thread(target=merge_many) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(load_metrics_file(self.dump_path)["counters"]["events_written"], 100)
+
+    def test_instances_are_not_pinned_until_exit(self):
+        """Test a dropped metrics instance can be garbage collected."""
+        metrics = CaptureMetrics(self.dump_path)
+        ref = weakref.ref(metrics)
+        del metrics
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_maybe_dump_respects_interval(self):
+        """Test periodic dumps only happen after the interval."""
+        metrics = CaptureMetrics(self.dump_path, dump_interval=3600)
+        metrics.incr("events_written")
+        metrics.maybe_dump()
+        self.assertFalse(os.path.exists(self.dump_path))
+
+        metrics.dump_interval = 0
+        metrics.maybe_dump()
+        self.assertEqual(load_metrics_file(self.dump_path)["counters"]["events_written"], 1)
+
+    def test_metrics_from_env(self):
+        """Test the environment switch selects the sink and dump path."""
+        log_path = str(Path(self.temp_dir.name) / "episodes.jsonl")
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertIs(metrics_from_env(log_path), NULL_METRICS)
+        with mock.patch.dict(os.environ, {"PAX_CAPTURE_METRICS": "1"}, clear=True):
+            metrics = metrics_from_env(log_path)
+            self.assertTrue(metrics.enabled)
+            self.assertEqual(str(metrics.dump_path), self.dump_path)
+
+    def test_storage_instrumentation(self):
+        """Test JSONLStorage and TTLCleaner report their work."""
+        log_path = str(Path(self.temp_dir.name) / "episodes.jsonl")
+        metrics = CaptureMetrics()
+        storage = JSONLStorage(log_path, metrics=metrics)
+        old = (datetime.utcnow() - timedelta(days=10)).isoformat()
+        storage.append(Event(EventType.FILE_MODIFY, "universal", {"filepath": "a.py"}, old))
+        storage.append(Event(EventType.FILE_MODIFY, "universal", {"filepath": "b.py"}))
+        self.assertEqual(metrics.snapshot()["counters"]["bytes_written"], os.path.getsize(log_path))
+
+        storage.read_all()
+        TTLCleaner(log_path, metrics=metrics).cleanup()
+
+        snapshot = metrics.snapshot()
+        counters = snapshot["counters"]
+        self.assertEqual(counters["events_written"], 2)
+        self.assertEqual(counters["bytes_rewritten"], os.path.getsize(log_path))
+        self.assertEqual(counters["events_expired"], 1)
+        self.assertEqual(counters["events_read"], 4)
+        for operation in ("append", "read", "rewrite", "cleanup"):
+            self.assertIn(operation, snapshot["latency"])
+
+    def test_disabled_storage_records_nothing(self):
+        """Test storage defaults to the no-op sink."""
+        storage = JSONLStorage(str(Path(self.temp_dir.name) / "episodes.jsonl"))
+        storage.append(Event(EventType.FILE_MODIFY, "universal", {"filepath": "a.py"}))
+        self.assertIs(storage.metrics, NULL_METRICS)
+        self.assertEqual(storage.metrics.snapshot(), {"counters": {}, "latency": {}})
+
+
+if __name__ == '__main__':
+    unittest.main()
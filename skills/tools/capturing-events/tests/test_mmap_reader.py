@@ -0,0 +1,155 @@
+"""Unit tests for the memory-mapped episode reader."""
+
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# Handle imports from hyphenated parent directory
+try:
+    # Try relative imports first (when run via standard unittest discovery)
+    from ..event_schema import Event, EventType
+    from ..storage.jsonl_handler import JSONLStorage
+    from ..storage.mmap_reader import MmapReader, field_prefilter
+except (ImportError, ValueError):
+    # Fall back to sys.modules lookup (when run via custom test runner)
+    Event = sys.modules['event_schema'].Event
+    EventType = sys.modules['event_schema'].EventType
+    JSONLStorage = sys.modules['jsonl_handler'].JSONLStorage
+    MmapReader = sys.modules['mmap_reader'].MmapReader
+    field_prefilter = sys.modules['mmap_reader'].field_prefilter
+
+
+class TestMmapReader(unittest.TestCase):
+    """Test MmapReader class."""
+
+    def setUp(self):
+        """Create temporary storage file for testing."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.storage_path = str(Path(self.temp_dir.name) / "episodes.jsonl")
+        self.storage = JSONLStorage(self.storage_path)
+        self.reader = MmapReader(self.storage_path)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        self.temp_dir.cleanup()
+
+    def _append_mixed(self):
+        self.storage.append(Event(EventType.FILE_CREATE, "universal", {"filepath": "a.py"}))
+        self.storage.append(
+            Event(EventType.DIAGNOSTIC_ERROR, "universal", {"filepath": "a.py", "line": 3})
+        )
+        self.storage.append(Event(EventType.FILE_MODIFY, "copilot", {"filepath": "b.py"}))
+
+    def test_missing_file(self):
+        """Test reading a file that does not exist."""
+        self.assertEqual(list(self.reader.iter_events()), [])
+        self.assertEqual(self.reader.count(), 0)
+
+    def test_empty_file(self):
+        """Test reading an empty file."""
+        Path(self.storage_path).touch()
+
+        self.assertEqual(list(self.reader.iter_events()), [])
+
+    def test_iter_events_matches_read_all(self):
+        """Test unfiltered iteration matches JSONLStorage.read_all."""
+        self._append_mixed()
+
+        self.assertEqual(list(self.reader.iter_events()), self.storage.read_all())
+
+    def test_prefilter_by_event_type(self):
+        """Test byte-level prefilter only decodes matching lines."""
+        self._append_mixed()
+
+        events = list(
+            self.reader.iter_events(field_prefilter("event_type", "diagnostic_error"))
+        )
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].event_type, EventType.DIAGNOSTIC_ERROR)
+
+    def test_prefilter_matches_compact_json(self):
+        """Test prefilter matches lines written without separator spaces."""
+        with open(self.storage_path, "w", encoding="utf-8") as f:
+            f.write(
+                '{"event_type":"file_create","provider":"universal",'
+                '"timestamp":"2026-02-26T10:30:00","metadata":{}}\n'
+            )
+
+        events = list(self.reader.iter_events(field_prefilter("provider", "universal")))
+
+        self.assertEqual(len(events), 1)
+
+    def test_prefilter_matches_non_ascii_either_encoding(self):
+        """Test non-ASCII values match whether escaped or written raw."""
+        self.storage.append(Event(EventType.FILE_CREATE, "universal", {"filepath": "café.py"}))
+        with open(self.storage_path, "a", encoding="utf-8") as f:
+            f.write(
+                '{"event_type":"file_modify","provider":"universal",'
+                '"timestamp":"2026-02-26T10:30:00","metadata":{"filepath":"café.py"}}\n'
+            )
+        self.storage.append(Event(EventType.FILE_CREATE, "universal", {"filepath": "cafe.py"}))
+
+        events = list(self.reader.iter_events(field_prefilter("filepath", "café.py")))
+
+        self.assertEqual(
+            [e.event_type for e in events], [EventType.FILE_CREATE, EventType.FILE_MODIFY]
+        )
+
+    def test_iter_lines_yields_memoryview(self):
+        """Test lines are yielded as memoryview slices without newlines."""
+        self._append_mixed()
+
+        lines = [bytes(line) for line in self.reader.iter_lines()]
+
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(all(not line.endswith(b"\n") for line in lines))
+
+        for line in self.reader.iter_lines():
+            self.assertIsInstance(line, memoryview)
+            break
+
+    def test_reverse_iteration(self):
+        """Test lines can be iterated from the end of the file."""
+        self._append_mixed()
+        with open(self.storage_path, "a", encoding="utf-8") as f:
+            f.write("\n")
+
+        forward = list(self.reader.iter_events())
+        backward = list(self.reader.iter_events(reverse=True))
+
+        self.assertEqual(backward, forward[::-1])
+
+    def test_count_with_prefilter(self):
+        """Test counting candidate lines without decoding."""
+        self._append_mixed()
+
+        self.assertEqual(self.reader.count(), 3)
+        self.assertEqual(self.reader.count(field_prefilter("provider", "copilot")), 1)
+
+    def test_skips_invalid_and_blank_lines(self):
+        """Test invalid JSON and blank lines are skipped."""
+        self._append_mixed()
+        with open(self.storage_path, "a", encoding="utf-8") as f:
+            f.write("\ninvalid json line\n42\n")
+
+        self.assertEqual(len(list(self.reader.iter_events())), 3)
+
+    def test_last_line_without_newline(self):
+        """Test a trailing line without newline is still read."""
+        with open(self.storage_path, "w", encoding="utf-8") as f:
+            f.write(Event(EventType.FILE_CREATE, "universal", {}).to_json())
+
+        self.assertEqual(len(list(self.reader.iter_events())), 1)
+
+    def test_empty_prefilter_rejected(self):
+        """Test an empty needle sequence is rejected."""
+        self._append_mixed()
+
+        with self.assertRaises(ValueError):
+            list(self.reader.iter_lines(()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""Unit tests for the OTLP-JSON exporter."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# Handle imports from hyphenated parent directory
+try:
+    # Try relative imports first (when run via standard unittest discovery)
+    from ..event_schema import Event, EventType
+    from ..storage.otlp_exporter import FileSink, OTLPExporter
+except (ImportError, ValueError):
+    # Fall back to sys.modules lookup (when run via custom test runner)
+    Event = sys.modules['event_schema'].Event
+    EventType = sys.modules['event_schema'].EventType
+    FileSink = sys.modules['otlp_exporter'].FileSink
+    OTLPExporter = sys.modules['otlp_exporter'].OTLPExporter
+
+
+class RecordingSink:
+    """Sink that keeps every export request."""
+
+    def __init__(self):
+        self.requests = []
+
+    def send(self, signal, payload):
+        self.requests.append((signal, payload))
+
+    def records(self, signal):
+        key, scope_key, items_key = {
+            "logs": ("resourceLogs", "scopeLogs", "logRecords"),
+            "traces": ("resourceSpans", "scopeSpans", "spans"),
+        }[signal]
+        return [
+            item
+            for sent, payload in self.requests
+            if sent == signal
+            for resource in payload[key]
+            for scope in resource[scope_key]
+            for item in scope[items_key]
+        ]
+
+
+def _skill(event_type, name, second, status="ok"):
+    return Event(
+        event_type, "universal", {"skill_name": name, "status": status},
+        f"2026-01-01T00:00:{second:02d}",
+    )
+
+
+class TestOTLPExporter(unittest.TestCase):
+    """Test log conversion, span pairing and batching."""
+
+    def setUp(self):
+        self.sink = RecordingSink()
+
+    def test_log_records(self):
+        """Test every event becomes a log record with typed attributes."""
+        event = Event(
+            EventType.DIAGNOSTIC_ERROR,
+            "universal",
+            {"filepath": "a.py", "line": 3, "message": "boom"},
+            "2026-01-01T00:00:01",
+        )
+        stats = OTLPExporter(self.sink).export([event])
+
+        self.assertEqual(stats["logs"], 1)
+        record = self.sink.records("logs")[0]
+        self.assertEqual(record["severityText"], "ERROR")
+        self.assertEqual(record["timeUnixNano"], "1767225601000000000")
+        attributes = {a["key"]: a["value"] for a in record["attributes"]}
+        self.assertEqual(attributes["pax.line"], {"intValue": "3"})
+        self.assertEqual(attributes["pax.filepath"], {"stringValue": "a.py"})
+
+    def test_skill_pairs_become_spans(self):
+        """Test invoke/complete and invoke/error pairs produce spans."""
+        events = [
+            _skill(EventType.SKILL_INVOKE, "build", 1),
+            _skill(EventType.SKILL_INVOKE, "lint", 2),
+            _skill(EventType.SKILL_ERROR, "lint", 4, "failed"),
+            _skill(EventType.SKILL_COMPLETE, "build", 7),
+            _skill(EventType.SKILL_INVOKE, "deploy", 8),
+        ]
+        stats = OTLPExporter(self.sink).export(events)
+
+        self.assertEqual(stats["spans"], 2)
+        self.assertEqual(stats["unpaired"], 1)
+        spans = {span["name"]: span for span in self.sink.records("traces")}
+        build = spans["skill build"]
+        duration = int(build["endTimeUnixNano"]) - int(build["startTimeUnixNano"])
+        self.assertEqual(duration, 6 * 10**9)
+        self.assertEqual(build["status"]["code"], 1)
+        self.assertEqual(spans["skill lint"]["status"]["code"], 2)
+        self.assertEqual(len(build["spanId"]), 16)
+        self.assertEqual(len(build["traceId"]), 32)
+
+    def test_recorded_span_id_is_reused(self):
+        """Test spans keep the span id captured on the skill events."""
+        start = _skill(EventType.SKILL_INVOKE, "build", 1)
+        end = _skill(EventType.SKILL_COMPLETE, "build", 2)
+        start.metadata["span_id"] = end.metadata["span_id"] = "0123456789abcdef"
+        OTLPExporter(self.sink).export([start, end])
+
+        self.assertEqual(self.sink.records("traces")[0]["spanId"], "0123456789abcdef")
+
+    def test_batches(self):
+        """Test full batches are sent as separate requests."""
+        events = [
+            Event(EventType.FILE_MODIFY, "universal", {"filepath": f"{i}.py"},
+                  f"2026-01-01T00:00:{i:02d}")
+            for i in range(5)
+        ]
+        stats = OTLPExporter(self.sink, batch_size=2).export(events)
+
+        self.assertEqual(stats["requests"], 3)
+        self.assertEqual(len(self.sink.records("logs")), 5)
+
+    def test_file_sink(self):
+        """Test file sink writes one export request per line per signal."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "otlp.json"
+            OTLPExporter(FileSink(str(path))).export([
+                _skill(EventType.SKILL_INVOKE, "build", 1),
+                _skill(EventType.SKILL_COMPLETE, "build", 2),
+            ])
+
+            logs = [json.loads(line) for line in path.read_text().splitlines()]
+            traces = (Path(temp_dir) / "otlp.traces.json").read_text().splitlines()
+            self.assertEqual(len(logs), 1)
+            self.assertIn("resourceLogs", logs[0])
+            self.assertIn("resourceSpans", json.loads(traces[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
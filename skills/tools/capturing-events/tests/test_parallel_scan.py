@@ -0,0 +1,87 @@
+"""Unit tests for chunked parallel scans."""
+
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# Handle imports from hyphenated parent directory
+try:
+    # Try relative imports first (when run via standard unittest discovery)
+    from ..event_schema import Event, EventType
+    from ..storage.jsonl_handler import JSONLStorage
+    from ..storage.mmap_reader import split_line_ranges
+    from ..storage.parallel_scan import ParallelScanner
+except (ImportError, ValueError):
+    # Fall back to sys.modules lookup (when run via custom test runner)
+    Event = sys.modules['event_schema'].Event
+    EventType = sys.modules['event_schema'].EventType
+    JSONLStorage = sys.modules['jsonl_handler'].JSONLStorage
+    split_line_ranges = sys.modules['mmap_reader'].split_line_ranges
+    ParallelScanner = sys.modules['parallel_scan'].ParallelScanner
+
+
+class TestParallelScanner(unittest.TestCase):
+    """Test chunk planning and merged results."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_path = str(Path(self.temp_dir.name) / "episodes.jsonl")
+        storage = JSONLStorage(self.log_path)
+        storage.append_many(
+            Event(
+                EventType.FILE_MODIFY if i % 3 else EventType.DIAGNOSTIC_ERROR,
+                "universal" if i % 2 else "copilot",
+                {"filepath": f"{i}.py", "line": i, "message": "m"},
+                f"2026-01-01T{i // 60:02d}:{i % 60:02d}:00",
+            )
+            for i in range(300)
+        )
+        self.serial = JSONLStorage(self.log_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_ranges_cover_every_line_once(self):
+        """Test ranges are contiguous and split only at line starts."""
+        data = Path(self.log_path).read_bytes()
+        ranges = split_line_ranges(self.log_path, 7)
+
+        self.assertEqual(len(ranges), 7)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], len(data))
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(data[start - 1:start], b"\n")
+
+    def test_reads_match_serial_scan(self):
+        """Test chunked reads return the serial results in file order."""
+        scanner = ParallelScanner(self.log_path, workers=4, min_chunk_bytes=512, executor="thread")
+        self.assertGreater(len(scanner.ranges()), 1)
+
+        expected = [e.to_dict() for e in self.serial.read_by_type("diagnostic_error")]
+        self.assertEqual([e.to_dict() for e in scanner.read_by_type("diagnostic_error")], expected)
+        since = "2026-01-01T02:30:00"
+        self.assertEqual(
+            [e.to_dict() for e in scanner.read_since(since)],
+            [e.to_dict() for e in self.serial.read_since(since)],
+        )
+
+    def test_stats_in_processes(self):
+        """Test partial counts from worker processes merge into totals."""
+        stats = ParallelScanner(self.log_path, workers=2, min_chunk_bytes=512).stats()
+
+        self.assertEqual(stats["total_events"], 300)
+        self.assertEqual(stats["event_types"], {"diagnostic_error": 100, "file_modify": 200})
+        self.assertEqual(stats["providers"], {"copilot": 150, "universal": 150})
+        self.assertEqual(stats["chunks"], 4)
+
+    def test_small_or_missing_logs(self):
+        """Test small logs use one in-process chunk and missing logs are empty."""
+        self.assertEqual(len(ParallelScanner(self.log_path).ranges()), 1)
+        missing = ParallelScanner(str(Path(self.temp_dir.name) / "none.jsonl"))
+        self.assertEqual(missing.stats()["total_events"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
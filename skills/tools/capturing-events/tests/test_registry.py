@@ -0,0 +1,128 @@
+"""Unit tests for the provider registry and memoized detection."""
+
+import os
+import unittest
+import sys
+from unittest import mock
+
+# Handle imports from hyphenated parent directory
+try:
+    # Try relative imports first (when run via standard unittest discovery)
+    from ..providers.facade import ProviderDetector, ProviderFacade
+    from ..providers.registry import ProviderRegistry, get_registry
+    from ..providers.universal import UniversalProvider
+except (ImportError, ValueError):
+    # Fall back to sys.modules lookup (when run via custom test runner)
+    ProviderDetector = sys.modules['facade'].ProviderDetector
+    ProviderFacade = sys.modules['facade'].ProviderFacade
+    ProviderRegistry = sys.modules['registry'].ProviderRegistry
+    get_registry = sys.modules['registry'].get_registry
+    UniversalProvider = sys.modules['universal'].UniversalProvider
+
+
+class CountingProvider(UniversalProvider):
+    """Universal provider that counts constructions."""
+
+    created = 0
+
+    def __init__(self):
+        super().__init__()
+        CountingProvider.created += 1
+
+
+class TestProviderRegistry(unittest.TestCase):
+    """Test lazy, shared provider instances."""
+
+    def setUp(self):
+        CountingProvider.created = 0
+        self.registry = ProviderRegistry()
+        # Keep tests independent of whatever plugins are installed.
+        self.registry._plugins = {}
+
+    def test_builtin_providers_share_one_instance(self):
+        """Test repeated lookups return the same instance."""
+        first = self.registry.get("universal")
+        self.assertIsInstance(first, UniversalProvider)
+        self.assertIs(self.registry.get("universal"), first)
+
+    def test_fallback_providers(self):
+        """Test copilot/codex/cursor resolve to the universal provider."""
+        for name in ("copilot", "codex", "cursor"):
+            self.assertIsInstance(self.registry.get(name), UniversalProvider)
+
+    def test_register_is_lazy_and_overrides(self):
+        """Test registered factories run once, on first lookup."""
+        self.registry.register("copilot", CountingProvider)
+        self.assertEqual(CountingProvider.created, 0)
+
+        provider = self.registry.get("copilot")
+        self.registry.get("copilot")
+        self.assertIsInstance(provider, CountingProvider)
+        self.assertEqual(CountingProvider.created, 1)
+
+    def test_plugin_entry_point_loaded_on_demand(self):
+        """Test plugins are only loaded when requested."""
+        entry_point = mock.Mock()
+        entry_point.load.return_value = CountingProvider
+        self.registry._plugins = {"acme": entry_point}
+
+        self.assertIn("acme", self.registry.names())
+        entry_point.load.assert_not_called()
+
+        self.assertIsInstance(self.registry.get("acme"), CountingProvider)
+        entry_point.load.assert_called_once()
+
+    def test_builtins_resolve_without_plugin_scan(self):
+        """Test built-in names never enumerate entry points unless overriding."""
+        self.registry._plugins = None
+        with mock.patch.object(self.registry, "_discover_plugins") as discover:
+            self.assertIsInstance(self.registry.get("copilot"), UniversalProvider)
+        discover.assert_not_called()
+
+    def test_plugins_override_builtins_when_enabled(self):
+        """Test an opted-in registry prefers a plugin over the built-in."""
+        entry_point = mock.Mock()
+        entry_point.load.return_value = CountingProvider
+        registry = ProviderRegistry(plugins_override=True)
+        registry._plugins = {"copilot": entry_point}
+        self.registry._plugins = {"copilot": entry_point}
+
+        self.assertIsInstance(registry.get("copilot"), CountingProvider)
+        self.assertNotIsInstance(self.registry.get("copilot"), CountingProvider)
+
+    def test_unknown_provider(self):
+        """Test unknown provider raises ValueError listing valid names."""
+        with self.assertRaises(ValueError) as ctx:
+            self.registry.get("invalid")
+        self.assertIn('"universal"', str(ctx.exception))
+
+    def test_facade_uses_shared_registry(self):
+        """Test facades reuse the process-wide provider instance."""
+        first = ProviderFacade(provider="universal")
+        second = ProviderFacade(provider="universal")
+        self.assertIs(first._provider, second._provider)
+        self.assertIs(first._provider, get_registry().get("universal"))
+
+
+class TestProviderDetector(unittest.TestCase):
+    """Test memoized provider detection."""
+
+    def setUp(self):
+        ProviderDetector.cache_clear()
+
+    def tearDown(self):
+        ProviderDetector.cache_clear()
+
+    def test_detect_is_memoized(self):
+        """Test the environment is only inspected once."""
+        with mock.patch.dict(os.environ, {"CURSOR": "1"}, clear=True):
+            self.assertEqual(ProviderDetector.detect(), "cursor")
+
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(ProviderDetector.detect(), "cursor")
+            ProviderDetector.cache_clear()
+            self.assertEqual(ProviderDetector.detect(), "universal")
+
+
+if __name__ == '__main__':
+    unittest.main()
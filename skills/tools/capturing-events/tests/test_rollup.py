@@ -0,0 +1,125 @@
+"""Unit tests for time-bucketed rollups."""
+
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+# Handle imports from hyphenated parent directory
+try:
+    # Try relative imports first (when run via standard unittest discovery)
+    from ..event_schema import Event, EventType
+    from ..storage.jsonl_handler import JSONLStorage, TTLCleaner
+    from ..storage.rollup import RollupStore
+except (ImportError, ValueError):
+    # Fall back to sys.modules lookup (when run via custom test runner)
+    Event = sys.modules['event_schema'].Event
+    EventType = sys.modules['event_schema'].EventType
+    JSONLStorage = sys.modules['jsonl_handler'].JSONLStorage
+    TTLCleaner = sys.modules['jsonl_handler'].TTLCleaner
+    RollupStore = sys.modules['rollup'].RollupStore
+
+
+class TestRollupStore(unittest.TestCase):
+    """Test RollupStore class."""
+
+    def setUp(self):
+        """Create temporary storage and rollups for testing."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.storage_path = str(Path(self.temp_dir.name) / "episodes.jsonl")
+        self.storage = JSONLStorage(self.storage_path)
+        self.rollup = RollupStore.for_log(self.storage_path)
+        self.day = datetime.utcnow().replace(hour=10, minute=0, second=0, microsecond=0)
+        if self.day > datetime.utcnow():
+            self.day -= timedelta(days=1)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        self.temp_dir.cleanup()
+
+    def _append(self, event_type, hours=0, days=0, **metadata):
+        timestamp = (self.day - timedelta(days=days) + timedelta(hours=hours)).isoformat()
+        self.storage.append(Event(event_type, "universal", metadata, timestamp))
+
+    def test_hourly_and_daily_buckets(self):
+        """Test events are counted per hour and per day."""
+        self._append(EventType.FILE_MODIFY, filepath="a.py")
+        self._append(EventType.FILE_MODIFY, hours=1, filepath="a.py")
+        self._append(EventType.SKILL_INVOKE, hours=1, skill_name="creating-skill")
+
+        self.assertEqual(self.rollup.update(self.storage), 3)
+
+        daily = self.rollup.query("event_type", "day")
+        hourly = self.rollup.query("event_type", "hour")
+        self.assertEqual(daily, [{"bucket": self.day.isoformat()[:10],
+                                  "counts": {"file_modify": 2, "skill_invoke": 1}}])
+        self.assertEqual(len(hourly), 2)
+        self.assertEqual(self.rollup.totals("skill_name"), {"creating-skill": 1})
+        self.assertEqual(self.rollup.totals("filepath", "hour"), {"a.py": 2})
+
+    def test_update_is_incremental(self):
+        """Test repeated updates only count new events."""
+        self._append(EventType.FILE_MODIFY)
+        self.rollup.update(self.storage)
+        self._append(EventType.FILE_MODIFY)
+
+        self.assertEqual(self.rollup.update(self.storage), 1)
+        self.assertEqual(self.rollup.totals(), {"file_modify": 2})
+
+    def test_persisted_next_to_log(self):
+        """Test counters survive reloading the store."""
+        self._append(EventType.FILE_CREATE)
+        self.rollup.update(self.storage)
+
+        reloaded = RollupStore.for_log(self.storage_path)
+
+        self.assertEqual(reloaded.totals(), {"file_create": 1})
+
+    def test_query_range_and_value(self):
+        """Test range bounds and single-value series."""
+        for days in range(3):
+            self._append(EventType.FILE_MODIFY, days=days)
+        self.rollup.update(self.storage)
+
+        since = (self.day - timedelta(days=1)).isoformat()
+        series = self.rollup.query("event_type", "day", since=since, value="file_modify")
+
+        self.assertEqual([p["count"] for p in series], [1, 1])
+        self.assertEqual(
+            self.rollup.query("event_type", "day", until=since, value="file_modify"),
+            [{"bucket": (self.day - timedelta(days=2)).isoformat()[:10], "count": 1}],
+        )
+
+    def test_retention_prunes_old_buckets(self):
+        """Test buckets older than retention are dropped on save."""
+        store = RollupStore(str(Path(self.temp_dir.name) / "short.json"), retention_days=5)
+        self._append(EventType.FILE_MODIFY, days=10)
+        self._append(EventType.FILE_MODIFY)
+
+        store.update(self.storage)
+
+        self.assertEqual(len(store.query("event_type", "day")), 1)
+
+    def test_invalid_arguments(self):
+        """Test unknown dimensions and granularities are rejected."""
+        with self.assertRaises(ValueError):
+            self.rollup.query("unknown")
+        with self.assertRaises(ValueError):
+            self.rollup.query("event_type", "week")
+
+    def test_cleanup_rolls_up_before_dropping(self):
+        """Test TTL cleanup preserves counts of dropped events."""
+        self._append(EventType.FILE_MODIFY, days=8)
+        self._append(EventType.FILE_MODIFY)
+        cleaner = TTLCleaner(self.storage_path, ttl_days=7, rollup=self.rollup)
+
+        stats = cleaner.cleanup()
+
+        self.assertEqual(stats["removed"], 1)
+        self.assertEqual(self.rollup.totals(), {"file_modify": 2})
+        self.assertEqual(self.rollup.update(self.storage), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
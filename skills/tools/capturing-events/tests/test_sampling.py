@@ -0,0 +1,239 @@
+"""Unit tests for capture sampling policies."""
+
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+
+# Handle imports from hyphenated parent directory
+try:
+    # Try relative imports first (when run via standard unittest discovery)
+    from ..event_schema import Event, EventType
+    from ..providers.sampling import (
+        SamplingPolicy,
+        SamplingRule,
+        TokenBucket,
+        sampling_state_path,
+    )
+except (ImportError, ValueError):
+    # Fall back to sys.modules lookup (when run via custom test runner)
+    Event = sys.modules['event_schema'].Event
+    EventType = sys.modules['event_schema'].EventType
+    SamplingPolicy = sys.modules['sampling'].SamplingPolicy
+    SamplingRule = sys.modules['sampling'].SamplingRule
+    TokenBucket = sys.modules['sampling'].TokenBucket
+    sampling_state_path = sys.modules['sampling'].sampling_state_path
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _event(event_type=EventType.TERMINAL_OUTPUT, filepath=None):
+    metadata = {"filepath": filepath} if filepath else {}
+    return Event(event_type, "universal", metadata)
+
+
+def _weight(event):
+    return event.metadata.get("sample_weight", 1)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test TokenBucket class."""
+
+    def test_burst_then_refill(self):
+        """Test the bucket allows a burst and refills over time."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock)
+
+        self.assertEqual([bucket.allow() for _ in range(4)], [True, True, True, False])
+
+        clock.now = 0.5
+        self.assertTrue(bucket.allow())
+        self.assertFalse(bucket.allow())
+
+    def test_invalid_config(self):
+        """Test invalid rates are rejected."""
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0, burst=1)
+
+
+class TestSamplingPolicy(unittest.TestCase):
+    """Test SamplingPolicy class."""
+
+    def test_unconfigured_types_pass_through(self):
+        """Test event types without rules are kept unchanged."""
+        policy = SamplingPolicy({"terminal_output": {"mode": "probability", "probability": 0.1}})
+        event = _event(EventType.FILE_CREATE)
+
+        self.assertIs(policy.admit(event), event)
+        self.assertNotIn("sample_weight", event.metadata)
+
+    def test_probability_weights_reconstruct_counts(self):
+        """Test kept events carry inverse-probability weights."""
+        policy = SamplingPolicy(
+            {"terminal_output": {"mode": "probability", "probability": 0.25}}, seed=7
+        )
+
+        kept = [e for e in (policy.admit(_event()) for _ in range(4000)) if e]
+
+        self.assertTrue(all(_weight(e) == 4 for e in kept))
+        self.assertAlmostEqual(sum(_weight(e) for e in kept), 4000, delta=400)
+        stats = policy.stats()["terminal_output"]
+        self.assertEqual(stats["seen"], 4000)
+        self.assertEqual(stats["kept"] + stats["dropped"], 4000)
+
+    def test_token_bucket_weights_are_exact(self):
+        """Test rate-limited events account for every dropped event."""
+        clock = FakeClock()
+        policy = SamplingPolicy(
+            {"terminal_output": {"mode": "token_bucket", "rate": 1, "burst": 2}}, clock=clock
+        )
+
+        kept = []
+        for i in range(20):
+            clock.now = i * 0.25
+            event = policy.admit(_event())
+            if event:
+                kept.append(event)
+
+        self.assertLess(len(kept), 20)
+        self.assertEqual(sum(_weight(e) for e in kept) + self._trailing_drops(policy), 20)
+
+    def _trailing_drops(self, policy):
+        return policy._state["terminal_output"].dropped_since_kept
+
+    def test_reservoir_releases_on_window_close(self):
+        """Test reservoir samples are released with seen/kept weights."""
+        clock = FakeClock()
+        policy = SamplingPolicy(
+            {"terminal_output": {"mode": "reservoir", "size": 5, "window": 10}},
+            seed=1,
+            clock=clock,
+        )
+
+        for _ in range(50):
+            self.assertIsNone(policy.admit(_event()))
+        self.assertEqual(policy.drain(), [])
+
+        clock.now = 10
+        policy.admit(_event())
+        released = policy.drain()
+
+        self.assertEqual(len(released), 5)
+        self.assertEqual(sum(_weight(e) for e in released), 50)
+        self.assertEqual(len(policy.flush()), 1)
+
+    def test_drain_closes_elapsed_windows(self):
+        """Test drain releases a finished window without waiting for another event."""
+        clock = FakeClock()
+        policy = SamplingPolicy(
+            {"terminal_output": {"mode": "reservoir", "size": 2, "window": 10}},
+            seed=1,
+            clock=clock,
+        )
+        for _ in range(6):
+            policy.admit(_event())
+
+        clock.now = 10
+        released = policy.drain()
+
+        self.assertEqual(len(released), 2)
+        self.assertEqual(sum(_weight(e) for e in released), 6)
+
+    def test_path_patterns_limit_rule(self):
+        """Test rules with paths only sample matching files."""
+        policy = SamplingPolicy(
+            {"file_modify": {"mode": "probability", "probability": 0.01,
+                             "paths": ["dist/*", "*/generated/*"]}},
+            seed=3,
+        )
+
+        source = [policy.admit(_event(EventType.FILE_MODIFY, "src/app.py")) for _ in range(50)]
+        generated = [policy.admit(_event(EventType.FILE_MODIFY, "dist/app.js")) for _ in range(50)]
+
+        self.assertTrue(all(source))
+        self.assertLess(sum(1 for e in generated if e), 10)
+
+    def test_invalid_rules(self):
+        """Test invalid rule configuration is rejected."""
+        with self.assertRaises(ValueError):
+            SamplingRule.from_dict({"mode": "sometimes"})
+        with self.assertRaises(ValueError):
+            SamplingRule.from_dict({"mode": "probability", "probability": 0})
+        with self.assertRaises(ValueError):
+            SamplingRule.from_dict({"mode": "probability", "rate_limit": 3})
+
+    def test_invalid_config_file_names_the_file(self):
+        """Test a config file with a malformed rule raises ValueError naming it."""
+        with tempfile.TemporaryDirectory() as test_dir:
+            path = os.path.join(test_dir, "sampling.json")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write('{"rules": 5}')
+            with self.assertRaisesRegex(ValueError, "sampling.json"):
+                SamplingPolicy.from_file(path)
+
+
+class TestSamplingState(unittest.TestCase):
+    """Test sampler state carried between processes."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.state_path = sampling_state_path(os.path.join(self.test_dir, "episodes.jsonl"))
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_token_bucket_survives_restart(self):
+        """Test a fresh policy resumes an emptied bucket instead of a full one."""
+        rules = {"terminal_output": {"mode": "token_bucket", "rate": 0.001, "burst": 2}}
+        first = SamplingPolicy(rules)
+        kept = [first.admit(_event()) for _ in range(3)]
+        self.assertEqual(sum(1 for e in kept if e), 2)
+        first.save_state(self.state_path)
+
+        second = SamplingPolicy(rules)
+        second.load_state(self.state_path)
+
+        self.assertIsNone(second.admit(_event()))
+        self.assertEqual(second._state["terminal_output"].dropped_since_kept, 2)
+
+    def test_reservoir_survives_restart(self):
+        """Test held samples are restored and released once their window closes."""
+        rules = {"terminal_output": {"mode": "reservoir", "size": 3, "window": 3600}}
+        first = SamplingPolicy(rules, seed=1)
+        for _ in range(10):
+            first.admit(_event())
+        first.save_state(self.state_path)
+
+        second = SamplingPolicy(rules)
+        second.load_state(self.state_path)
+        self.assertEqual(second.drain(), [])
+        released = second.flush()
+
+        self.assertEqual(len(released), 3)
+        self.assertEqual(sum(_weight(e) for e in released), 10)
+
+    def test_unreadable_or_mismatched_state_starts_fresh(self):
+        """Test corrupt files and entries for a changed mode are ignored."""
+        with open(self.state_path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        policy = SamplingPolicy({"terminal_output": {"mode": "token_bucket", "burst": 1}})
+        policy.load_state(self.state_path)
+        self.assertIsNotNone(policy.admit(_event()))
+
+        policy.save_state(self.state_path)
+        changed = SamplingPolicy({"terminal_output": {"mode": "reservoir", "size": 1}})
+        changed.load_state(self.state_path)
+        self.assertEqual(changed._state["terminal_output"].window_seen, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
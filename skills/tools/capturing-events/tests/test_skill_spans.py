@@ -0,0 +1,145 @@
+"""Unit tests for skill span pairing and profiling."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# Handle imports from hyphenated parent directory
+try:
+    # Try relative imports first (when run via standard unittest discovery)
+    from ..event_schema import Event, EventType
+    from ..providers.facade import ProviderFacade
+    from ..storage.skill_spans import SkillProfiler, SpanPairer, write_profile
+except (ImportError, ValueError):
+    # Fall back to sys.modules lookup (when run via custom test runner)
+    Event = sys.modules['event_schema'].Event
+    EventType = sys.modules['event_schema'].EventType
+    ProviderFacade = sys.modules['facade'].ProviderFacade
+    SkillProfiler = sys.modules['skill_spans'].SkillProfiler
+    SpanPairer = sys.modules['skill_spans'].SpanPairer
+    write_profile = sys.modules['skill_spans'].write_profile
+
+
+def _skill(event_type, name, second, span_id=None, status="ok"):
+    metadata = {"skill_name": name, "status": status}
+    if span_id:
+        metadata["span_id"] = span_id
+    return Event(event_type, "universal", metadata, f"2026-01-01T00:00:{second:02d}")
+
+
+class TestSpanPairer(unittest.TestCase):
+    """Test invocation/outcome matching."""
+
+    def test_pairs_by_span_id(self):
+        """Test interleaved invocations of one skill pair by id, not order."""
+        pairer = SpanPairer()
+        first = _skill(EventType.SKILL_INVOKE, "build", 1, "a" * 16)
+        second = _skill(EventType.SKILL_INVOKE, "build", 2, "b" * 16)
+        self.assertIsNone(pairer.add(first))
+        self.assertIsNone(pairer.add(second))
+
+        start, _ = pairer.add(_skill(EventType.SKILL_COMPLETE, "build", 3, "a" * 16))
+        self.assertIs(start, first)
+        self.assertEqual(pairer.open_count, 1)
+
+    def test_falls_back_to_most_recent_invocation(self):
+        """Test events without ids pair with the innermost open invocation."""
+        pairer = SpanPairer()
+        pairer.add(_skill(EventType.SKILL_INVOKE, "build", 1))
+        inner = _skill(EventType.SKILL_INVOKE, "build", 2)
+        pairer.add(inner)
+
+        start, _ = pairer.add(_skill(EventType.SKILL_COMPLETE, "build", 3))
+        self.assertIs(start, inner)
+        self.assertIsNone(pairer.add(_skill(EventType.SKILL_ERROR, "lint", 4)))
+        self.assertEqual(pairer.unpaired, 1)
+
+    def test_open_invocations_are_bounded(self):
+        """Test the oldest invocation is dropped past max_open."""
+        pairer = SpanPairer(max_open=2)
+        for second in range(3):
+            pairer.add(_skill(EventType.SKILL_INVOKE, "build", second))
+
+        self.assertEqual(pairer.open_count, 2)
+        self.assertEqual(pairer.unpaired, 1)
+
+
+class TestSkillProfiler(unittest.TestCase):
+    """Test latency and error-rate summaries."""
+
+    def test_summary(self):
+        """Test per-skill percentiles, error rates and unpaired counts."""
+        events = [
+            _skill(EventType.SKILL_INVOKE, "build", 0, "1" * 16),
+            _skill(EventType.SKILL_COMPLETE, "build", 2, "1" * 16),
+            _skill(EventType.SKILL_INVOKE, "build", 3, "2" * 16),
+            _skill(EventType.SKILL_ERROR, "build", 7, "2" * 16, "failed"),
+            _skill(EventType.SKILL_INVOKE, "lint", 8),
+        ]
+        summary = SkillProfiler().profile(events)
+
+        build = summary["skills"]["build"]
+        self.assertEqual(build["invocations"], 2)
+        self.assertEqual(build["finished"], 2)
+        self.assertEqual(build["error_rate"], 0.5)
+        self.assertEqual(build["mean_ms"], 3000.0)
+        self.assertEqual(build["p50_ms"], 2000.0)
+        self.assertEqual(build["max_ms"], 4000.0)
+        self.assertEqual(summary["skills"]["lint"]["finished"], 0)
+        self.assertEqual(summary["unpaired"], 1)
+
+    def test_write_profile(self):
+        """Test profiles are written as sorted, stable JSON."""
+        summary = SkillProfiler().profile([])
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "profile.json"
+            write_profile(summary, str(path))
+            first = path.read_text()
+            write_profile(summary, str(path))
+
+            self.assertEqual(path.read_text(), first)
+            self.assertEqual(json.loads(first)["version"], 1)
+
+
+class TestFacadeSpanIds(unittest.TestCase):
+    """Test span ids assigned by the provider facade."""
+
+    def test_outcome_reuses_invocation_span_id(self):
+        """Test an outcome without an id closes the latest open invocation."""
+        facade = ProviderFacade(provider="universal")
+        outer = facade.capture_skill_event("skill_invoke", "build", "start")
+        inner = facade.capture_skill_event("skill_invoke", "build", "start")
+        done = facade.capture_skill_event("skill_complete", "build", "ok")
+
+        self.assertEqual(len(outer.metadata["span_id"]), 16)
+        self.assertNotEqual(outer.metadata["span_id"], inner.metadata["span_id"])
+        self.assertEqual(done.metadata["span_id"], inner.metadata["span_id"])
+
+    def test_explicit_span_id(self):
+        """Test an explicit id is kept on both invocation and outcome."""
+        facade = ProviderFacade(provider="universal")
+        facade.capture_skill_event("skill_invoke", "build", "start", span_id="c" * 16)
+        facade.capture_skill_event("skill_invoke", "build", "start")
+        done = facade.capture_skill_event("skill_error", "build", "failed", span_id="c" * 16)
+
+        self.assertEqual(done.metadata["span_id"], "c" * 16)
+
+    def test_open_invocations_are_bounded(self):
+        """Test the oldest remembered invocation is forgotten past the bound."""
+        facade = ProviderFacade(provider="universal", max_open_spans=2)
+        first = facade.capture_skill_event("skill_invoke", "build", "start")
+        facade.capture_skill_event("skill_invoke", "lint", "start")
+        second = facade.capture_skill_event("skill_invoke", "build", "start")
+
+        self.assertEqual(len(facade._span_order), 2)
+        done = facade.capture_skill_event("skill_complete", "build", "ok")
+        self.assertEqual(done.metadata["span_id"], second.metadata["span_id"])
+        orphan = facade.capture_skill_event("skill_complete", "build", "ok")
+        self.assertNotEqual(orphan.metadata.get("span_id"), first.metadata["span_id"])
+        self.assertNotIn("build", facade._open_spans)
+
+
+if __name__ == '__main__':
+    unittest.main()
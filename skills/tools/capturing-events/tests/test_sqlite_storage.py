@@ -0,0 +1,211 @@
+"""Unit tests for the SQLite storage backend."""
+
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+# Handle imports from hyphenated parent directory
+try:
+    # Try relative imports first (when run via standard unittest discovery)
+    from ..event_schema import Event, EventType
+    from ..storage.jsonl_handler import JSONLStorage, TTLCleaner
+    from ..storage.sqlite_handler import SQLiteStorage, SQLiteTTLCleaner, migrate_jsonl
+except (ImportError, ValueError):
+    # Fall back to sys.modules lookup (when run via custom test runner)
+    Event = sys.modules['event_schema'].Event
+    EventType = sys.modules['event_schema'].EventType
+    JSONLStorage = sys.modules['jsonl_handler'].JSONLStorage
+    TTLCleaner = sys.modules['jsonl_handler'].TTLCleaner
+    SQLiteStorage = sys.modules['sqlite_handler'].SQLiteStorage
+    SQLiteTTLCleaner = sys.modules['sqlite_handler'].SQLiteTTLCleaner
+    migrate_jsonl = sys.modules['sqlite_handler'].migrate_jsonl
+
+
+class TestSQLiteStorage(unittest.TestCase):
+    """Test SQLiteStorage class."""
+
+    def setUp(self):
+        """Create temporary database for testing."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self.temp_dir.name) / "episodes.db")
+        self.storage = SQLiteStorage(self.db_path, batch_size=2)
+
+    def tearDown(self):
+        """Close the database and clean up temporary files."""
+        self.storage.close()
+        self.temp_dir.cleanup()
+
+    def test_wal_mode(self):
+        """Test the database uses write-ahead logging."""
+        mode = self.storage._conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+        self.assertEqual(mode, "wal")
+
+    def test_append_and_read_all(self):
+        """Test appended events round-trip in insertion order."""
+        events = [
+            Event(EventType.FILE_CREATE, "universal", {"filepath": "a.py"}),
+            Event(EventType.TERMINAL_EXECUTE, "universal", {"command": "ls"}),
+        ]
+        for event in events:
+            self.assertTrue(self.storage.append(event))
+
+        self.assertEqual(self.storage.read_all(), events)
+
+    def test_append_many_batches(self):
+        """Test batched inserts write every event."""
+        events = [
+            Event(EventType.FILE_MODIFY, "universal", {"filepath": f"f{i}.py"})
+            for i in range(5)
+        ]
+
+        self.assertEqual(self.storage.append_many(events), 5)
+        self.assertEqual(self.storage.count(), 5)
+
+    def test_filtered_reads(self):
+        """Test indexed reads by type, provider, file path and time."""
+        now = datetime.utcnow()
+        self.storage.append_many(
+            [
+                Event(EventType.FILE_CREATE, "universal", {"filepath": "a.py"},
+                      (now - timedelta(hours=2)).isoformat()),
+                Event(EventType.FILE_MODIFY, "copilot", {"filepath": "a.py"},
+                      now.isoformat()),
+                Event(EventType.FILE_MODIFY, "universal", {"filepath": "b.py"},
+                      now.isoformat()),
+            ]
+        )
+
+        self.assertEqual(len(self.storage.read_by_type("file_modify")), 2)
+        self.assertEqual(len(self.storage.read_by_provider("copilot")), 1)
+        self.assertEqual(len(self.storage.read_by_filepath("a.py")), 2)
+        self.assertEqual(
+            len(self.storage.read_since((now - timedelta(hours=1)).isoformat())), 2
+        )
+
+    def test_clear(self):
+        """Test clearing storage."""
+        self.storage.append(Event(EventType.FILE_CREATE, "universal", {}))
+
+        self.assertTrue(self.storage.clear())
+        self.assertEqual(self.storage.count(), 0)
+
+    def test_concurrent_append(self):
+        """Test concurrent append operations."""
+        threads = [
+            threading.Thread(
+                target=self.storage.append,
+                args=(Event(EventType.FILE_CREATE, "universal", {"filepath": f"{i}"}),),
+            )
+            for i in range(10)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(self.storage.count(), 10)
+
+    def test_ttl_cleanup(self):
+        """Test TTL cleanup removes only expired events."""
+        now = datetime.utcnow()
+        self.storage.append_many(
+            [
+                Event(EventType.FILE_CREATE, "universal", {},
+                      (now - timedelta(days=8)).isoformat()),
+                Event(EventType.FILE_CREATE, "universal", {}, now.isoformat()),
+            ]
+        )
+        cleaner = SQLiteTTLCleaner(self.storage, ttl_days=7)
+
+        self.assertTrue(cleaner.should_cleanup())
+        self.assertEqual(cleaner.cleanup(dry_run=True)["removed"], 1)
+        self.assertEqual(self.storage.count(), 2)
+
+        stats = cleaner.cleanup()
+
+        self.assertEqual(stats, {"removed": 1, "kept": 1, "total": 2})
+        self.assertFalse(cleaner.should_cleanup())
+
+
+class TestMigrateJSONL(unittest.TestCase):
+    """Test migration from episodes.jsonl."""
+
+    def setUp(self):
+        """Create temporary files for testing."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.jsonl_path = str(Path(self.temp_dir.name) / "episodes.jsonl")
+        self.db_path = str(Path(self.temp_dir.name) / "episodes.db")
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        self.temp_dir.cleanup()
+
+    def test_migrate(self):
+        """Test valid events are copied and invalid lines counted."""
+        jsonl = JSONLStorage(self.jsonl_path)
+        for i in range(3):
+            jsonl.append(Event(EventType.FILE_CREATE, "universal", {"filepath": f"{i}"}))
+        with open(self.jsonl_path, "a", encoding="utf-8") as f:
+            f.write("invalid json line\n")
+
+        stats = migrate_jsonl(self.jsonl_path, self.db_path, batch_size=2)
+
+        self.assertEqual(stats, {"migrated": 3, "skipped": 1})
+        storage = SQLiteStorage(self.db_path)
+        try:
+            self.assertEqual(storage.read_all(), jsonl.read_all())
+        finally:
+            storage.close()
+
+    def test_rerun_copies_only_new_events(self):
+        """Test re-running the migration never duplicates events."""
+        jsonl = JSONLStorage(self.jsonl_path)
+        jsonl.append(Event(EventType.FILE_CREATE, "universal", {"filepath": "a"}))
+        jsonl.append(Event(EventType.FILE_CREATE, "universal", {"filepath": "b"}))
+
+        self.assertEqual(migrate_jsonl(self.jsonl_path, self.db_path)["migrated"], 2)
+        self.assertEqual(migrate_jsonl(self.jsonl_path, self.db_path)["migrated"], 0)
+
+        jsonl.append(Event(EventType.FILE_MODIFY, "universal", {"filepath": "c"}))
+        self.assertEqual(migrate_jsonl(self.jsonl_path, self.db_path)["migrated"], 1)
+
+        storage = SQLiteStorage(self.db_path)
+        try:
+            self.assertEqual(storage.read_all(), jsonl.read_all())
+        finally:
+            storage.close()
+
+    def test_rerun_after_compaction_skips_migrated_events(self):
+        """Test a rewritten log is re-read without copying migrated events again."""
+        now = datetime.utcnow()
+        kept_at = (now - timedelta(days=1)).isoformat()
+        jsonl = JSONLStorage(self.jsonl_path)
+        jsonl.append(
+            Event(EventType.FILE_CREATE, "universal", {"filepath": "old"},
+                  (now - timedelta(days=8)).isoformat())
+        )
+        jsonl.append(Event(EventType.FILE_CREATE, "universal", {"filepath": "kept"}, kept_at))
+        migrate_jsonl(self.jsonl_path, self.db_path)
+
+        # Same microsecond as the last migrated event, appended before the rewrite.
+        jsonl.append(Event(EventType.FILE_MODIFY, "universal", {"filepath": "same"}, kept_at))
+        TTLCleaner(self.jsonl_path, ttl_days=7).cleanup()
+        jsonl.append(Event(EventType.FILE_MODIFY, "universal", {"filepath": "new"}, now.isoformat()))
+
+        self.assertEqual(migrate_jsonl(self.jsonl_path, self.db_path)["migrated"], 2)
+        storage = SQLiteStorage(self.db_path)
+        try:
+            self.assertEqual(
+                [e.metadata["filepath"] for e in storage.read_all()],
+                ["old", "kept", "same", "new"],
+            )
+        finally:
+            storage.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
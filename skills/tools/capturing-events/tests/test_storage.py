@@ -3,6 +3,7 @@
 import json
 import tempfile
 import threading
+import time
 import unittest
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -67,6 +68,21 @@ class TestJSONLStorage(unittest.TestCase):
 
         self.assertEqual(len(lines), 3)
 
+    def test_append_many(self):
+        """Test bulk append through one buffered writer."""
+        self.storage.append(Event(EventType.FILE_CREATE, "universal", {"filepath": "a.txt"}))
+        events = (
+            Event(EventType.TERMINAL_EXECUTE, "universal", {"command": f"cmd {i}"})
+            for i in range(250)
+        )
+
+        written = self.storage.append_many(events, buffer_size=512)
+
+        self.assertEqual(written, 250)
+        stored = self.storage.read_all()
+        self.assertEqual(len(stored), 251)
+        self.assertEqual(stored[-1].metadata["command"], "cmd 249")
+
     def test_read_all(self):
         """Test reading all events."""
         events = [
@@ -223,6 +239,322 @@ class TestJSONLStorage(unittest.TestCase):
         self.assertEqual(count, 10)
 
 
+class TestJSONLStorageIterEvents(unittest.TestCase):
+    """Test JSONLStorage.iter_events streaming filters."""
+
+    def setUp(self):
+        """Create temporary storage with a mix of events."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.storage_path = str(Path(self.temp_dir.name) / "episodes.jsonl")
+        self.storage = JSONLStorage(self.storage_path)
+        self.events = [
+            Event(EventType.FILE_CREATE, "universal", {"filepath": "a.py"},
+                  "2026-02-26T10:00:00"),
+            Event(EventType.FILE_MODIFY, "copilot", {"filepath": "a.py"},
+                  "2026-02-26T11:00:00"),
+            Event(EventType.DIAGNOSTIC_ERROR, "universal", {"filepath": "b.py"},
+                  "2026-02-26T12:00:00"),
+            Event(EventType.FILE_MODIFY, "universal", {"filepath": "b.py"},
+                  "2026-02-26T13:00:00"),
+        ]
+        for event in self.events:
+            self.storage.append(event)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        self.temp_dir.cleanup()
+
+    def test_no_filters(self):
+        """Test unfiltered streaming returns every event in order."""
+        self.assertEqual(list(self.storage.iter_events()), self.events)
+
+    def test_time_range(self):
+        """Test since is inclusive and until is exclusive."""
+        events = list(
+            self.storage.iter_events(
+                since="2026-02-26T11:00:00", until="2026-02-26T13:00:00"
+            )
+        )
+
+        self.assertEqual(events, self.events[1:3])
+
+    def test_combined_filters(self):
+        """Test equality filters are combined."""
+        events = list(
+            self.storage.iter_events(event_type="file_modify", provider="universal")
+        )
+
+        self.assertEqual(events, [self.events[3]])
+        self.assertEqual(
+            list(self.storage.iter_events(filepath="a.py")), self.events[:2]
+        )
+
+    def test_reverse_with_limit(self):
+        """Test newest-first streaming stops at the limit."""
+        events = list(self.storage.iter_events(reverse=True, limit=2))
+
+        self.assertEqual(events, [self.events[3], self.events[2]])
+
+    def test_epoch_timestamp_storage(self):
+        """Test epoch-microsecond records filter and decode like ISO ones."""
+        epoch_path = str(Path(self.temp_dir.name) / "epoch.jsonl")
+        epoch_storage = JSONLStorage(epoch_path, epoch_timestamps=True)
+        for event in self.events:
+            epoch_storage.append(event)
+
+        with open(epoch_path, "r") as f:
+            self.assertIsInstance(json.loads(f.readline())["timestamp"], int)
+
+        self.assertEqual(epoch_storage.read_all(), self.events)
+        self.assertEqual(
+            list(epoch_storage.iter_events(since="2026-02-26T12:00:00")), self.events[2:]
+        )
+
+    def test_zero_limit(self):
+        """Test a zero limit yields nothing."""
+        self.assertEqual(list(self.storage.iter_events(limit=0)), [])
+
+
+class TestJSONLStorageFollow(unittest.TestCase):
+    """Test JSONLStorage.follow and rewrite."""
+
+    def setUp(self):
+        """Create temporary storage file for testing."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.storage_path = str(Path(self.temp_dir) / "episodes.jsonl")
+        self.storage = JSONLStorage(self.storage_path)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        if Path(self.storage_path).exists():
+            Path(self.storage_path).unlink()
+        Path(self.temp_dir).rmdir()
+
+    def _event(self, name, timestamp=None):
+        return Event(EventType.FILE_MODIFY, "universal", {"filepath": name}, timestamp)
+
+    def test_follow_existing_events(self):
+        """Test follow yields existing events with resumable offsets."""
+        self.storage.append(self._event("a.py"))
+        self.storage.append(self._event("b.py"))
+
+        results = list(self.storage.follow(poll_interval=0.01, idle_timeout=0.05))
+
+        self.assertEqual([e.metadata["filepath"] for e, _ in results], ["a.py", "b.py"])
+        self.assertEqual(results[-1][1], Path(self.storage_path).stat().st_size)
+
+    def test_follow_resumes_from_offset(self):
+        """Test follow resumes after a saved byte offset."""
+        self.storage.append(self._event("a.py"))
+        _, offset = next(self.storage.follow(poll_interval=0.01, idle_timeout=0.05))
+        self.storage.append(self._event("b.py"))
+
+        results = list(
+            self.storage.follow(offset=offset, poll_interval=0.01, idle_timeout=0.05)
+        )
+
+        self.assertEqual([e.metadata["filepath"] for e, _ in results], ["b.py"])
+
+    def test_follow_live_appends(self):
+        """Test follow yields events appended after it started."""
+
+        def writer():
+            time.sleep(0.05)
+            for i in range(3):
+                self.storage.append(self._event(f"live{i}.py"))
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        results = list(self.storage.follow(poll_interval=0.01, idle_timeout=0.5))
+        thread.join()
+
+        self.assertEqual(len(results), 3)
+
+    def test_follow_ignores_partial_line(self):
+        """Test a partially written line is not consumed."""
+        self.storage.append(self._event("a.py"))
+        with open(self.storage_path, "a", encoding="utf-8") as f:
+            f.write('{"event_type": "file_')
+
+        results = list(self.storage.follow(poll_interval=0.01, idle_timeout=0.05))
+
+        self.assertEqual(len(results), 1)
+
+    def test_follow_across_rotation(self):
+        """Test follow handles atomic rewrite without duplicating events."""
+        now = datetime.utcnow()
+        old = self._event("old.py", (now - timedelta(days=8)).isoformat())
+        kept = self._event("kept.py", now.isoformat())
+        self.storage.append(old)
+        self.storage.append(kept)
+
+        follower = self.storage.follow(poll_interval=0.01, idle_timeout=0.2)
+        seen = [next(follower)[0], next(follower)[0]]
+
+        TTLCleaner(self.storage_path, ttl_days=7).cleanup()
+        self.storage.append(self._event("new.py", (now + timedelta(seconds=1)).isoformat()))
+        seen.extend(e for e, _ in follower)
+
+        self.assertEqual(
+            [e.metadata["filepath"] for e in seen], ["old.py", "kept.py", "new.py"]
+        )
+
+    def test_follow_rotation_keeps_events_sharing_last_timestamp(self):
+        """Test events in the same microsecond as the last yielded survive a rewrite."""
+        now = datetime.utcnow()
+        same = now.isoformat()
+        self.storage.append(self._event("old.py", (now - timedelta(days=8)).isoformat()))
+        self.storage.append(self._event("first.py", same))
+
+        follower = self.storage.follow(poll_interval=0.01, idle_timeout=0.2)
+        seen = [next(follower)[0], next(follower)[0]]
+
+        TTLCleaner(self.storage_path, ttl_days=7).cleanup()
+        self.storage.append(self._event("second.py", same))
+        seen.extend(e for e, _ in follower)
+
+        self.assertEqual(
+            [e.metadata["filepath"] for e in seen], ["old.py", "first.py", "second.py"]
+        )
+
+    def test_follow_offset_past_end_restarts(self):
+        """Test an offset beyond the file size restarts from the beginning."""
+        self.storage.append(self._event("a.py"))
+
+        results = list(
+            self.storage.follow(offset=10_000, poll_interval=0.01, idle_timeout=0.05)
+        )
+
+        self.assertEqual(len(results), 1)
+
+    def test_rewrite_replaces_contents(self):
+        """Test rewrite atomically replaces stored events."""
+        self.storage.append(self._event("a.py"))
+        self.storage.append(self._event("b.py"))
+
+        self.storage.rewrite([self._event("c.py")])
+
+        events = self.storage.read_all()
+        self.assertEqual([e.metadata["filepath"] for e in events], ["c.py"])
+        self.assertEqual(list(Path(self.temp_dir).iterdir()), [Path(self.storage_path)])
+
+
+class TestJSONLStorageConsumers(unittest.TestCase):
+    """Test JSONLStorage.read_new consumer cursors."""
+
+    def setUp(self):
+        """Create temporary storage file for testing."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.storage_path = str(Path(self.temp_dir.name) / "episodes.jsonl")
+        self.storage = JSONLStorage(self.storage_path)
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        self.temp_dir.cleanup()
+
+    def _append(self, name, timestamp=None):
+        self.storage.append(
+            Event(EventType.FILE_MODIFY, "universal", {"filepath": name}, timestamp)
+        )
+
+    def _names(self, events):
+        return [e.metadata["filepath"] for e in events]
+
+    def test_read_new_empty_storage(self):
+        """Test reading new events before the log exists."""
+        self.assertEqual(self.storage.read_new("reflect"), [])
+
+    def test_read_new_only_returns_unseen(self):
+        """Test each call only returns events appended since the last one."""
+        self._append("a.py")
+        self._append("b.py")
+
+        self.assertEqual(self._names(self.storage.read_new("reflect")), ["a.py", "b.py"])
+        self.assertEqual(self.storage.read_new("reflect"), [])
+
+        self._append("c.py")
+
+        self.assertEqual(self._names(self.storage.read_new("reflect")), ["c.py"])
+
+    def test_offsets_point_at_event_lines(self):
+        """Test offsets skip blank and corrupt lines to the event's own line."""
+        self._append("a.py")
+        with open(self.storage_path, "a", encoding="utf-8") as f:
+            f.write("\n")
+            f.write('{"event_type": "file_modify", "provi\n')
+        self._append("b.py")
+
+        events = self.storage.read_new("index", with_offsets=True)
+
+        self.assertEqual(self._names(e for e, _ in events), ["a.py", "b.py"])
+        with open(self.storage_path, "rb") as f:
+            for event, offset in events:
+                f.seek(offset)
+                self.assertEqual(Event.from_json(f.readline().decode()), event)
+
+    def test_consumers_are_independent(self):
+        """Test named consumers keep separate cursors."""
+        self._append("a.py")
+        self.storage.read_new("reflect")
+
+        self.assertEqual(self._names(self.storage.read_new("patterns")), ["a.py"])
+
+    def test_cursor_persists_across_instances(self):
+        """Test cursors are stored next to the log."""
+        self._append("a.py")
+        self.storage.read_new("reflect")
+        self._append("b.py")
+
+        reopened = JSONLStorage(self.storage_path)
+
+        self.assertEqual(self._names(reopened.read_new("reflect")), ["b.py"])
+        self.assertIn("reflect", reopened.cursors.names())
+
+    def test_uncommitted_read_is_replayed(self):
+        """Test events are re-delivered until the consumer commits."""
+        self._append("a.py")
+
+        self.assertEqual(len(self.storage.read_new("reflect", commit=False)), 1)
+        self.assertEqual(len(self.storage.read_new("reflect", commit=False)), 1)
+        self.assertTrue(self.storage.commit("reflect"))
+        self.assertEqual(self.storage.read_new("reflect"), [])
+        self.assertFalse(self.storage.commit("reflect"))
+
+    def test_read_new_across_ttl_compaction(self):
+        """Test compaction neither replays kept events nor loses new ones."""
+        now = datetime.utcnow()
+        self._append("old.py", (now - timedelta(days=8)).isoformat())
+        self._append("kept.py", (now - timedelta(days=1)).isoformat())
+        self.storage.read_new("reflect")
+
+        TTLCleaner(self.storage_path, ttl_days=7).cleanup()
+        self._append("new.py", now.isoformat())
+
+        self.assertEqual(self._names(self.storage.read_new("reflect")), ["new.py"])
+
+    def test_compaction_keeps_events_sharing_last_timestamp(self):
+        """Test events appended in the same microsecond as the last read survive a rewrite."""
+        now = datetime.utcnow()
+        same = now.isoformat()
+        self._append("old.py", (now - timedelta(days=8)).isoformat())
+        self._append("first.py", same)
+        self.storage.read_new("reflect")
+
+        self._append("second.py", same)
+        TTLCleaner(self.storage_path, ttl_days=7).cleanup()
+        self._append("third.py", same)
+
+        self.assertEqual(
+            self._names(self.storage.read_new("reflect")), ["second.py", "third.py"]
+        )
+        self.assertEqual(self.storage.read_new("reflect"), [])
+
+    def test_invalid_consumer_name(self):
+        """Test consumer names cannot escape the cursor directory."""
+        with self.assertRaises(ValueError):
+            self.storage.read_new("../escape")
+
+
 class TestTTLCleaner(unittest.TestCase):
     """Test TTLCleaner class."""
 
@@ -6,12 +6,19 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+import os
+import shutil
 import subprocess
 import sys
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from score_with_guardrails import SCORER_VERSION, _evaluate, _markdown_report
+
+CACHE_FILES = ("analysis-report.md", "analysis-result.json", "manifest.json")
+
 
 def _sha256(path: Path) -> str:
     digest = hashlib.sha256()
@@ -21,6 +28,79 @@ def _sha256(path: Path) -> str:
     return digest.hexdigest()
 
 
+def _cache_key(
+    *, input_sha: str, schema_sha: str, score_script: Path, args: argparse.Namespace
+) -> str:
+    """Content address of one scoring run.
+
+    Besides the input and schema hashes and SCORER_VERSION, the key covers
+    the scorer source hash (so unreleased edits never serve stale results)
+    and the simulation overrides, which change what the scorer accepts.
+    """
+    material = {
+        "input_sha256": input_sha,
+        "schema_sha256": schema_sha,
+        "scorer_version": SCORER_VERSION,
+        "scorer_sha256": _sha256(score_script),
+        "allow_unconfirmed": args.allow_unconfirmed,
+        "allow_single_option": args.allow_single_option,
+        "allow_nonisolated_evaluations": args.allow_nonisolated_evaluations,
+    }
+    encoded = json.dumps(material, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _cache_lookup(cache_dir: Path, key: str) -> Path | None:
+    entry = cache_dir / key[:2] / key
+    if all((entry / name).is_file() for name in CACHE_FILES):
+        return entry
+    return None
+
+
+def _cache_store(cache_dir: Path, key: str, files: dict[str, Path]) -> None:
+    """Publish one entry atomically; a concurrent writer of the same key wins harmlessly."""
+    shard = cache_dir / key[:2]
+    shard.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{key[:12]}-", dir=shard))
+    try:
+        for name, source in files.items():
+            shutil.copyfile(source, staging / name)
+        os.replace(staging, shard / key)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
+        if _cache_lookup(cache_dir, key) is None:
+            raise
+
+
+def _score_in_process(
+    *,
+    input_path: Path,
+    report_path: Path,
+    result_path: Path,
+    args: argparse.Namespace,
+) -> tuple[int, str]:
+    """Score like ``score_with_guardrails.py`` would, returning (exit code, stderr).
+
+    Any exception is reported as a failed run, as a crashing subprocess
+    would be, so the caller still writes a failure manifest.
+    """
+    try:
+        with input_path.open("r", encoding="utf-8") as handle:
+            data = json.load(handle)
+        result = _evaluate(
+            data,
+            allow_unconfirmed=args.allow_unconfirmed,
+            allow_single_option=args.allow_single_option,
+            allow_nonisolated_evaluations=args.allow_nonisolated_evaluations,
+        )
+    except Exception as exc:
+        return 1, f"{type(exc).__name__}: {exc}"
+
+    report_path.write_text(_markdown_report(result), encoding="utf-8")
+    result_path.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    return 0, ""
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Run comparative decision scoring with reproducible artifacts."
@@ -57,6 +137,20 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Pass through simulation override to scorer.",
     )
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="Run the scorer in a separate interpreter instead of in-process.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Content-addressed result cache (default: <output-dir>/.score-cache).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always rescore; neither read nor write the result cache.",
+    )
     return parser.parse_args()
 
 
@@ -117,12 +211,35 @@ def main() -> int:
         args=args,
     )
 
-    completed = subprocess.run(
-        cmd,
-        text=True,
-        capture_output=True,
-        check=False,
+    cache_dir = Path(args.cache_dir).resolve() if args.cache_dir else output_dir / ".score-cache"
+    cache_key = _cache_key(
+        input_sha=input_sha, schema_sha=schema_sha, score_script=score_script, args=args
     )
+    cache_entry = None if args.no_cache else _cache_lookup(cache_dir, cache_key)
+
+    if cache_entry is not None:
+        shutil.copyfile(cache_entry / "analysis-report.md", report_path)
+        shutil.copyfile(cache_entry / "analysis-result.json", result_path)
+        cached_manifest = json.loads((cache_entry / "manifest.json").read_text(encoding="utf-8"))
+        execution = "cache"
+        exit_code, stderr = 0, ""
+    elif args.subprocess:
+        completed = subprocess.run(
+            cmd,
+            text=True,
+            capture_output=True,
+            check=False,
+        )
+        execution = "subprocess"
+        exit_code, stderr = completed.returncode, completed.stderr.strip()
+    else:
+        execution = "in-process"
+        exit_code, stderr = _score_in_process(
+            input_path=input_path,
+            report_path=report_path,
+            result_path=result_path,
+            args=args,
+        )
 
     manifest: dict[str, Any] = {
         "run_id": run_id,
@@ -136,22 +253,43 @@ def main() -> int:
             "sha256": schema_sha,
         },
         "score_script": str(score_script),
+        "scorer_version": SCORER_VERSION,
         "command": cmd,
+        "execution": execution,
         "artifacts": {
             "report": str(report_path),
             "result_json": str(result_path),
         },
-        "exit_code": completed.returncode,
-        "stderr": completed.stderr.strip(),
+        "cache": {
+            "enabled": not args.no_cache,
+            "key": cache_key,
+            "hit": cache_entry is not None,
+        },
+        "exit_code": exit_code,
+        "stderr": stderr,
     }
+    if cache_entry is not None:
+        manifest["cache"]["source_run_id"] = cached_manifest["run_id"]
+        manifest["cache"]["source_generated_at_utc"] = cached_manifest["generated_at_utc"]
 
     manifest_path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
 
-    if completed.returncode != 0:
-        if completed.stderr:
-            print(completed.stderr, file=sys.stderr)
+    if exit_code != 0:
+        if stderr:
+            print(stderr, file=sys.stderr)
         print(f"Manifest: {manifest_path}")
-        return completed.returncode
+        return exit_code
+
+    if not args.no_cache and cache_entry is None:
+        _cache_store(
+            cache_dir,
+            cache_key,
+            {
+                "analysis-report.md": report_path,
+                "analysis-result.json": result_path,
+                "manifest.json": manifest_path,
+            },
+        )
 
     print(f"Report: {report_path}")
     print(f"Result JSON: {result_path}")
@@ -28,6 +28,12 @@ ALLOWED_CONFIRMATION_SOURCES = {
 }
 EFFORT_ORDER = {"s": 0, "m": 1, "l": 2}
 RISK_ORDER = {"low": 0, "med": 1, "medium": 1, "high": 2}
+# Bump whenever scoring or report output changes; keys the harness result cache.
+SCORER_VERSION = "1.1.0"
+ENGINES = ("auto", "python", "numpy")
+# Under --engine auto, inputs with at least this many score cells
+# (alternatives x platforms x criteria) are scored with NumPy when available.
+NUMPY_MIN_CELLS = 4096
 
 
 def _to_float(value: Any, field: str) -> float:
@@ -352,6 +358,214 @@ def _platform_score(
     return weighted_score, missing, coverage
 
 
+def _score_python(
+    alternatives: list[dict[str, Any]],
+    criteria: list[dict[str, Any]],
+    required_platforms: list[str],
+    major_platforms: list[str],
+    current_platform: str,
+    blend: dict[str, float],
+    score_scale: str,
+) -> list[dict[str, Any]]:
+    expected_values = len(criteria) * len(required_platforms)
+    metrics = []
+    for alternative in alternatives:
+        per_platform: dict[str, tuple[float, int, float]] = {}
+        for platform in required_platforms:
+            per_platform[platform] = _platform_score(alternative, platform, criteria, score_scale)
+
+        major_scores = [per_platform[p][0] for p in major_platforms]
+        current_score = per_platform[current_platform][0]
+        major_average = sum(major_scores) / len(major_scores)
+        overall = (
+            blend["major_platform_average"] * major_average
+            + blend["current_platform"] * current_score
+        )
+
+        missing_values = sum(missing for _, missing, _ in per_platform.values())
+        coverage = sum(cov for _, _, cov in per_platform.values()) / len(required_platforms)
+        coverage = max(0.0, min(1.0, coverage))
+        count_coverage = 1.0 - (missing_values / expected_values if expected_values else 0.0)
+        count_coverage = max(0.0, min(1.0, count_coverage))
+
+        metrics.append(
+            {
+                "platform_scores": {p: per_platform[p][0] for p in required_platforms},
+                "major_average": major_average,
+                "current_score": current_score,
+                "overall": overall,
+                "coverage": coverage,
+                "count_coverage": count_coverage,
+                "missing_values": missing_values,
+            }
+        )
+    return metrics
+
+
+def _load_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _compile_score_arrays(
+    np: Any,
+    alternatives: list[dict[str, Any]],
+    criteria: list[dict[str, Any]],
+    platforms: list[str],
+    score_scale: str,
+) -> tuple[Any, Any] | None:
+    """Compile scores into dense alternatives x platforms x criteria arrays.
+
+    Returns (percent scores with missing cells zeroed, presence mask), or None
+    if any cell is invalid so the caller can re-run the scalar path, which
+    raises the same error, for the same first bad cell, as before.
+    """
+    criterion_ids = [criterion["id"] for criterion in criteria]
+    raw: list[Any] = []
+    for alternative in alternatives:
+        scores_by_platform = alternative.get("scores", {})
+        for platform in platforms:
+            platform_scores = scores_by_platform.get(platform, {})
+            if platform_scores is None:
+                platform_scores = {}
+            if not isinstance(platform_scores, dict):
+                return None
+            raw.extend(map(platform_scores.get, criterion_ids))
+
+    shape = (len(alternatives), len(platforms), len(criterion_ids))
+    cells = np.fromiter(raw, dtype=object, count=len(raw))
+    mask = np.not_equal(cells, None)
+    try:
+        values = cells[mask].astype(np.float64)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+    scores = np.zeros(cells.shape, dtype=np.float64)
+    scores[mask] = values
+    if not np.isfinite(scores).all():
+        return None
+    if score_scale == "1-5":
+        scores *= 20.0
+    np.clip(scores, 0.0, 100.0, out=scores)
+    scores[~mask] = 0.0
+    return scores.reshape(shape), mask.reshape(shape)
+
+
+def _score_numpy(
+    np: Any,
+    alternatives: list[dict[str, Any]],
+    criteria: list[dict[str, Any]],
+    required_platforms: list[str],
+    major_platforms: list[str],
+    current_platform: str,
+    blend: dict[str, float],
+    score_scale: str,
+) -> list[dict[str, Any]] | None:
+    """Vectorized ``_score_python``; None if the input needs the scalar path.
+
+    Reductions run as explicit loops over the small criteria and platform
+    axes, in the scalar path's order, so every float is bit-identical to
+    the pure-Python result rather than merely close to it.
+    """
+    compiled = _compile_score_arrays(np, alternatives, criteria, required_platforms, score_scale)
+    if compiled is None:
+        return None
+    scores, mask = compiled
+
+    count = len(alternatives)
+    platform_count = len(required_platforms)
+    numerator = np.zeros((count, platform_count))
+    covered = np.zeros((count, platform_count))
+    for index, criterion in enumerate(criteria):
+        weight = criterion["weight"]
+        numerator += weight * scores[:, :, index]
+        covered += np.where(mask[:, :, index], weight, 0.0)
+    weighted = np.divide(
+        numerator, covered, out=np.zeros_like(numerator), where=covered > 0
+    )
+
+    column = {platform: index for index, platform in enumerate(required_platforms)}
+    major_sum = np.zeros(count)
+    for platform in major_platforms:
+        major_sum += weighted[:, column[platform]]
+    major_average = major_sum / len(major_platforms)
+    current_score = weighted[:, column[current_platform]]
+    overall = (
+        blend["major_platform_average"] * major_average
+        + blend["current_platform"] * current_score
+    )
+
+    coverage_sum = np.zeros(count)
+    for index in range(platform_count):
+        coverage_sum += covered[:, index]
+    coverage = np.clip(coverage_sum / platform_count, 0.0, 1.0)
+    missing_values = (~mask).sum(axis=(1, 2))
+    expected_values = len(criteria) * platform_count
+    count_coverage = np.clip(
+        1.0 - (missing_values / expected_values if expected_values else 0.0), 0.0, 1.0
+    )
+
+    weighted_rows = weighted.tolist()
+    return [
+        {
+            "platform_scores": dict(zip(required_platforms, weighted_rows[index])),
+            "major_average": major,
+            "current_score": current,
+            "overall": total,
+            "coverage": cov,
+            "count_coverage": count_cov,
+            "missing_values": missing,
+        }
+        for index, (major, current, total, cov, count_cov, missing) in enumerate(
+            zip(
+                major_average.tolist(),
+                current_score.tolist(),
+                overall.tolist(),
+                coverage.tolist(),
+                count_coverage.tolist(),
+                missing_values.tolist(),
+            )
+        )
+    ]
+
+
+def _score_alternatives(
+    alternatives: list[dict[str, Any]],
+    criteria: list[dict[str, Any]],
+    required_platforms: list[str],
+    major_platforms: list[str],
+    current_platform: str,
+    blend: dict[str, float],
+    score_scale: str,
+    engine: str,
+) -> list[dict[str, Any]]:
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of: {', '.join(ENGINES)}")
+
+    args = (
+        alternatives,
+        criteria,
+        required_platforms,
+        major_platforms,
+        current_platform,
+        blend,
+        score_scale,
+    )
+    cells = len(alternatives) * len(required_platforms) * len(criteria)
+    if engine == "numpy" or (engine == "auto" and cells >= NUMPY_MIN_CELLS):
+        np = _load_numpy()
+        if np is None and engine == "numpy":
+            raise ValueError("engine 'numpy' requires NumPy to be installed")
+        if np is not None:
+            metrics = _score_numpy(np, *args)
+            if metrics is not None:
+                return metrics
+    return _score_python(*args)
+
+
 def _recommend(
     ranked: list[dict[str, Any]],
     rules: dict[str, float],
@@ -474,6 +688,7 @@ def _evaluate(
     allow_unconfirmed: bool,
     allow_single_option: bool,
     allow_nonisolated_evaluations: bool,
+    engine: str = "auto",
 ) -> dict[str, Any]:
     decision = (
         str(data.get("decision", "Comparative decision analysis")).strip()
@@ -512,29 +727,20 @@ def _evaluate(
     rules = _normalize_rules(data.get("recommendation_rules"))
 
     required_platforms = sorted(set(major_platforms + [current_platform]))
-    expected_values = len(criteria) * len(required_platforms)
+    scored = _score_alternatives(
+        alternatives,
+        criteria,
+        required_platforms,
+        major_platforms,
+        current_platform,
+        blend,
+        score_scale,
+        engine,
+    )
 
     results = []
-    for alternative in alternatives:
-        per_platform: dict[str, tuple[float, int, float]] = {}
-        for platform in required_platforms:
-            per_platform[platform] = _platform_score(alternative, platform, criteria, score_scale)
-
-        major_scores = [per_platform[p][0] for p in major_platforms]
-        current_score = per_platform[current_platform][0]
-        major_average = sum(major_scores) / len(major_scores)
-        overall = (
-            blend["major_platform_average"] * major_average
-            + blend["current_platform"] * current_score
-        )
-
-        missing_values = sum(missing for _, missing, _ in per_platform.values())
-        coverage = sum(cov for _, _, cov in per_platform.values()) / len(required_platforms)
-        coverage = max(0.0, min(1.0, coverage))
-        count_coverage = 1.0 - (missing_values / expected_values if expected_values else 0.0)
-        count_coverage = max(0.0, min(1.0, count_coverage))
-
-        platform_scores = {p: round(per_platform[p][0], 2) for p in required_platforms}
+    for alternative, metrics in zip(alternatives, scored):
+        platform_scores = {p: round(v, 2) for p, v in metrics["platform_scores"].items()}
 
         results.append(
             {
@@ -547,12 +753,12 @@ def _evaluate(
                 "feasible": alternative["feasible"],
                 "justification": alternative["justification"],
                 "platform_scores": platform_scores,
-                "major_platform_average": round(major_average, 2),
-                "current_platform_score": round(current_score, 2),
-                "overall_success_score": round(overall, 2),
-                "coverage": round(coverage, 3),
-                "count_coverage": round(count_coverage, 3),
-                "missing_values": missing_values,
+                "major_platform_average": round(metrics["major_average"], 2),
+                "current_platform_score": round(metrics["current_score"], 2),
+                "overall_success_score": round(metrics["overall"], 2),
+                "coverage": round(metrics["coverage"], 3),
+                "count_coverage": round(metrics["count_coverage"], 3),
+                "missing_values": metrics["missing_values"],
                 "notes": alternative.get("notes", ""),
             }
         )
@@ -690,6 +896,15 @@ def parse_args() -> argparse.Namespace:
             "(simulation only)."
         ),
     )
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="auto",
+        help=(
+            "Scoring engine: 'numpy' vectorizes large inputs, 'python' needs no "
+            f"dependencies, 'auto' uses NumPy from {NUMPY_MIN_CELLS} score cells if installed."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -707,6 +922,7 @@ def main() -> int:
         allow_unconfirmed=args.allow_unconfirmed,
         allow_single_option=args.allow_single_option,
         allow_nonisolated_evaluations=args.allow_nonisolated_evaluations,
+        engine=args.engine,
     )
     report = _markdown_report(result)
 
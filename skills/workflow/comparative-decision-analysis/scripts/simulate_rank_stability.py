@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""Monte Carlo rank stability for comparative decision scoring."""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from score_with_guardrails import (
+    _compile_score_arrays,
+    _effort_rank,
+    _evaluate,
+    _load_numpy,
+    _normalize_alternatives,
+    _risk_rank,
+)
+
+
+ACTIONS = ("select", "compose", "improve", "extend", "build-new")
+DEFAULT_DRAWS = 100_000
+DEFAULT_SCORE_NOISE = 5.0
+DEFAULT_WEIGHT_CONCENTRATION = 100.0
+# Draws per seeded chunk. Chunks, not workers, own the random streams, so
+# results for a given --seed do not depend on --workers.
+CHUNK_DRAWS = 1 << 16
+# Upper bound on draws x alternatives x platforms x criteria held at once.
+BATCH_CELLS = 1 << 22
+
+
+def _simulate_chunk(
+    model: dict[str, Any],
+    draws: int,
+    seed: Any,
+    score_noise: float,
+    weight_concentration: float,
+) -> tuple[list[int], list[int]]:
+    """Run ``draws`` simulations and count rank-first alternatives and actions.
+
+    Worker entry point; ``model`` holds the compiled score arrays and the
+    static ranking and recommendation inputs built by ``_build_model``.
+    """
+    np = _load_numpy()
+    rng = np.random.default_rng(seed)
+    scores = model["scores"]
+    mask = model["mask"]
+    base_weights = model["weights"]
+    count, platform_count, criterion_count = scores.shape
+    batch = max(1, BATCH_CELLS // max(1, scores.size))
+
+    first_counts = np.zeros(count, dtype=np.int64)
+    action_counts = np.zeros(len(ACTIONS), dtype=np.int64)
+    remaining = draws
+    while remaining:
+        size = min(batch, remaining)
+        remaining -= size
+
+        if weight_concentration > 0:
+            # Dirichlet around the confirmed weights; zero-weight criteria stay zero.
+            alpha = np.where(base_weights > 0, base_weights * weight_concentration, 1.0)
+            weights = rng.gamma(alpha, size=(size, criterion_count))
+            weights *= base_weights > 0
+            weights /= weights.sum(axis=1, keepdims=True)
+        else:
+            weights = np.broadcast_to(base_weights, (size, criterion_count))
+
+        if score_noise > 0:
+            noisy = scores + rng.normal(0.0, score_noise, size=(size,) + scores.shape)
+            np.clip(noisy, 0.0, 100.0, out=noisy)
+            noisy *= mask
+        else:
+            noisy = np.broadcast_to(scores, (size,) + scores.shape)
+
+        numerator = np.einsum("nc,napc->nap", weights, noisy)
+        covered = np.einsum("nc,apc->nap", weights, mask)
+        weighted = np.divide(
+            numerator, covered, out=np.zeros_like(numerator), where=covered > 0
+        )
+        major = weighted[:, :, model["major_columns"]].sum(axis=2) / len(model["major_columns"])
+        current = weighted[:, :, model["current_column"]]
+        overall = model["blend_major"] * major + model["blend_current"] * current
+        coverage = np.clip(covered.sum(axis=2) / platform_count, 0.0, 1.0)
+
+        major = np.round(major, 2)
+        current = np.round(current, 2)
+        overall = np.round(overall, 2)
+        coverage = np.round(coverage, 3)
+
+        # Same order as _evaluate's ranking; np.lexsort treats the last key as primary.
+        static = [np.broadcast_to(row, (size, count)) for row in model["static_keys"]]
+        infeasible = np.broadcast_to(model["infeasible"], (size, count))
+        order = np.lexsort(static + [-major, -current, -overall, infeasible])
+        first_counts += np.bincount(order[:, 0], minlength=count)
+
+        actions = _recommend_actions(np, model, order, overall, major, current, coverage)
+        action_counts += np.bincount(actions, minlength=len(ACTIONS))
+
+    return first_counts.tolist(), action_counts.tolist()
+
+
+def _recommend_actions(
+    np: Any,
+    model: dict[str, Any],
+    order: Any,
+    overall: Any,
+    major: Any,
+    current: Any,
+    coverage: Any,
+) -> Any:
+    """Vectorized ``_recommend``: the action index for every draw.
+
+    Feasibility is fixed per alternative, so feasible alternatives always
+    occupy the leading ranks and the best/second feasible options are simply
+    the first two columns of ``order``.
+    """
+    rules = model["rules"]
+    size = order.shape[0]
+    action = {name: index for index, name in enumerate(ACTIONS)}
+    feasible_count = model["feasible_count"]
+    if feasible_count == 0:
+        return np.full(size, action["build-new"])
+
+    rows = np.arange(size)
+    best = order[:, 0]
+    best_overall = overall[rows, best]
+    if feasible_count == 1:
+        return np.where(
+            best_overall >= rules["improve_min"], action["improve"], action["build-new"]
+        )
+
+    second = order[:, 1]
+    margin = best_overall - overall[rows, second]
+    best_coverage_ok = coverage[rows, best] >= rules["min_coverage"]
+    second_coverage_ok = coverage[rows, second] >= rules["min_coverage"]
+    gap = major[rows, best] - current[rows, best]
+
+    return np.select(
+        [
+            (best_overall >= rules["select_min"])
+            & (margin >= rules["select_margin"])
+            & best_coverage_ok,
+            (best_overall >= rules["compose_min"])
+            & (margin < rules["compose_margin"])
+            & best_coverage_ok
+            & second_coverage_ok,
+            (best_overall >= rules["improve_min"])
+            & best_coverage_ok
+            & (gap >= rules["extend_gap"]),
+            best_overall >= rules["improve_min"],
+        ],
+        [action["select"], action["compose"], action["extend"], action["improve"]],
+        default=action["build-new"],
+    )
+
+
+def _build_model(
+    np: Any,
+    data: dict[str, Any],
+    result: dict[str, Any],
+    *,
+    allow_single_option: bool,
+) -> dict[str, Any]:
+    alternatives = _normalize_alternatives(
+        data.get("alternatives"), allow_single_option=allow_single_option
+    )
+    criteria = result["criteria"]
+    major_platforms = result["major_platforms"]
+    current_platform = result["current_platform"]
+    required_platforms = sorted(set(major_platforms + [current_platform]))
+
+    compiled = _compile_score_arrays(
+        np, alternatives, criteria, required_platforms, result["score_scale"]
+    )
+    if compiled is None:
+        raise ValueError("alternatives contain scores the scorer cannot compile")
+    scores, mask = compiled
+
+    names = sorted({alternative["name"].lower() for alternative in alternatives})
+    column = {platform: index for index, platform in enumerate(required_platforms)}
+    return {
+        "ids": [alternative["id"] for alternative in alternatives],
+        "scores": scores,
+        "mask": mask.astype(np.float64),
+        "weights": np.array([criterion["weight"] for criterion in criteria]),
+        "major_columns": [column[platform] for platform in major_platforms],
+        "current_column": column[current_platform],
+        "blend_major": result["weights"]["major_platform_average"],
+        "blend_current": result["weights"]["current_platform"],
+        "rules": result["recommendation"]["rules"],
+        "infeasible": np.array([not alternative["feasible"] for alternative in alternatives]),
+        "feasible_count": sum(1 for alternative in alternatives if alternative["feasible"]),
+        "static_keys": [
+            np.array([names.index(alternative["name"].lower()) for alternative in alternatives]),
+            np.array([_risk_rank(alternative["risk"]) for alternative in alternatives]),
+            np.array([_effort_rank(alternative["effort"]) for alternative in alternatives]),
+        ],
+    }
+
+
+def _simulate(
+    data: dict[str, Any],
+    *,
+    draws: int,
+    seed: int,
+    score_noise: float,
+    weight_concentration: float,
+    workers: int,
+    allow_unconfirmed: bool,
+    allow_single_option: bool,
+    allow_nonisolated_evaluations: bool,
+) -> dict[str, Any]:
+    if draws < 1:
+        raise ValueError("draws must be at least 1")
+    if score_noise < 0:
+        raise ValueError("score_noise must be non-negative")
+    if weight_concentration < 0:
+        raise ValueError("weight_concentration must be non-negative")
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    np = _load_numpy()
+    if np is None:
+        raise ValueError("Monte Carlo simulation requires NumPy to be installed")
+
+    result = _evaluate(
+        data,
+        allow_unconfirmed=allow_unconfirmed,
+        allow_single_option=allow_single_option,
+        allow_nonisolated_evaluations=allow_nonisolated_evaluations,
+        engine="numpy",
+    )
+    model = _build_model(np, data, result, allow_single_option=allow_single_option)
+
+    sizes = [CHUNK_DRAWS] * (draws // CHUNK_DRAWS)
+    if draws % CHUNK_DRAWS:
+        sizes.append(draws % CHUNK_DRAWS)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    chunk_args = [
+        (model, size, chunk_seed, score_noise, weight_concentration)
+        for size, chunk_seed in zip(sizes, seeds)
+    ]
+    if workers == 1 or len(chunk_args) == 1:
+        partials = [_simulate_chunk(*args) for args in chunk_args]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunk_args))) as pool:
+            partials = list(pool.map(_simulate_chunk, *zip(*chunk_args)))
+
+    first_counts = [sum(column) for column in zip(*(partial[0] for partial in partials))]
+    action_counts = [sum(column) for column in zip(*(partial[1] for partial in partials))]
+    position = {alt_id: index for index, alt_id in enumerate(model["ids"])}
+    recommendation = result["recommendation"]
+    return {
+        "draws": draws,
+        "seed": seed,
+        "score_noise": score_noise,
+        "weight_concentration": weight_concentration,
+        "base_top_option_id": recommendation["top_option_id"],
+        "base_action": recommendation["action"],
+        "rank_first_probability": {
+            item["id"]: round(first_counts[position[item["id"]]] / draws, 6)
+            for item in result["ranked_alternatives"]
+        },
+        "action_probability": {
+            name: round(count / draws, 6) for name, count in zip(ACTIONS, action_counts)
+        },
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Estimate rank and recommendation stability under score and weight noise."
+    )
+    parser.add_argument("--input", required=True, help="Path to analysis input JSON.")
+    parser.add_argument("--output", help="Path to simulation JSON output (default: stdout).")
+    parser.add_argument(
+        "--draws", type=int, default=DEFAULT_DRAWS, help="Number of Monte Carlo draws."
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed for reproducible draws.")
+    parser.add_argument(
+        "--score-noise",
+        type=float,
+        default=DEFAULT_SCORE_NOISE,
+        help="Standard deviation of per-cell score noise, in 0-100 points (0 disables).",
+    )
+    parser.add_argument(
+        "--weight-concentration",
+        type=float,
+        default=DEFAULT_WEIGHT_CONCENTRATION,
+        help="Dirichlet concentration around the criterion weights; higher is tighter (0 disables).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes (default: CPU count). Results do not depend on this.",
+    )
+    parser.add_argument(
+        "--allow-unconfirmed",
+        action="store_true",
+        help="Allow simulation when criteria_confirmed is false (simulation only).",
+    )
+    parser.add_argument(
+        "--allow-single-option",
+        action="store_true",
+        help="Allow simulating one alternative (simulation only).",
+    )
+    parser.add_argument(
+        "--allow-nonisolated-evaluations",
+        action="store_true",
+        help="Allow missing independent evaluator records (simulation only).",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    input_path = Path(args.input)
+    if not input_path.exists():
+        raise SystemExit(f"Input file not found: {input_path}")
+
+    with input_path.open("r", encoding="utf-8") as handle:
+        data = json.load(handle)
+
+    report = _simulate(
+        data,
+        draws=args.draws,
+        seed=args.seed,
+        score_noise=args.score_noise,
+        weight_concentration=args.weight_concentration,
+        workers=args.workers,
+        allow_unconfirmed=args.allow_unconfirmed,
+        allow_single_option=args.allow_single_option,
+        allow_nonisolated_evaluations=args.allow_nonisolated_evaluations,
+    )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
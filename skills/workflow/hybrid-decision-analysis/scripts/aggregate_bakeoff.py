@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""Aggregate scenario bakeoff results into bakeoff-aggregate.v1."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+from pathlib import Path
+import sys
+from typing import Any, Iterator
+
+
+RANKING_RULE = ["avg_total desc", "stdev asc", "option id asc"]
+
+
+def _to_number(value: Any, field: str) -> float | int:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Expected numeric value for '{field}', got {value!r}")
+    if isinstance(value, float) and (math.isnan(value) or math.isinf(value)):
+        raise ValueError(f"Invalid numeric value for '{field}': {value!r}")
+    return value
+
+
+class _RunningStats:
+    """Welford online mean/variance with min, max and a running mean per criterion."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum: float | int | None = None
+        self.maximum: float | int | None = None
+        self.totals: list[float | int] = []
+        self.criterion_means: dict[str, float] = {}
+        self.criterion_counts: dict[str, int] = {}
+
+    def add(self, total: float | int, scores: dict[str, float | int]) -> None:
+        self.count += 1
+        delta = total - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (total - self.mean)
+        if self.minimum is None or total < self.minimum:
+            self.minimum = total
+        if self.maximum is None or total > self.maximum:
+            self.maximum = total
+        self.totals.append(total)
+
+        for criterion, score in scores.items():
+            seen = self.criterion_counts.get(criterion, 0) + 1
+            mean = self.criterion_means.get(criterion, 0.0)
+            self.criterion_counts[criterion] = seen
+            self.criterion_means[criterion] = mean + (score - mean) / seen
+
+    @property
+    def stdev(self) -> float:
+        """Population standard deviation of the scenario totals."""
+        return math.sqrt(self.m2 / self.count) if self.count else 0.0
+
+
+def _iter_documents(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield run records (and header objects) from one results file.
+
+    A ``.jsonl`` file is read line by line: each line is one run, or a header
+    object without ``scenario`` that sets ``fixture_id``/``run_id``/``judge_rubric``.
+    Any other file is one bakeoff-results document whose ``runs`` are yielded
+    after its header; only that file is held in memory.
+    """
+    if path.suffix == ".jsonl":
+        with path.open("r", encoding="utf-8") as handle:
+            for line_number, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    raise ValueError(f"{path}:{line_number}: invalid JSON ({exc.msg})") from exc
+                if not isinstance(record, dict):
+                    raise ValueError(f"{path}:{line_number}: expected a JSON object")
+                yield record
+        return
+
+    with path.open("r", encoding="utf-8") as handle:
+        document = json.load(handle)
+    if not isinstance(document, dict):
+        raise ValueError(f"{path}: expected a bakeoff results object")
+    runs = document.get("runs")
+    if not isinstance(runs, list):
+        raise ValueError(f"{path}: runs must be an array")
+    yield {key: value for key, value in document.items() if key != "runs"}
+    for run in runs:
+        if not isinstance(run, dict):
+            raise ValueError(f"{path}: every run must be an object")
+        yield run
+
+
+class BakeoffAggregator:
+    """Single-pass aggregation of bakeoff runs across any number of result files.
+
+    Per option it keeps Welford running statistics and the scenario totals;
+    per scenario only each option's total for the final ranking. Judge
+    notes and per-run score sheets are dropped as soon as they are counted.
+    """
+
+    def __init__(self, run_id: str | None = None) -> None:
+        self.fixture_id: str | None = None
+        self.run_id = run_id
+        self._run_id_override = run_id is not None
+        self.criteria: list[str] = []
+        self.options: dict[str, _RunningStats] = {}
+        self.scenarios: dict[str, dict[str, float | int]] = {}
+
+    def _header(self, header: dict[str, Any], source: str) -> None:
+        fixture_id = header.get("fixture_id")
+        if fixture_id is not None:
+            if self.fixture_id is not None and fixture_id != self.fixture_id:
+                raise ValueError(
+                    f"{source}: fixture_id {fixture_id!r} does not match {self.fixture_id!r}"
+                )
+            self.fixture_id = fixture_id
+
+        run_id = header.get("run_id")
+        if run_id is not None and not self._run_id_override:
+            if self.run_id is not None and run_id != self.run_id:
+                raise ValueError(
+                    f"{source}: run_id {run_id!r} differs from {self.run_id!r}; pass --run-id"
+                )
+            self.run_id = run_id
+
+        rubric = header.get("judge_rubric")
+        if isinstance(rubric, dict):
+            for criterion in rubric.get("criteria") or []:
+                if criterion not in self.criteria:
+                    self.criteria.append(criterion)
+
+    def add_run(self, run: dict[str, Any], source: str = "<run>") -> None:
+        # Interned: the same few option and scenario names repeat across many runs.
+        scenario = sys.intern(str(run.get("scenario", "")).strip())
+        option = sys.intern(str(run.get("option", "")).strip())
+        if not scenario or not option:
+            raise ValueError(f"{source}: every run needs a scenario and an option")
+        scenario_totals = self.scenarios.setdefault(scenario, {})
+        if option in scenario_totals:
+            raise ValueError(
+                f"{source}: duplicate run for scenario {scenario!r}, option {option!r}"
+            )
+
+        raw_scores = run.get("scores") or {}
+        if not isinstance(raw_scores, dict):
+            raise ValueError(f"{source}: {scenario}/{option} scores must be an object")
+        scores = {
+            criterion: _to_number(value, f"{scenario}.{option}.scores.{criterion}")
+            for criterion, value in raw_scores.items()
+        }
+        if run.get("total") is not None:
+            total = _to_number(run["total"], f"{scenario}.{option}.total")
+        elif scores:
+            total = sum(scores.values())
+        else:
+            raise ValueError(f"{source}: {scenario}/{option} needs a total or scores")
+
+        for criterion in scores:
+            if criterion not in self.criteria:
+                self.criteria.append(criterion)
+        self.options.setdefault(option, _RunningStats()).add(total, scores)
+        scenario_totals[option] = total
+
+    def add_file(self, path: Path) -> None:
+        for record in _iter_documents(path):
+            if "scenario" in record:
+                self.add_run(record, str(path))
+            else:
+                self._header(record, str(path))
+
+    def result(self) -> dict[str, Any]:
+        if not self.options:
+            raise ValueError("No bakeoff runs to aggregate")
+
+        ranked = sorted(
+            self.options.items(), key=lambda item: (-item[1].mean, item[1].stdev, item[0])
+        )
+        return {
+            "fixture_id": self.fixture_id,
+            "run_id": self.run_id,
+            "ranking_rule": list(RANKING_RULE),
+            "summary": [
+                {
+                    "option": option,
+                    "avg_total": round(stats.mean, 2),
+                    "min_total": stats.minimum,
+                    "max_total": stats.maximum,
+                    "stdev": round(stats.stdev, 2),
+                    "scenario_totals": stats.totals,
+                }
+                for option, stats in ranked
+            ],
+            "scenario_rankings": {
+                scenario: [
+                    {"option": option, "total": total}
+                    for option, total in sorted(
+                        totals.items(), key=lambda item: (-item[1], item[0])
+                    )
+                ]
+                for scenario, totals in self.scenarios.items()
+            },
+            "criterion_averages": {
+                option: {
+                    criterion: round(stats.criterion_means[criterion], 2)
+                    for criterion in self.criteria
+                    if criterion in stats.criterion_means
+                }
+                for option, stats in self.options.items()
+            },
+        }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Aggregate bakeoff result files into bakeoff-aggregate.v1."
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="Bakeoff results JSON documents or JSONL files with one run per line.",
+    )
+    parser.add_argument("--output", help="Path to aggregate JSON output (default: stdout).")
+    parser.add_argument(
+        "--run-id", help="run_id for the aggregate; required when inputs disagree."
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    aggregator = BakeoffAggregator(run_id=args.run_id)
+    for raw_path in args.inputs:
+        path = Path(raw_path)
+        if not path.exists():
+            raise SystemExit(f"Input file not found: {path}")
+        aggregator.add_file(path)
+
+    text = json.dumps(aggregator.result(), indent=2)
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
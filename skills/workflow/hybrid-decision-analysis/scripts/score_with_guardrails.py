@@ -26,6 +26,8 @@ EFFORT_ORDER = {"s": 0, "m": 1, "l": 2}
 RISK_ORDER = {"low": 0, "med": 1, "medium": 1, "high": 2}
 SCORER_VERSION = "1.2.0"
 RULES_VERSION = "2026-02-20"
+DEFAULT_SENSITIVITY_FACTORS = (0.9, 1.1)
+DEFAULT_STABILITY_THRESHOLD = 0.3
 
 
 def _to_float(value: Any, field: str) -> float:
@@ -538,6 +540,245 @@ def _evaluate(data: dict[str, Any], *, allow_unconfirmed: bool, allow_single_opt
     }
 
 
+def _parse_factors(value: str) -> list[float]:
+    """Parse ``0.9,1.1`` or an evenly spaced ``start:stop:count`` grid."""
+    raw = value.strip()
+    if raw.count(":") == 2:
+        start_raw, stop_raw, count_raw = raw.split(":")
+        start = _to_float(start_raw, "factors.start")
+        stop = _to_float(stop_raw, "factors.stop")
+        try:
+            count = int(count_raw)
+        except ValueError as exc:
+            raise ValueError(f"factors count must be an integer, got {count_raw!r}") from exc
+        if count < 1:
+            raise ValueError("factors count must be at least 1")
+        if count == 1:
+            factors = [start]
+        else:
+            step = (stop - start) / (count - 1)
+            factors = [start + step * index for index in range(count)]
+    else:
+        factors = [_to_float(item, "factors") for item in raw.split(",") if item.strip()]
+
+    if not factors:
+        raise ValueError("At least one sensitivity factor is required")
+    if any(factor <= 0 for factor in factors):
+        raise ValueError("Sensitivity factors must be positive")
+    return [round(factor, 6) for factor in factors]
+
+
+def _weight_grid(criteria: list[dict[str, Any]], factors: list[float]) -> list[list[float]]:
+    """Return the renormalized weights of every criterion x factor case, base case first."""
+    base = [criterion["weight"] for criterion in criteria]
+    grid = [base]
+    for index in range(len(criteria)):
+        for factor in factors:
+            weights = list(base)
+            weights[index] *= factor
+            total = sum(weights)
+            grid.append([weight / total for weight in weights])
+    return grid
+
+
+def _sensitivity_python(
+    alternatives: list[dict[str, Any]],
+    criteria: list[dict[str, Any]],
+    grid: list[list[float]],
+    required_platforms: list[str],
+    major_platforms: list[str],
+    current_platform: str,
+    blend: dict[str, float],
+    score_scale: str,
+    order_keys: list[tuple[Any, ...]],
+) -> tuple[list[list[float]], list[int]]:
+    overall_rows = []
+    winners = []
+    for weights in grid:
+        case_criteria = [
+            {**criterion, "weight": weight} for criterion, weight in zip(criteria, weights)
+        ]
+        overall_row = []
+        rank_keys = []
+        for index, alternative in enumerate(alternatives):
+            per_platform = {
+                platform: _platform_score(alternative, platform, case_criteria, score_scale)[0]
+                for platform in required_platforms
+            }
+            major = sum(per_platform[p] for p in major_platforms) / len(major_platforms)
+            current = per_platform[current_platform]
+            overall = blend["major_platform_average"] * major + blend["current_platform"] * current
+            overall_row.append(overall)
+            infeasible, effort_rank, risk_rank, name = order_keys[index]
+            rank_keys.append(
+                (
+                    infeasible,
+                    -round(overall, 2),
+                    -round(current, 2),
+                    -round(major, 2),
+                    effort_rank,
+                    risk_rank,
+                    name,
+                )
+            )
+        overall_rows.append(overall_row)
+        winners.append(min(range(len(alternatives)), key=rank_keys.__getitem__))
+    return overall_rows, winners
+
+
+def _sensitivity_numpy(
+    np: Any,
+    alternatives: list[dict[str, Any]],
+    criteria: list[dict[str, Any]],
+    grid: list[list[float]],
+    required_platforms: list[str],
+    major_platforms: list[str],
+    current_platform: str,
+    blend: dict[str, float],
+    score_scale: str,
+    order_keys: list[tuple[Any, ...]],
+) -> tuple[list[list[float]], list[int]]:
+    """Score every case in one pass: weights (K, C) against scores (A, P, C)."""
+    shape = (len(alternatives), len(required_platforms), len(criteria))
+    scores = np.zeros(shape)
+    mask = np.zeros(shape)
+    for a, alternative in enumerate(alternatives):
+        for p, platform in enumerate(required_platforms):
+            platform_scores = alternative["scores"].get(platform) or {}
+            for c, criterion in enumerate(criteria):
+                raw = platform_scores.get(criterion["id"])
+                if raw is not None:
+                    scores[a, p, c] = _to_percent_score(raw, score_scale, criterion["id"])
+                    mask[a, p, c] = 1.0
+
+    weights = np.asarray(grid)
+    numerator = np.einsum("kc,apc->kap", weights, scores * mask)
+    covered = np.einsum("kc,apc->kap", weights, mask)
+    weighted = np.divide(numerator, covered, out=np.zeros_like(numerator), where=covered > 0)
+
+    column = {platform: index for index, platform in enumerate(required_platforms)}
+    major = weighted[:, :, [column[p] for p in major_platforms]].sum(axis=2) / len(major_platforms)
+    current = weighted[:, :, column[current_platform]]
+    overall = blend["major_platform_average"] * major + blend["current_platform"] * current
+
+    # Same order as _evaluate's ranking; np.lexsort treats the last key as primary.
+    names = sorted({key[3] for key in order_keys})
+    static = np.array(
+        [
+            [names.index(key[3]) for key in order_keys],
+            [key[2] for key in order_keys],
+            [key[1] for key in order_keys],
+        ]
+    )
+    feasibility = np.array([key[0] for key in order_keys])
+    cases = weights.shape[0]
+    keys = [np.broadcast_to(row, (cases, len(alternatives))) for row in static]
+    keys += [
+        -np.round(major, 2),
+        -np.round(current, 2),
+        -np.round(overall, 2),
+        np.broadcast_to(feasibility, (cases, len(alternatives))),
+    ]
+    winners = np.lexsort(keys, axis=-1)[:, 0]
+    return overall.tolist(), winners.tolist()
+
+
+def _sensitivity(
+    data: dict[str, Any],
+    *,
+    factors: list[float],
+    stability_threshold: float,
+    allow_unconfirmed: bool,
+    allow_single_option: bool,
+) -> dict[str, Any]:
+    """Re-rank alternatives with each criterion weight scaled by each factor.
+
+    Every case renormalizes the weights and re-ranks all alternatives with the
+    same tie-breaks as the scorer; the outcome is unstable when the winner
+    changes in more than ``stability_threshold`` of the cases.
+    """
+    if not 0 <= stability_threshold <= 1:
+        raise ValueError("stability_threshold must be between 0 and 1")
+
+    result = _evaluate(
+        data,
+        allow_unconfirmed=allow_unconfirmed,
+        allow_single_option=allow_single_option,
+    )
+    criteria = result["criteria"]
+    alternatives = _normalize_alternatives(
+        data.get("alternatives"), allow_single_option=allow_single_option
+    )
+    major_platforms = result["major_platforms"]
+    current_platform = result["current_platform"]
+    required_platforms = sorted(set(major_platforms + [current_platform]))
+    order_keys = [
+        (
+            not alternative["feasible"],
+            _effort_rank(alternative["effort"]),
+            _risk_rank(alternative["risk"]),
+            alternative["name"].lower(),
+        )
+        for alternative in alternatives
+    ]
+
+    grid = _weight_grid(criteria, factors)
+    args = (
+        alternatives,
+        criteria,
+        grid,
+        required_platforms,
+        major_platforms,
+        current_platform,
+        result["weights"],
+        result["score_scale"],
+        order_keys,
+    )
+    try:
+        import numpy
+    except ImportError:
+        overall, winners = _sensitivity_python(*args)
+    else:
+        overall, winners = _sensitivity_numpy(numpy, *args)
+
+    ids = [alternative["id"] for alternative in alternatives]
+    position = {alt_id: index for index, alt_id in enumerate(ids)}
+    display = [position[item["id"]] for item in result["ranked_alternatives"]]
+
+    def _scores(row: list[float]) -> dict[str, float]:
+        return {ids[index]: round(row[index], 4) for index in display}
+
+    base_winner = ids[winners[0]]
+    cases = []
+    case_index = 1
+    for criterion in criteria:
+        for factor in factors:
+            winner = ids[winners[case_index]]
+            cases.append(
+                {
+                    "criterion": criterion["id"],
+                    "factor": factor,
+                    "winner": winner,
+                    "winner_changed": winner != base_winner,
+                    "scores": _scores(overall[case_index]),
+                }
+            )
+            case_index += 1
+
+    changed = sum(1 for case in cases if case["winner_changed"])
+    change_rate = changed / len(cases)
+    return {
+        "base_winner": base_winner,
+        "base_scores": _scores(overall[0]),
+        "cases_tested": len(cases),
+        "winner_changed_cases": changed,
+        "winner_change_rate": round(change_rate, 4),
+        "stability_threshold": stability_threshold,
+        "is_stable": change_rate <= stability_threshold,
+        "cases": cases,
+    }
+
+
 def _markdown_report(result: dict[str, Any]) -> str:
     lines = []
     lines.append(f"# Hybrid Decision Analysis: {result['decision']}")
@@ -601,32 +842,90 @@ def _markdown_report(result: dict[str, Any]) -> str:
     return "\n".join(lines) + "\n"
 
 
-def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Score alternatives with hybrid guardrails.")
-    parser.add_argument("--input", required=True, help="Path to input JSON")
-    parser.add_argument("--output", help="Path to markdown report output")
-    parser.add_argument("--json-output", help="Path to JSON report output")
+def _add_simulation_flags(parser: argparse.ArgumentParser, default: Any = False) -> None:
+    # Subcommands pass default=argparse.SUPPRESS so that their copies do not
+    # reset flags already given before the subcommand name.
     parser.add_argument(
         "--allow-unconfirmed",
         action="store_true",
+        default=default,
         help="Allow scoring when criteria_confirmed is false (simulation only).",
     )
     parser.add_argument(
         "--allow-single-option",
         action="store_true",
+        default=default,
         help="Allow scoring one alternative (simulation only).",
     )
-    return parser.parse_args()
 
 
-def main() -> int:
-    args = parse_args()
-    input_path = Path(args.input)
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Score alternatives with hybrid guardrails.")
+    parser.add_argument("--input", help="Path to input JSON")
+    parser.add_argument("--output", help="Path to markdown report output")
+    parser.add_argument("--json-output", help="Path to JSON report output")
+    _add_simulation_flags(parser)
+
+    subparsers = parser.add_subparsers(dest="command")
+    sensitivity = subparsers.add_parser(
+        "sensitivity",
+        help="Perturb criterion weights and report winner stability (hybrid-sensitivity.v1).",
+    )
+    sensitivity.add_argument("--input", required=True, help="Path to input JSON")
+    sensitivity.add_argument("--output", help="Path to sensitivity JSON output (default: stdout)")
+    sensitivity.add_argument(
+        "--factors",
+        default=",".join(str(factor) for factor in DEFAULT_SENSITIVITY_FACTORS),
+        help="Weight multipliers: comma list (0.9,1.1) or start:stop:count grid (0.5:1.5:101).",
+    )
+    sensitivity.add_argument(
+        "--stability-threshold",
+        type=float,
+        default=DEFAULT_STABILITY_THRESHOLD,
+        help="Largest winner change rate still reported as stable.",
+    )
+    _add_simulation_flags(sensitivity, default=argparse.SUPPRESS)
+
+    args = parser.parse_args(argv)
+    if args.command is None and not args.input:
+        parser.error("the following arguments are required: --input")
+    return args
+
+
+def _load_input(path: str) -> dict[str, Any]:
+    input_path = Path(path)
     if not input_path.exists():
         raise SystemExit(f"Input file not found: {input_path}")
 
     with input_path.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
+        return json.load(handle)
+
+
+def _run_sensitivity(args: argparse.Namespace) -> int:
+    data = _load_input(args.input)
+    report = _sensitivity(
+        data,
+        factors=_parse_factors(args.factors),
+        stability_threshold=args.stability_threshold,
+        allow_unconfirmed=args.allow_unconfirmed,
+        allow_single_option=args.allow_single_option,
+    )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+def main() -> int:
+    args = parse_args()
+    if args.command == "sensitivity":
+        return _run_sensitivity(args)
+
+    data = _load_input(args.input)
 
     result = _evaluate(
         data,
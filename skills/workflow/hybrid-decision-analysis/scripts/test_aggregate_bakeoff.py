@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Regression tests for bakeoff aggregation."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any
+
+
+SCRIPT = Path(__file__).with_name("aggregate_bakeoff.py")
+ASSETS = Path(__file__).resolve().parent.parent / "assets"
+
+
+def _run(*paths: Path, extra_args: list[str] | None = None) -> tuple[subprocess.CompletedProcess[str], dict[str, Any] | None]:
+    cmd = ["python3", str(SCRIPT), *(str(path) for path in paths), *(extra_args or [])]
+    proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    if proc.returncode != 0:
+        return proc, None
+    return proc, json.loads(proc.stdout)
+
+
+class AggregateBakeoffTests(unittest.TestCase):
+    def test_reproduces_executed_aggregate(self) -> None:
+        proc, result = _run(ASSETS / "bakeoff-results.v1.executed.json")
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        expected = json.loads(
+            (ASSETS / "bakeoff-aggregate.v1.executed.json").read_text(encoding="utf-8")
+        )
+        self.assertEqual(result, expected)
+
+    def test_streams_jsonl_and_documents_together(self) -> None:
+        source = json.loads(
+            (ASSETS / "bakeoff-results.v1.executed.json").read_text(encoding="utf-8")
+        )
+        header = {key: value for key, value in source.items() if key != "runs"}
+        first, rest = source["runs"][:4], source["runs"][4:]
+        for run in first:
+            run.pop("total")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            jsonl_path = tmp_path / "part-1.jsonl"
+            jsonl_path.write_text(
+                "\n".join(json.dumps(record) for record in [header, *first]) + "\n",
+                encoding="utf-8",
+            )
+            document_path = tmp_path / "part-2.json"
+            document_path.write_text(json.dumps({**header, "runs": rest}), encoding="utf-8")
+
+            proc, result = _run(jsonl_path, document_path)
+            self.assertEqual(proc.returncode, 0, proc.stderr)
+            _, expected = _run(ASSETS / "bakeoff-results.v1.executed.json")
+            self.assertEqual(result, expected)
+
+            proc, result = _run(jsonl_path, jsonl_path)
+            self.assertNotEqual(proc.returncode, 0)
+            self.assertIn("duplicate run", proc.stderr)
+
+    def test_conflicting_run_ids_need_override(self) -> None:
+        runs = [{"scenario": "S1", "option": "a", "scores": {"fit": 3}}]
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            one = tmp_path / "one.json"
+            two = tmp_path / "two.json"
+            one.write_text(json.dumps({"fixture_id": "f", "run_id": "r1", "runs": runs}))
+            two.write_text(
+                json.dumps(
+                    {
+                        "fixture_id": "f",
+                        "run_id": "r2",
+                        "runs": [{"scenario": "S2", "option": "a", "scores": {"fit": 5}}],
+                    }
+                )
+            )
+
+            proc, result = _run(one, two)
+            self.assertNotEqual(proc.returncode, 0)
+            self.assertIsNone(result)
+
+            proc, result = _run(one, two, extra_args=["--run-id", "merged"])
+            self.assertEqual(proc.returncode, 0, proc.stderr)
+            assert result is not None
+            self.assertEqual(result["run_id"], "merged")
+            self.assertEqual(result["summary"][0]["avg_total"], 4.0)
+            self.assertEqual(result["summary"][0]["stdev"], 1.0)
+            self.assertEqual(result["summary"][0]["scenario_totals"], [3, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,6 +15,7 @@ SCRIPT = Path(__file__).with_name("score_with_guardrails.py")
 VALIDATOR = Path(__file__).with_name("validate_json_contract.mjs")
 INPUT_SCHEMA = Path(__file__).resolve().parent.parent / "references" / "input.schema.json"
 OUTPUT_SCHEMA = Path(__file__).resolve().parent.parent / "references" / "output.schema.json"
+ASSETS = Path(__file__).resolve().parent.parent / "assets"
 
 
 def _run(input_data: dict[str, Any], extra_args: list[str] | None = None) -> tuple[subprocess.CompletedProcess[str], dict[str, Any] | None]:
@@ -44,6 +45,34 @@ def _run(input_data: dict[str, Any], extra_args: list[str] | None = None) -> tup
         return proc, result
 
 
+def _run_sensitivity(
+    input_data: dict[str, Any],
+    extra_args: list[str] | None = None,
+    global_args: list[str] | None = None,
+) -> tuple[subprocess.CompletedProcess[str], dict[str, Any] | None]:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        input_path = tmp_path / "input.json"
+        output_path = tmp_path / "sensitivity.json"
+        input_path.write_text(json.dumps(input_data), encoding="utf-8")
+
+        cmd = [
+            "python3",
+            str(SCRIPT),
+            *(global_args or []),
+            "sensitivity",
+            "--input",
+            str(input_path),
+            "--output",
+            str(output_path),
+            *(extra_args or []),
+        ]
+        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        if proc.returncode != 0:
+            return proc, None
+        return proc, json.loads(output_path.read_text(encoding="utf-8"))
+
+
 def _base_input() -> dict[str, Any]:
     return {
         "decision": "test",
@@ -395,6 +424,77 @@ class GuardrailScoreTests(unittest.TestCase):
             )
             self.assertEqual(out_proc.returncode, 0, out_proc.stderr)
 
+    def test_sensitivity_reproduces_bakeoff_artifact(self) -> None:
+        data = json.loads((ASSETS / "hybrid-final-analysis-input.v1.json").read_text(encoding="utf-8"))
+        data["criteria_confirmed"] = True
+        data["discovery"] = _base_input()["discovery"]
+        for alternative in data["alternatives"]:
+            alternative.update(type="internal", effort="M", risk="Med", justification="fixture")
+
+        proc, result = _run_sensitivity(data)
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        expected = json.loads((ASSETS / "hybrid-sensitivity.v1.json").read_text(encoding="utf-8"))
+        self.assertEqual(result, expected)
+
+    def test_sensitivity_accepts_simulation_flags_on_either_side(self) -> None:
+        data = json.loads((ASSETS / "hybrid-final-analysis-input.v1.json").read_text(encoding="utf-8"))
+        data["criteria_confirmed"] = False
+        data["discovery"] = _base_input()["discovery"]
+        for alternative in data["alternatives"]:
+            alternative.update(type="internal", effort="M", risk="Med", justification="fixture")
+
+        proc, _ = _run_sensitivity(data)
+        self.assertNotEqual(proc.returncode, 0)
+        self.assertIn("criteria_confirmed", proc.stderr)
+
+        proc, result = _run_sensitivity(data, global_args=["--allow-unconfirmed"])
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        self.assertIsNotNone(result)
+
+        proc, result = _run_sensitivity(data, ["--allow-unconfirmed"])
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        self.assertIsNotNone(result)
+
+    def test_sensitivity_flags_unstable_winner(self) -> None:
+        data = _base_input()
+        data["alternatives"] = [
+            {
+                "id": "fit-first",
+                "name": "Fit First",
+                "type": "internal",
+                "effort": "S",
+                "risk": "Low",
+                "feasible": True,
+                "justification": "strong fit",
+                "scores": {"chatgpt": {"fit": 90, "risk": 70}},
+            },
+            {
+                "id": "risk-first",
+                "name": "Risk First",
+                "type": "internal",
+                "effort": "S",
+                "risk": "Low",
+                "feasible": True,
+                "justification": "strong risk",
+                "scores": {"chatgpt": {"fit": 70, "risk": 89}},
+            },
+        ]
+
+        proc, result = _run_sensitivity(data, ["--factors", "0.5:1.5:5"])
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        assert result is not None
+        self.assertEqual(result["base_winner"], "fit-first")
+        self.assertEqual(result["cases_tested"], 10)
+        self.assertEqual(result["winner_changed_cases"], 4)
+        self.assertEqual(result["winner_change_rate"], 0.4)
+        self.assertFalse(result["is_stable"])
+        changed = [(case["criterion"], case["factor"]) for case in result["cases"] if case["winner_changed"]]
+        self.assertEqual(changed, [("fit", 0.5), ("fit", 0.75), ("risk", 1.25), ("risk", 1.5)])
+
+        proc, result = _run_sensitivity(data, ["--factors", "0.9,0"])
+        self.assertNotEqual(proc.returncode, 0)
+        self.assertIsNone(result)
+
 
 if __name__ == "__main__":
     unittest.main()
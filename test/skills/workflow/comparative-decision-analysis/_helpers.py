@@ -0,0 +1,91 @@
+"""Shared input builders for the comparative decision regression tests."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import Any
+
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+
+
+def _base_input() -> dict[str, Any]:
+    return {
+        "decision": "test",
+        "criteria_confirmed": True,
+        "criteria_confirmation_source": "user-confirmed",
+        "current_platform": "chatgpt",
+        "major_platforms": ["chatgpt"],
+        "score_scale": "0-100",
+        "criteria": [
+            {
+                "id": "fit",
+                "name": "Fit",
+                "weight": 1,
+                "metric": "fit metric",
+                "data_source": "source",
+                "scoring_rule": "0-100",
+            },
+            {
+                "id": "risk",
+                "name": "Risk",
+                "weight": 1,
+                "metric": "risk metric",
+                "data_source": "source",
+                "scoring_rule": "0-100",
+            },
+        ],
+        "alternatives": [],
+        "independent_evaluations": [],
+    }
+
+
+def _independent_records(*alternative_ids: str) -> list[dict[str, Any]]:
+    records = []
+    for alt_id in alternative_ids:
+        records.append(
+            {
+                "alternative_id": alt_id,
+                "evaluator_id": f"eval-{alt_id}",
+                "isolation_confirmed": True,
+                "summary": f"Independent evaluation for {alt_id}",
+            }
+        )
+    return records
+
+
+def _random_input(count: int, seed: int) -> dict[str, Any]:
+    rng = random.Random(seed)
+    data = _base_input()
+    data["major_platforms"] = ["chatgpt", "claude", "gemini"]
+    data["current_platform"] = "claude"
+    data["score_scale"] = "1-5"
+    data["criteria"] = [
+        {**data["criteria"][0], "id": f"c{index}", "weight": rng.randint(1, 9)}
+        for index in range(5)
+    ]
+    data["alternatives"] = [
+        {
+            "id": f"alt-{index}",
+            "name": f"Alt {index}",
+            "effort": rng.choice(["S", "M", "L"]),
+            "risk": rng.choice(["Low", "Med", "High"]),
+            "feasible": rng.random() > 0.1,
+            "justification": "generated",
+            "scores": {
+                platform: {
+                    criterion["id"]: (
+                        None if rng.random() < 0.2 else round(rng.uniform(0.5, 5.5), 2)
+                    )
+                    for criterion in data["criteria"]
+                }
+                for platform in ("chatgpt", "claude", "gemini")
+            },
+        }
+        for index in range(count)
+    ]
+    data["independent_evaluations"] = _independent_records(
+        *(alternative["id"] for alternative in data["alternatives"])
+    )
+    return data
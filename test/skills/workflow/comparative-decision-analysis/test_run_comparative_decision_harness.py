@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Regression tests for the comparative decision harness."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any
+
+from _helpers import REPO_ROOT, _random_input
+
+
+HARNESS = (
+    REPO_ROOT
+    / "skills/workflow/comparative-decision-analysis/scripts/run_comparative_decision_harness.py"
+)
+
+
+def _harness(
+    input_data: dict[str, Any], output_dir: Path, extra_args: list[str] | None = None
+) -> tuple[subprocess.CompletedProcess[str], dict[str, Any]]:
+    input_path = output_dir.parent / "input.json"
+    input_path.write_text(json.dumps(input_data), encoding="utf-8")
+    proc = subprocess.run(
+        [
+            "python3",
+            str(HARNESS),
+            "--input",
+            str(input_path),
+            "--output-dir",
+            str(output_dir),
+            "--run-id",
+            "run-test",
+            *(extra_args or []),
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    manifest = json.loads((output_dir / "run-test.manifest.json").read_text(encoding="utf-8"))
+    return proc, manifest
+
+
+def _artifacts(output_dir: Path) -> tuple[str, str]:
+    return (
+        (output_dir / "run-test.analysis-report.md").read_text(encoding="utf-8"),
+        (output_dir / "run-test.analysis-result.json").read_text(encoding="utf-8"),
+    )
+
+
+class HarnessTests(unittest.TestCase):
+    def test_in_process_matches_subprocess(self) -> None:
+        data = _random_input(6, seed=3)
+        with tempfile.TemporaryDirectory() as tmp:
+            in_process_dir = Path(tmp) / "in-process"
+            proc, manifest = _harness(data, in_process_dir, ["--no-cache"])
+            self.assertEqual(proc.returncode, 0, proc.stderr)
+            self.assertEqual(manifest["execution"], "in-process")
+
+            subprocess_dir = Path(tmp) / "subprocess"
+            proc, manifest = _harness(data, subprocess_dir, ["--no-cache", "--subprocess"])
+            self.assertEqual(proc.returncode, 0, proc.stderr)
+            self.assertEqual(manifest["execution"], "subprocess")
+
+            self.assertEqual(_artifacts(in_process_dir), _artifacts(subprocess_dir))
+
+    def test_identical_rerun_is_served_from_cache(self) -> None:
+        data = _random_input(6, seed=4)
+        with tempfile.TemporaryDirectory() as tmp:
+            output_dir = Path(tmp) / "out"
+            proc, first = _harness(data, output_dir)
+            self.assertEqual(proc.returncode, 0, proc.stderr)
+            self.assertFalse(first["cache"]["hit"])
+            artifacts = _artifacts(output_dir)
+
+            proc, second = _harness(data, output_dir)
+            self.assertEqual(proc.returncode, 0, proc.stderr)
+            self.assertTrue(second["cache"]["hit"])
+            self.assertEqual(second["execution"], "cache")
+            self.assertEqual(second["cache"]["key"], first["cache"]["key"])
+            self.assertEqual(second["cache"]["source_generated_at_utc"], first["generated_at_utc"])
+            self.assertEqual(_artifacts(output_dir), artifacts)
+
+            proc, third = _harness(data, output_dir, ["--allow-single-option"])
+            self.assertEqual(proc.returncode, 0, proc.stderr)
+            self.assertFalse(third["cache"]["hit"])
+
+    def test_failures_are_recorded_and_not_cached(self) -> None:
+        data = _random_input(2, seed=5)
+        data["criteria_confirmed"] = False
+        with tempfile.TemporaryDirectory() as tmp:
+            output_dir = Path(tmp) / "out"
+            for _ in range(2):
+                proc, manifest = _harness(data, output_dir)
+                self.assertNotEqual(proc.returncode, 0)
+                self.assertEqual(manifest["exit_code"], 1)
+                self.assertFalse(manifest["cache"]["hit"])
+                self.assertIn("criteria_confirmed must be true", manifest["stderr"])
+
+    def test_unexpected_scorer_errors_write_failure_manifest(self) -> None:
+        data = _random_input(2, seed=6)
+        data["alternatives"][0]["scores"]["chatgpt"]["c0"] = 10**400
+        with tempfile.TemporaryDirectory() as tmp:
+            proc, manifest = _harness(data, Path(tmp) / "out")
+            self.assertEqual(proc.returncode, 1)
+            self.assertNotIn("Traceback", proc.stderr)
+            self.assertEqual(manifest["exit_code"], 1)
+            self.assertIn("OverflowError", manifest["stderr"])
+
+
+if __name__ == "__main__":
+    unittest.main()
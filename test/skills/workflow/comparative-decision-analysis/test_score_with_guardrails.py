@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import importlib.util
 import json
 import subprocess
 import tempfile
@@ -10,12 +11,14 @@ import unittest
 from pathlib import Path
 from typing import Any
 
+from _helpers import REPO_ROOT, _base_input, _independent_records, _random_input
+
 
-REPO_ROOT = Path(__file__).resolve().parents[4]
 SCRIPT = (
     REPO_ROOT
     / "skills/workflow/comparative-decision-analysis/scripts/score_with_guardrails.py"
 )
+SIMULATE_SCRIPT = SCRIPT.with_name("simulate_rank_stability.py")
 
 
 def _run(input_data: dict[str, Any], extra_args: list[str] | None = None) -> tuple[subprocess.CompletedProcess[str], dict[str, Any] | None]:
@@ -45,49 +48,17 @@ def _run(input_data: dict[str, Any], extra_args: list[str] | None = None) -> tup
         return proc, result
 
 
-def _base_input() -> dict[str, Any]:
-    return {
-        "decision": "test",
-        "criteria_confirmed": True,
-        "criteria_confirmation_source": "user-confirmed",
-        "current_platform": "chatgpt",
-        "major_platforms": ["chatgpt"],
-        "score_scale": "0-100",
-        "criteria": [
-            {
-                "id": "fit",
-                "name": "Fit",
-                "weight": 1,
-                "metric": "fit metric",
-                "data_source": "source",
-                "scoring_rule": "0-100",
-            },
-            {
-                "id": "risk",
-                "name": "Risk",
-                "weight": 1,
-                "metric": "risk metric",
-                "data_source": "source",
-                "scoring_rule": "0-100",
-            },
-        ],
-        "alternatives": [],
-        "independent_evaluations": [],
-    }
-
-
-def _independent_records(*alternative_ids: str) -> list[dict[str, Any]]:
-    records = []
-    for alt_id in alternative_ids:
-        records.append(
-            {
-                "alternative_id": alt_id,
-                "evaluator_id": f"eval-{alt_id}",
-                "isolation_confirmed": True,
-                "summary": f"Independent evaluation for {alt_id}",
-            }
+def _simulate(input_data: dict[str, Any], extra_args: list[str]) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = Path(tmp) / "input.json"
+        input_path.write_text(json.dumps(input_data), encoding="utf-8")
+        proc = subprocess.run(
+            ["python3", str(SIMULATE_SCRIPT), "--input", str(input_path), *extra_args],
+            capture_output=True,
+            text=True,
+            check=True,
         )
-    return records
+        return json.loads(proc.stdout)
 
 
 class GuardrailScoreTests(unittest.TestCase):
@@ -310,6 +281,75 @@ class GuardrailScoreTests(unittest.TestCase):
         assert result is not None
         self.assertEqual(result["independent_evaluations"], [])
 
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "numpy not installed")
+    def test_numpy_engine_matches_python_engine(self) -> None:
+        data = _random_input(300, seed=7)
+
+        proc, python_result = _run(data, ["--engine", "python"])
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        proc, numpy_result = _run(data, ["--engine", "numpy"])
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        self.assertEqual(numpy_result, python_result)
+
+        data["alternatives"][5]["scores"]["gemini"]["c2"] = "n/a"
+        proc, result = _run(data, ["--engine", "numpy"])
+        self.assertNotEqual(proc.returncode, 0)
+        self.assertIn("alternatives[alt-5].scores.gemini.c2", proc.stderr)
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "numpy not installed")
+    def test_noise_free_simulation_matches_recommendation(self) -> None:
+        cases = {
+            "select": ({"chatgpt": 95, "claude": 95}, {"chatgpt": 70, "claude": 70}),
+            "compose": ({"chatgpt": 85, "claude": 85}, {"chatgpt": 83, "claude": 83}),
+            "improve": ({"chatgpt": 75, "claude": 75}, {"chatgpt": 60, "claude": 60}),
+            "extend": ({"chatgpt": 60, "claude": 90}, {"chatgpt": 30, "claude": 30}),
+            "build-new": ({"chatgpt": 30, "claude": 30}, {"chatgpt": 20, "claude": 20}),
+        }
+        for action, (first, second) in cases.items():
+            data = _base_input()
+            data["major_platforms"] = ["claude"]
+            data["alternatives"] = [
+                {
+                    "id": alt_id,
+                    "name": alt_id.upper(),
+                    "effort": "S",
+                    "risk": "Low",
+                    "feasible": True,
+                    "justification": "baseline",
+                    "scores": {
+                        platform: {"fit": score, "risk": score}
+                        for platform, score in scores.items()
+                    },
+                }
+                for alt_id, scores in (("a", first), ("b", second))
+            ]
+            data["independent_evaluations"] = _independent_records("a", "b")
+
+            proc, result = _run(data)
+            self.assertEqual(proc.returncode, 0, proc.stderr)
+            assert result is not None
+            self.assertEqual(result["recommendation"]["action"], action)
+
+            simulated = _simulate(
+                data,
+                ["--draws", "500", "--score-noise", "0", "--weight-concentration", "0"],
+            )
+            self.assertEqual(simulated["base_action"], action)
+            self.assertEqual(simulated["action_probability"][action], 1.0)
+            self.assertEqual(simulated["rank_first_probability"]["a"], 1.0)
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "numpy not installed")
+    def test_simulation_is_seeded_independent_of_workers(self) -> None:
+        data = _random_input(8, seed=11)
+        args = ["--draws", "70000", "--seed", "5"]
+
+        serial = _simulate(data, [*args, "--workers", "1"])
+        parallel = _simulate(data, [*args, "--workers", "2"])
+        self.assertEqual(serial, parallel)
+        self.assertAlmostEqual(sum(serial["rank_first_probability"].values()), 1.0, places=5)
+        self.assertAlmostEqual(sum(serial["action_probability"].values()), 1.0, places=5)
+        self.assertNotEqual(_simulate(data, [*args, "--seed", "6"]), serial)
+
 
 if __name__ == "__main__":
     unittest.main()